@@ -0,0 +1,87 @@
+"""
+Decision Store Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for DecisionStore buffering, batched flushes and index
+rebuild.
+"""
+
+import json
+
+from sdd.agents.quality.decision_store import INDEX_FILENAME, DecisionStore
+from sdd.agents.quality.models import VerificationDecision
+
+TASK_A = "550e8400-e29b-41d4-a716-446655440000"
+TASK_B = "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+
+
+def _decision(score: float) -> VerificationDecision:
+    sufficient = score >= 0.8
+    return VerificationDecision(
+        decision="sufficient" if sufficient else "insufficient",
+        quality_score=score,
+        dimension_scores={"completeness": score},
+        feedback=[] if sufficient else ["Improve completeness"],
+        violations=[],
+        passed_checks=["completeness"] if sufficient else []
+    )
+
+
+def _store(tmp_path) -> DecisionStore:
+    # Long interval and large buffer: only explicit flushes write
+    return DecisionStore(decisions_dir=str(tmp_path), flush_interval=3600, max_buffered=1000)
+
+
+def test_buffered_decisions_are_visible_before_flush(tmp_path):
+    store = _store(tmp_path)
+    try:
+        store.record(TASK_A, _decision(0.5))
+        store.record(TASK_A, _decision(0.7))
+
+        assert store.pending_count() == 2
+        assert not store.task_file(TASK_A).exists()
+        assert store.latest(TASK_A).quality_score == 0.7
+    finally:
+        store.close()
+
+
+def test_flush_appends_one_line_per_decision(tmp_path):
+    store = _store(tmp_path)
+    try:
+        for score in (0.5, 0.7, 0.9):
+            store.record(TASK_A, _decision(score))
+        store.record(TASK_B, _decision(0.6))
+        store.flush()
+
+        assert store.pending_count() == 0
+        assert store.stats()['file_writes'] == 2
+        lines = store.task_file(TASK_A).read_text().splitlines()
+        assert [json.loads(line)['decision']['quality_score'] for line in lines] == [0.5, 0.7, 0.9]
+        # Served from the index now that the buffer is empty
+        assert store.latest(TASK_A).quality_score == 0.9
+        assert [d.quality_score for d in store.history(TASK_A)] == [0.5, 0.7, 0.9]
+    finally:
+        store.close()
+
+
+def test_close_flushes_and_reindex_restores_latest(tmp_path):
+    store = _store(tmp_path)
+    store.record(TASK_A, _decision(0.5))
+    store.record(TASK_A, _decision(0.9))
+    store.record(TASK_B, _decision(0.6))
+    store.close()
+
+    (tmp_path / INDEX_FILENAME).unlink()
+    reopened = _store(tmp_path)
+    try:
+        assert reopened.latest(TASK_A) is None
+        assert reopened.rebuild_index() == 2
+
+        latest = {row['task_id']: row for row in reopened.latest_decisions()}
+        assert latest[TASK_A]['quality_score'] == 0.9
+        assert latest[TASK_A]['decisions'] == 2
+        assert latest[TASK_B]['decision'] == "insufficient"
+        assert [r['task_id'] for r in reopened.latest_decisions(decision="sufficient")] == [TASK_A]
+        assert reopened.latest(TASK_A).quality_score == 0.9
+    finally:
+        reopened.close()
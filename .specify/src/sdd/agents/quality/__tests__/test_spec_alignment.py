@@ -0,0 +1,71 @@
+"""
+Spec Alignment Scoring Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Tests for the selectable spec alignment scoring versions of
+VerificationAgent and their effect on the verification cache key.
+"""
+
+import pytest
+
+from sdd.agents.quality.spec_cache import SpecCache, term_vector
+from sdd.agents.quality.verifier import (
+    SCORING_COSINE,
+    SCORING_KEYWORDS,
+    SCORING_VERSION,
+    VerificationAgent,
+)
+from sdd.refinement.verification_cache import VerificationCache
+
+SPEC = "# Spec\nThe user calls the API to store records in the database.\n"
+ARTIFACT = "# Plan\nExpose an API endpoint for the user; no storage yet.\n"
+
+
+def _agent(tmp_path, **kwargs) -> VerificationAgent:
+    return VerificationAgent(
+        config_path=str(tmp_path / "missing.conf"),
+        decisions_dir=str(tmp_path / "decisions"),
+        spec_cache=SpecCache(),
+        persist_decisions=False,
+        **kwargs
+    )
+
+
+@pytest.fixture
+def spec_path(tmp_path) -> str:
+    path = tmp_path / "spec.md"
+    path.write_text(SPEC)
+    return str(path)
+
+
+def test_default_is_keyword_scoring(tmp_path, spec_path):
+    agent = _agent(tmp_path)
+    assert SCORING_VERSION == SCORING_KEYWORDS
+    assert agent.scoring_version == SCORING_KEYWORDS
+    # "user" and "api" of the six key terms are in both documents
+    assert agent._evaluate_spec_alignment(ARTIFACT, spec_path) == pytest.approx(0.5 + 2 / 6)
+
+
+def test_cosine_scoring_is_selectable(tmp_path, spec_path):
+    agent = _agent(tmp_path, scoring_version=SCORING_COSINE)
+    spec = agent.spec_cache.get(spec_path)
+    similarity = spec.similarity(term_vector(ARTIFACT))
+
+    assert 0.0 < similarity < 0.5
+    assert agent._evaluate_spec_alignment(ARTIFACT, spec_path) == pytest.approx(0.5 + similarity)
+
+
+def test_unknown_scoring_version_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        _agent(tmp_path, scoring_version=99)
+
+
+def test_cache_key_depends_on_scoring_version(tmp_path, spec_path):
+    cache = VerificationCache(cache_dir=str(tmp_path / "cache"))
+    thresholds = {"spec_alignment": 0.8}
+    keys = {
+        version: cache.make_key(spec_path, "planning", thresholds, spec_path, scoring_version=version)
+        for version in (SCORING_KEYWORDS, SCORING_COSINE)
+    }
+    assert keys[SCORING_KEYWORDS] != keys[SCORING_COSINE]
+    assert cache.make_key(spec_path, "planning", thresholds, spec_path) == keys[SCORING_VERSION]
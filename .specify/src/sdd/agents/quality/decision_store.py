@@ -0,0 +1,545 @@
+"""
+Decision Store - Buffered JSONL Persistence of Verification Decisions
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    VerificationAgent used to write one JSON file synchronously at the end of
+    every verify call. DecisionStore buffers decisions in memory and a
+    background thread appends them in batches (one write per task per flush)
+    to per-task JSONL logs, so batch verification is not bound by file I/O.
+    A SQLite index keeps the latest decision per task, so "latest decision
+    of every task" is a single query instead of a directory scan.
+
+Constitutional Compliance:
+    - Principle I: Library-First - DecisionStore is standalone library
+    - Principle IV: Idempotent Operations - Logs are append-only;
+      rebuild_index() is repeatable
+    - Principle VII: Observability - Full decision history per task; write
+      and flush counters
+
+Modes:
+    decisions_dir given   Buffered appends, flushed every flush_interval
+                          seconds, when max_buffered decisions are pending,
+                          and on flush()/close() (registered with atexit)
+    decisions_dir=None    No persistence (benchmarks): latest decision per
+                          task kept in memory only
+
+Storage:
+    Decisions stored at: .docs/agents/quality/verifier/decisions/{task_id}.jsonl
+    Index stored at: .docs/agents/quality/verifier/decisions/index.db
+
+Usage:
+    from sdd.agents.quality.decision_store import DecisionStore
+
+    store = DecisionStore(decisions_dir="/tmp/decisions")
+    store.record(task_id, verification_decision)
+    store.latest(task_id)                         # VerificationDecision
+    store.latest_decisions(decision="insufficient")
+    store.close()  # flush (also registered with atexit)
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sdd.agents.quality.models import VerificationDecision
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BUFFERED = 256
+
+INDEX_FILENAME = "index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS latest_decisions (
+    task_id TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    recorded_at TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    quality_score REAL NOT NULL,
+    decisions INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_latest_decision ON latest_decisions (decision, recorded_at);
+"""
+
+_UPSERT = (
+    "INSERT INTO latest_decisions (task_id, offset, length, recorded_at, decision, "
+    "quality_score, decisions) VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(task_id) DO UPDATE SET offset = excluded.offset, "
+    "length = excluded.length, recorded_at = excluded.recorded_at, "
+    "decision = excluded.decision, quality_score = excluded.quality_score, "
+    "decisions = latest_decisions.decisions + excluded.decisions"
+)
+
+
+def _summary(task_id: str, record: Dict[str, Any], decisions: int) -> Dict[str, Any]:
+    """Index-style summary of a decision record."""
+    return {
+        'task_id': task_id,
+        'recorded_at': record['recorded_at'],
+        'decision': record['decision']['decision'],
+        'quality_score': record['decision']['quality_score'],
+        'decisions': decisions
+    }
+
+
+class DecisionStore:
+    """
+    Buffered, batched persistence of VerificationDecisions.
+
+    Attributes:
+        decisions_dir: Directory for per-task logs and index (None = no persistence)
+        flush_interval: Seconds between background flushes
+        max_buffered: Pending decisions that trigger an early flush
+        recorded: Decisions recorded
+        persisted: Decisions written to disk
+        flushes: Non-empty flushes
+        file_writes: Log appends (one per task per flush)
+    """
+
+    def __init__(
+        self,
+        decisions_dir: Optional[str] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffered: int = DEFAULT_MAX_BUFFERED
+    ):
+        """
+        Initialize Decision Store (starts the flusher when persisting).
+
+        Args:
+            decisions_dir: Directory for logs and index (None = keep in memory only)
+            flush_interval: Seconds between background flushes
+            max_buffered: Pending decisions that trigger an early flush
+        """
+        self.decisions_dir = Path(decisions_dir) if decisions_dir else None
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.recorded = 0
+        self.persisted = 0
+        self.flushes = 0
+        self.file_writes = 0
+
+        self._buffer: List[Tuple[str, Dict[str, Any]]] = []
+        # Latest unflushed record per task (every task's latest when not persisting)
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._counts: Dict[str, int] = {}
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()  # one flush at a time, in buffer order
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._thread: Optional[threading.Thread] = None
+
+        if self.decisions_dir is None:
+            logger.info("DecisionStore initialized: persistence disabled")
+            return
+
+        self.decisions_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.decisions_dir / INDEX_FILENAME), check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Performance: decisions are appended in batches on a background thread,
+        # off the verifier's critical path
+        self._thread = threading.Thread(
+            target=self._run, name="decision-store", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+        logger.info(f"DecisionStore initialized: decisions_dir={self.decisions_dir}")
+
+    @property
+    def persistent(self) -> bool:
+        """Decisions are written to disk."""
+        return self.decisions_dir is not None
+
+    def task_file(self, task_id: str) -> Path:
+        """
+        Decision log of a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Path to {task_id}.jsonl
+
+        Raises:
+            RuntimeError: If persistence is disabled
+        """
+        if self.decisions_dir is None:
+            raise RuntimeError("DecisionStore persistence is disabled")
+        return self.decisions_dir / f"{task_id}.jsonl"
+
+    # ---------------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------------
+
+    def record(self, task_id: str, decision: VerificationDecision) -> None:
+        """
+        Record a decision (buffered; written on the next flush).
+
+        Args:
+            task_id: Task identifier
+            decision: Verification decision
+
+        Raises:
+            RuntimeError: If the store is closed or a background flush failed
+        """
+        self._raise_if_failed()
+        record = {
+            'task_id': task_id,
+            'recorded_at': datetime.now().isoformat(),
+            'decision': decision.model_dump(mode='json')
+        }
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("DecisionStore is closed")
+            self.recorded += 1
+            self._latest[task_id] = record
+            if not self.persistent:
+                self._counts[task_id] = self._counts.get(task_id, 0) + 1
+                return
+            self._buffer.append((task_id, record))
+            if len(self._buffer) >= self.max_buffered:
+                self._condition.notify()
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Write all buffered decisions now.
+
+        Args:
+            fsync: fsync written logs, the index and the directory
+
+        Raises:
+            RuntimeError: If a background flush failed
+        """
+        if not self.persistent:
+            return
+
+        with self._write_lock:
+            with self._condition:
+                records, self._buffer = self._buffer, []
+            written: List[Path] = []
+            if records:
+                try:
+                    written = self._write_batch(records)
+                finally:
+                    # Written records are read back through the index from now on
+                    with self._condition:
+                        unwritten = {id(record) for _, record in self._buffer}
+                        for task_id, record in records:
+                            if id(record) not in unwritten and self._latest.get(task_id) is record:
+                                del self._latest[task_id]
+            if fsync:
+                for path in written:
+                    _fsync_path(path)
+                _fsync_path(self.decisions_dir / INDEX_FILENAME)
+                _fsync_path(self.decisions_dir)
+
+        self._raise_if_failed()
+
+    def pending_count(self) -> int:
+        """Number of decisions waiting to be written."""
+        with self._condition:
+            return len(self._buffer)
+
+    def close(self) -> None:
+        """Flush buffered decisions and stop the flusher (idempotent)."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self.flush(fsync=True)
+            atexit.unregister(self.close)
+            with self._write_lock:
+                self._conn.close()
+        logger.info(
+            f"DecisionStore closed: recorded={self.recorded}, persisted={self.persisted}, "
+            f"flushes={self.flushes}, file_writes={self.file_writes}"
+        )
+
+    # ---------------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------------
+
+    def latest(self, task_id: str) -> Optional[VerificationDecision]:
+        """
+        Latest decision of a task (buffered decisions included).
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            VerificationDecision, or None if the task has no decision
+        """
+        with self._condition:
+            record = self._latest.get(task_id)
+        if record is not None:
+            return VerificationDecision(**record['decision'])
+        if not self.persistent:
+            return None
+
+        with self._write_lock:
+            row = self._conn.execute(
+                "SELECT offset, length FROM latest_decisions WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        record = self._read_record(task_id, row["offset"], row["length"])
+        return VerificationDecision(**record['decision']) if record is not None else None
+
+    def latest_decisions(
+        self,
+        decision: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Latest decision of every task, from the index (newest first).
+
+        Args:
+            decision: Only tasks whose latest decision is this ("sufficient"/"insufficient")
+            limit: Maximum rows
+
+        Returns:
+            List of {'task_id', 'recorded_at', 'decision', 'quality_score', 'decisions'}
+        """
+        if not self.persistent:
+            with self._condition:
+                rows = [
+                    _summary(task_id, record, self._counts[task_id])
+                    for task_id, record in self._latest.items()
+                ]
+            if decision is not None:
+                rows = [r for r in rows if r['decision'] == decision]
+            rows.sort(key=lambda r: r['recorded_at'], reverse=True)
+            return rows[:limit] if limit is not None else rows
+
+        self.flush()
+        sql = (
+            "SELECT task_id, recorded_at, decision, quality_score, decisions "
+            "FROM latest_decisions"
+        )
+        params: List[Any] = []
+        if decision is not None:
+            sql += " WHERE decision = ?"
+            params.append(decision)
+        sql += " ORDER BY recorded_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._write_lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def history(self, task_id: str) -> List[VerificationDecision]:
+        """
+        All decisions of a task, oldest first (buffered decisions included).
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            List of VerificationDecisions
+        """
+        if not self.persistent:
+            latest = self.latest(task_id)
+            return [latest] if latest is not None else []
+
+        self.flush()
+        task_file = self.task_file(task_id)
+        if not task_file.exists():
+            return []
+        with open(task_file, 'r') as f:
+            return [
+                VerificationDecision(**json.loads(line)['decision'])
+                for line in f if line.strip()
+            ]
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the latest-decision index from the task logs.
+
+        Returns:
+            Number of tasks indexed
+        """
+        if not self.persistent:
+            return 0
+
+        self.flush()
+        rows = []
+        for task_file in sorted(self.decisions_dir.glob("*.jsonl")):
+            offset = last_offset = last_length = count = 0
+            last_line = None
+            with open(task_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        last_offset, last_length, last_line = offset, len(line), line
+                        count += 1
+                    offset += len(line)
+            if last_line is None:
+                continue
+            record = json.loads(last_line)
+            rows.append((
+                task_file.stem, last_offset, last_length, record['recorded_at'],
+                record['decision']['decision'], record['decision']['quality_score'], count
+            ))
+
+        with self._write_lock, self._conn:
+            self._conn.execute("DELETE FROM latest_decisions")
+            self._conn.executemany(_UPSERT, rows)
+
+        logger.info(f"Decision index rebuilt: {len(rows)} tasks")
+        return len(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get write counters.
+
+        Returns:
+            Dictionary with recorded, persisted, pending, flushes and file_writes
+        """
+        with self._condition:
+            return {
+                'recorded': self.recorded,
+                'persisted': self.persisted,
+                'pending': len(self._buffer),
+                'flushes': self.flushes,
+                'file_writes': self.file_writes
+            }
+
+    # ---------------------------------------------------------------
+    # Writing
+    # ---------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Flush periodically (or when the buffer fills) until closed."""
+        while True:
+            with self._condition:
+                if not self._closed and len(self._buffer) < self.max_buffered:
+                    self._condition.wait(timeout=self.flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except BaseException as e:
+                logger.error(f"Background decision flush failed: {e!r}")
+                self._error = e
+
+    def _write_batch(self, records: List[Tuple[str, Dict[str, Any]]]) -> List[Path]:
+        """
+        Append records (one write per task) and update the index (caller holds write lock).
+
+        Records of tasks not written when an error occurs are returned to the
+        buffer before the error propagates.
+
+        Args:
+            records: (task_id, record) in recording order
+
+        Returns:
+            Log files written
+        """
+        by_task: Dict[str, List[Dict[str, Any]]] = {}
+        for task_id, record in records:
+            by_task.setdefault(task_id, []).append(record)
+
+        rows = []
+        written: List[Path] = []
+        try:
+            for task_id, task_records in by_task.items():
+                lines = [
+                    json.dumps(record, separators=(',', ':'), default=str).encode('utf-8') + b"\n"
+                    for record in task_records
+                ]
+                task_file = self.task_file(task_id)
+                with open(task_file, 'ab') as f:
+                    f.write(b"".join(lines))
+                    end = f.tell()
+                written.append(task_file)
+
+                latest = task_records[-1]
+                rows.append((
+                    task_id, end - len(lines[-1]), len(lines[-1]), latest['recorded_at'],
+                    latest['decision']['decision'], latest['decision']['quality_score'],
+                    len(task_records)
+                ))
+        except BaseException:
+            written_tasks = {row[0] for row in rows}
+            unwritten = [(t, r) for t, r in records if t not in written_tasks]
+            with self._condition:
+                self._buffer[:0] = unwritten
+            raise
+        finally:
+            if rows:
+                with self._conn:
+                    self._conn.executemany(_UPSERT, rows)
+                persisted = sum(row[-1] for row in rows)
+                with self._condition:
+                    self.persisted += persisted
+                    self.flushes += 1
+                    self.file_writes += len(rows)
+
+        logger.debug(f"Decisions flushed: {len(records)} decisions, {len(rows)} tasks")
+        return written
+
+    def _read_record(self, task_id: str, offset: int, length: int) -> Optional[Dict[str, Any]]:
+        """Read the indexed record; fall back to the log's last line if the offset is stale."""
+        task_file = self.task_file(task_id)
+        try:
+            with open(task_file, 'rb') as f:
+                f.seek(offset)
+                record = json.loads(f.read(length))
+            if record.get('task_id') == task_id:
+                return record
+        except (OSError, ValueError):
+            pass
+
+        # Index out of step with the log (e.g., another process appended): scan this task only
+        logger.warning(f"Stale decision index entry for task_id={task_id}; reading log")
+        if not task_file.exists():
+            return None
+        last_line = None
+        with open(task_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    last_line = line
+        return json.loads(last_line) if last_line is not None else None
+
+    def _raise_if_failed(self) -> None:
+        """Re-raise a background flush failure in the caller's thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Background decision flush failed: {error!r}") from error
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file (or directory entry table) to stable storage (missing paths ignored)."""
+    if not path.exists():
+        return
+    flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) if path.is_dir() else os.O_RDONLY
+    fd = os.open(str(path), flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -59,6 +59,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sdd.agents.shared.models import AgentInput, AgentOutput
+from sdd.validation.constitutional import ConstitutionalValidator
 
 # Configure structured logging
 logging.basicConfig(
@@ -81,12 +82,14 @@ class FinalizerAgent:
         agent_id: Agent identifier (quality.finalizer)
         constitution_path: Path to constitution.md
         reports_dir: Directory for storing compliance reports
+        validator: ConstitutionalValidator for diff-scoped checks (created on first use)
     """
 
     def __init__(
         self,
         constitution_path: str = "/workspaces/sdd-agentic-framework/.specify/memory/constitution.md",
-        reports_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/quality/finalizer/reports"
+        reports_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/quality/finalizer/reports",
+        validator: Optional[ConstitutionalValidator] = None
     ):
         """
         Initialize Compliance Finalizer Agent.
@@ -94,11 +97,15 @@ class FinalizerAgent:
         Args:
             constitution_path: Path to constitution.md
             reports_dir: Directory for compliance reports
+            validator: Optional ConstitutionalValidator instance.
+                      If None, one is created (reports under reports_dir/constitutional)
+                      the first time a diff is validated.
         """
         self.agent_id = "quality.finalizer"
         self.constitution_path = Path(constitution_path)
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.validator = validator
 
         # Load constitutional principles
         self.principles = self._load_principles()
@@ -356,12 +363,19 @@ class FinalizerAgent:
         """
         Check for constitutional principle violations.
 
+        When artifact_paths carries a change set ("diff": unified diff text,
+        or "base_ref": git ref, with optional "repo_root"), only the changed
+        lines are validated and violations cite their diff line.
+
         Args:
             artifact_paths: Paths to artifacts
 
         Returns:
             List of violations
         """
+        if artifact_paths.get("diff") is not None or artifact_paths.get("base_ref"):
+            return self._check_diff_violations(artifact_paths)
+
         violations = []
         code_files = artifact_paths.get("code_files", [])
 
@@ -387,6 +401,37 @@ class FinalizerAgent:
 
         return violations
 
+    def _check_diff_violations(self, artifact_paths: Dict) -> List[str]:
+        """
+        Validate a change set with the diff-scoped constitutional validator.
+
+        Args:
+            artifact_paths: Paths to artifacts with "diff" or "base_ref"
+                (code_files, when given, limit the files checked)
+
+        Returns:
+            List of violations ("principle: description (path:line)")
+        """
+        if self.validator is None:
+            self.validator = ConstitutionalValidator(
+                constitution_path=str(self.constitution_path),
+                report_dir=str(self.reports_dir / "constitutional"),
+                # validate_diff reads neither cache nor history
+                use_validation_cache=False,
+                use_history=False
+            )
+
+        report = self.validator.validate_diff(
+            diff_text=artifact_paths.get("diff"),
+            base_ref=artifact_paths.get("base_ref"),
+            repo_root=artifact_paths.get("repo_root", "."),
+            paths=artifact_paths.get("code_files") or None
+        )
+        return [
+            f"{v['principle']}: {v['description']} ({v['location']})"
+            for v in report['violations']
+        ]
+
     def _check_documentation_sync(self, artifact_paths: Dict) -> List[str]:
         """
         Check for documentation synchronization issues.
@@ -30,12 +30,11 @@ Usage:
     # Serialize to JSON
     json_data = decision.model_dump()
 
-    # Save to file
-    import json
-    from pathlib import Path
-    decision_file = Path(".docs/agents/quality/verifier/decisions/task-123.json")
-    decision_file.parent.mkdir(parents=True, exist_ok=True)
-    decision_file.write_text(json.dumps(json_data, indent=2))
+    # Persist (appended to .docs/agents/quality/verifier/decisions/{task_id}.jsonl)
+    from sdd.agents.quality.decision_store import DecisionStore
+    store = DecisionStore(decisions_dir=".docs/agents/quality/verifier/decisions")
+    store.record(task_id, decision)
+    store.close()
 """
 
 from enum import Enum
@@ -90,7 +89,8 @@ class VerificationDecision(BaseModel):
         Immutable once created (frozen=True for audit trail)
 
     Storage:
-        Stored in .docs/agents/quality/verifier/decisions/{task_id}.json
+        Appended to .docs/agents/quality/verifier/decisions/{task_id}.jsonl
+        (one line per decision; see DecisionStore)
 
     Example:
         >>> decision = VerificationDecision(
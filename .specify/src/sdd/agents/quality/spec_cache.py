@@ -0,0 +1,241 @@
+"""
+Spec Cache - Lowercased Specs and Term Vectors for Spec Alignment
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    VerificationAgent scores spec alignment on every verification, and a
+    refinement loop verifies the same artifact (against the same spec) up to
+    20 times. SpecCache reads each spec once per version (path, mtime, size)
+    and keeps its lowercased text plus a precomputed term-frequency vector,
+    so alignment is a cosine similarity costing O(artifact length) per call.
+
+Constitutional Compliance:
+    - Principle I: Library-First - SpecCache is standalone library
+    - Principle IV: Idempotent Operations - Same spec version yields same vector
+    - Principle VII: Observability - Hits/misses counted
+
+Term Vectors:
+    Terms are lowercase alphanumeric words of 3+ characters (snake_case and
+    paths split into words), minus common English stopwords. Weights are
+    sublinear (1 + ln tf), so repeated boilerplate does not dominate.
+
+Usage:
+    from sdd.agents.quality.spec_cache import get_default_spec_cache, term_vector
+
+    spec = get_default_spec_cache().get("/path/to/spec.md")
+    if spec is not None:
+        similarity = spec.similarity(term_vector(artifact_content))
+"""
+
+import logging
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_ENTRIES = 64
+
+_TERM = re.compile(r"[a-z][a-z0-9]{2,}")
+
+STOPWORDS = frozenset({
+    "about", "after", "all", "also", "and", "any", "are", "been", "before", "being",
+    "but", "can", "could", "did", "does", "done", "each", "for", "from", "get", "has",
+    "have", "how", "into", "its", "may", "more", "most", "must", "new", "not", "one",
+    "only", "other", "our", "out", "over", "per", "set", "should", "some", "such",
+    "than", "that", "the", "their", "them", "then", "there", "these", "they", "this",
+    "those", "two", "under", "use", "used", "using", "via", "was", "were", "what",
+    "when", "where", "which", "who", "why", "will", "with", "would", "you", "your"
+})
+
+
+# ===================================================================
+# Term Vectors
+# ===================================================================
+
+class TermVector:
+    """
+    Sparse sublinear term-frequency vector.
+
+    Attributes:
+        weights: Term -> 1 + ln(term frequency)
+        norm: Euclidean norm of weights
+    """
+
+    def __init__(self, weights: Dict[str, float]):
+        self.weights = weights
+        self.norm = math.sqrt(sum(w * w for w in weights.values()))
+
+    def cosine(self, other: "TermVector") -> float:
+        """
+        Cosine similarity (0.0 to 1.0; 0.0 if either vector is empty).
+
+        Args:
+            other: Vector to compare with
+
+        Returns:
+            Similarity
+        """
+        if not self.norm or not other.norm:
+            return 0.0
+        small, large = self.weights, other.weights
+        if len(small) > len(large):
+            small, large = large, small
+        dot = sum(weight * large.get(term, 0.0) for term, weight in small.items())
+        return dot / (self.norm * other.norm)
+
+
+def term_vector(text: str) -> TermVector:
+    """
+    Term vector of a text (lowercased here; O(len(text))).
+
+    Args:
+        text: Any text (spec, plan, code)
+
+    Returns:
+        TermVector
+    """
+    counts = Counter(
+        term for term in _TERM.findall(text.lower()) if term not in STOPWORDS
+    )
+    return TermVector({term: 1.0 + math.log(n) for term, n in counts.items()})
+
+
+# ===================================================================
+# SpecCache
+# ===================================================================
+
+class SpecEntry:
+    """
+    One version of a specification.
+
+    Attributes:
+        path: Spec path
+        version: (mtime_ns, size) the entry was read at
+        text: Lowercased spec text
+        vector: Term vector of the spec
+    """
+
+    def __init__(self, path: str, version: Tuple[int, int], text: str):
+        self.path = path
+        self.version = version
+        self.text = text
+        self.vector = term_vector(text)
+
+    def similarity(self, vector: TermVector) -> float:
+        """Cosine similarity of an artifact's term vector with the spec."""
+        return self.vector.cosine(vector)
+
+
+class SpecCache:
+    """
+    Specs keyed by path, reloaded when mtime or size changes.
+
+    Attributes:
+        max_entries: Specs kept (least recently used evicted)
+        hits: Lookups served from cache
+        misses: Lookups that read the spec (first read or changed)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize Spec Cache.
+
+        Args:
+            max_entries: Specs kept in memory
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, SpecEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, spec_path: str) -> Optional[SpecEntry]:
+        """
+        Get the current version of a spec.
+
+        Args:
+            spec_path: Path to specification file
+
+        Returns:
+            SpecEntry, or None if the spec does not exist
+        """
+        try:
+            stat = Path(spec_path).stat()
+        except OSError:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(spec_path)
+            if entry is not None and entry.version == version:
+                self.hits += 1
+                self._entries.move_to_end(spec_path)
+                return entry
+            self.misses += 1
+
+        try:
+            text = Path(spec_path).read_text().lower()
+        except OSError as e:
+            logger.warning(f"Spec unreadable: {spec_path}: {e}")
+            return None
+        entry = SpecEntry(spec_path, version, text)
+
+        with self._lock:
+            self._entries[spec_path] = entry
+            self._entries.move_to_end(spec_path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug(f"Spec loaded: {spec_path} ({len(entry.vector.weights)} terms)")
+        return entry
+
+    def invalidate(self, spec_path: Optional[str] = None) -> None:
+        """
+        Drop one spec (or all) from the cache.
+
+        Args:
+            spec_path: Spec to drop (None = all)
+        """
+        with self._lock:
+            if spec_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(spec_path, None)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get hit/miss counts.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries)
+            }
+
+
+_default_spec_cache: Optional[SpecCache] = None
+_default_spec_cache_lock = threading.Lock()
+
+
+def get_default_spec_cache() -> SpecCache:
+    """Process-wide spec cache shared by verifier instances."""
+    global _default_spec_cache
+    with _default_spec_cache_lock:
+        if _default_spec_cache is None:
+            _default_spec_cache = SpecCache()
+        return _default_spec_cache
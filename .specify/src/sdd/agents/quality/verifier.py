@@ -39,16 +39,26 @@ Usage:
     )
     result = agent.verify(agent_input)
     print(result.output_data)  # VerificationDecision
+
+    # Verify a batch concurrently (results in input order; each spec read once)
+    results = agent.verify_many([agent_input, other_input], max_workers=4)
+
+    # Decisions are buffered and appended to decisions_dir/{task_id}.jsonl
+    agent.decision_store.latest(agent_input.task_id)
+    agent.close()  # flush pending decisions (also done at exit)
 """
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from sdd.agents.quality.decision_store import DecisionStore
 from sdd.agents.quality.models import DecisionType, VerificationDecision
+from sdd.agents.quality.spec_cache import SpecCache, SpecEntry, get_default_spec_cache, term_vector
 from sdd.agents.shared.models import AgentInput, AgentOutput
+from sdd.validation.python_analysis import PythonAnalyzer, PythonFacts, get_default_analyzer
 
 # Configure structured logging
 logging.basicConfig(
@@ -58,6 +68,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on verify_many worker threads when max_workers is not given
+DEFAULT_BATCH_WORKERS = 8
+
+# Spec alignment score when no spec is available
+DEFAULT_SPEC_ALIGNMENT = 0.90
+
+# Spec alignment scoring versions (part of the verification cache key, so
+# decisions from one version are not reused by another)
+SCORING_KEYWORDS = 1  # shared fixed keywords
+SCORING_COSINE = 2    # cosine similarity of term vectors
+SCORING_VERSIONS = (SCORING_KEYWORDS, SCORING_COSINE)
+
+# Default scoring; cosine stays opt-in until its decisions are checked
+# against keyword scoring on recorded artifacts
+SCORING_VERSION = SCORING_KEYWORDS
+
+# Keyword scoring: share of these terms found in both spec and artifact, + 0.5
+SPEC_KEY_TERMS = ("user", "authentication", "api", "database", "test", "feature")
+
+# Cosine scoring: score = SPEC_ALIGNMENT_FLOOR at cosine similarity 0, rising
+# linearly to 1.0 at ALIGNED_SIMILARITY (a spec and its own plan typically
+# score 0.5-0.7; unrelated documents 0.2-0.4)
+SPEC_ALIGNMENT_FLOOR = 0.5
+ALIGNED_SIMILARITY = 0.5
+
+
 class VerificationAgent:
     """
     Verification Agent for quality gate decisions.
@@ -69,12 +105,21 @@ class VerificationAgent:
         agent_id: Agent identifier (quality.verifier)
         config_path: Path to refinement.conf configuration
         decisions_dir: Directory for storing decision logs
+        decision_store: Buffered decision persistence (per-task JSONL + latest index)
+        python_analyzer: AST fact sheets for Python code/test artifacts
+        spec_cache: Lowercased specs and term vectors, keyed by path and mtime
+        scoring_version: Spec alignment scoring (SCORING_KEYWORDS or SCORING_COSINE)
     """
 
     def __init__(
         self,
         config_path: str = "/workspaces/sdd-agentic-framework/.specify/config/refinement.conf",
-        decisions_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/quality/verifier/decisions"
+        decisions_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/quality/verifier/decisions",
+        python_analyzer: Optional[PythonAnalyzer] = None,
+        spec_cache: Optional[SpecCache] = None,
+        decision_store: Optional[DecisionStore] = None,
+        persist_decisions: bool = True,
+        scoring_version: int = SCORING_VERSION
     ):
         """
         Initialize Verification Agent.
@@ -82,11 +127,39 @@ class VerificationAgent:
         Args:
             config_path: Path to refinement.conf
             decisions_dir: Directory for decision logs
+            python_analyzer: Optional PythonAnalyzer instance.
+                            If None, uses the process-wide default analyzer
+                            (shared with ConstitutionalValidator).
+            spec_cache: Optional SpecCache instance.
+                       If None, uses the process-wide default spec cache.
+            decision_store: Optional DecisionStore instance.
+                           If None, uses DecisionStore(decisions_dir).
+            persist_decisions: Set False to keep decisions in memory only
+                              (benchmarks).
+            scoring_version: Spec alignment scoring: SCORING_KEYWORDS
+                            (default) or SCORING_COSINE.
+
+        Raises:
+            ValueError: If scoring_version is unknown
         """
+        if scoring_version not in SCORING_VERSIONS:
+            raise ValueError(
+                f"scoring_version must be one of {SCORING_VERSIONS}, got: {scoring_version}"
+            )
+
         self.agent_id = "quality.verifier"
         self.config_path = Path(config_path)
         self.decisions_dir = Path(decisions_dir)
         self.decisions_dir.mkdir(parents=True, exist_ok=True)
+        self.python_analyzer = python_analyzer or get_default_analyzer()
+        self.spec_cache = spec_cache or get_default_spec_cache()
+        self.scoring_version = scoring_version
+        if decision_store is not None:
+            self.decision_store = decision_store
+        else:
+            self.decision_store = DecisionStore(
+                decisions_dir=str(self.decisions_dir) if persist_decisions else None
+            )
 
         # Load configuration
         self.config = self._load_config()
@@ -148,7 +221,81 @@ class VerificationAgent:
             ValueError: If required input fields missing
             FileNotFoundError: If artifact_path doesn't exist
         """
-        # Validate and convert input if needed
+        return self._verify_input(self._coerce_input(agent_input))
+
+    def verify_many(
+        self,
+        agent_inputs: List[Union[AgentInput, Dict[str, Any]]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify a batch of artifacts concurrently.
+
+        Each distinct spec is looked up once for the whole batch. A failing item
+        (invalid input, missing artifact, evaluation error) yields a failed
+        AgentOutput in its slot instead of aborting the batch.
+
+        Args:
+            agent_inputs: Inputs as accepted by verify()
+            max_workers: Worker threads (default: min(DEFAULT_BATCH_WORKERS, batch size))
+
+        Returns:
+            AgentOutput dicts in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(agent_inputs)
+        inputs: List[Optional[AgentInput]] = []
+        for index, item in enumerate(agent_inputs):
+            try:
+                inputs.append(self._coerce_input(item))
+            except Exception as e:
+                logger.error(f"Invalid verification input at index {index}: {e}")
+                inputs.append(None)
+                task_id = item.get("task_id", "unknown") if isinstance(item, dict) else "unknown"
+                results[index] = self._error_output(task_id, e)
+
+        specs: Dict[str, Optional[SpecEntry]] = {}
+        for agent_input in inputs:
+            spec_path = agent_input.context.spec_path if agent_input is not None else None
+            if spec_path and spec_path not in specs:
+                specs[spec_path] = self.spec_cache.get(spec_path)
+
+        pending = {i: agent_input for i, agent_input in enumerate(inputs) if agent_input is not None}
+        if pending:
+            workers = max_workers or min(DEFAULT_BATCH_WORKERS, len(pending))
+            # Performance: artifact reads and decision writes overlap across threads;
+            # specs shared by the batch are read once up front
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify") as executor:
+                futures = {
+                    index: executor.submit(self._verify_input, agent_input, specs)
+                    for index, agent_input in pending.items()
+                }
+                for index, future in futures.items():
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Verification failed at index {index}: {e}", exc_info=True)
+                        results[index] = self._error_output(pending[index].task_id, e)
+
+        logger.info(
+            f"Batch verification complete: {len(agent_inputs)} artifacts, "
+            f"{len(specs)} specs, "
+            f"{sum(1 for r in results if r['success'])} succeeded"
+        )
+        return results
+
+    def _coerce_input(self, agent_input: Union[AgentInput, Dict[str, Any]]) -> AgentInput:
+        """
+        Convert a dict (flat or structured) to AgentInput.
+
+        Args:
+            agent_input: AgentInput or dict
+
+        Returns:
+            AgentInput
+
+        Raises:
+            ValueError: If the input does not validate
+        """
         if isinstance(agent_input, dict):
             # Restructure flat dict to AgentInput format if needed
             if "input_data" not in agent_input:
@@ -167,7 +314,23 @@ class VerificationAgent:
                 agent_input = AgentInput(**structured_input)
             else:
                 agent_input = AgentInput(**agent_input)
+        return agent_input
+
+    def _verify_input(
+        self,
+        agent_input: AgentInput,
+        specs: Optional[Dict[str, Optional[SpecEntry]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify one validated input (shared by verify and verify_many).
 
+        Args:
+            agent_input: Validated agent input
+            specs: Spec entry per spec path, looked up once per batch
+
+        Returns:
+            AgentOutput dict (success=False on error)
+        """
         logger.info(f"Starting verification for task_id: {agent_input.task_id}")
 
         try:
@@ -186,12 +349,19 @@ class VerificationAgent:
             # Read artifact content
             artifact_content = artifact_file.read_text()
 
+            # Parse Python code/tests once; dimension checks read the fact sheet
+            python_facts = None
+            if artifact_type in ["code", "tests"] and artifact_file.suffix == ".py":
+                python_facts = self.python_analyzer.analyze(artifact_content)
+
             # Evaluate quality dimensions
             dimension_scores = self._evaluate_dimensions(
                 artifact_content=artifact_content,
                 artifact_type=artifact_type,
                 context=agent_input.context,
-                thresholds=quality_thresholds
+                thresholds=quality_thresholds,
+                python_facts=python_facts,
+                specs=specs
             )
 
             # Calculate overall quality score
@@ -243,25 +413,45 @@ class VerificationAgent:
 
         except Exception as e:
             logger.error(f"Verification failed: {str(e)}", exc_info=True)
-            error_output = AgentOutput(
-                agent_id=self.agent_id,
-                task_id=agent_input.task_id,
-                success=False,
-                output_data={"error": str(e)},
-                reasoning=f"Verification failed: {str(e)}",
-                confidence=0.0,
-                next_actions=["Fix error and retry verification"],
-                metadata={},
-                timestamp=datetime.now()
-            )
-            return error_output.model_dump(mode='json')
+            return self._error_output(agent_input.task_id, e)
+
+    def _error_output(self, task_id: str, error: Exception) -> Dict[str, Any]:
+        """
+        Build a failed AgentOutput dict.
+
+        Args:
+            task_id: Task identifier (may be invalid when the input itself failed)
+            error: Exception raised
+
+        Returns:
+            AgentOutput dict with success=False
+        """
+        fields = {
+            "agent_id": self.agent_id,
+            "task_id": task_id,
+            "success": False,
+            "output_data": {"error": str(error)},
+            "reasoning": f"Verification failed: {str(error)}",
+            "confidence": 0.0,
+            "next_actions": ["Fix error and retry verification"],
+            "metadata": {},
+            "timestamp": datetime.now()
+        }
+        try:
+            error_output = AgentOutput(**fields)
+        except ValueError:
+            # Invalid task_id in the input being reported: skip validation
+            error_output = AgentOutput.model_construct(**fields)
+        return error_output.model_dump(mode='json')
 
     def _evaluate_dimensions(
         self,
         artifact_content: str,
         artifact_type: str,
         context: "AgentContext",
-        thresholds: Dict[str, float]
+        thresholds: Dict[str, float],
+        python_facts: Optional[PythonFacts] = None,
+        specs: Optional[Dict[str, Optional[SpecEntry]]] = None
     ) -> Dict[str, float]:
         """
         Evaluate quality across all dimensions.
@@ -271,6 +461,8 @@ class VerificationAgent:
             artifact_type: Type (spec, plan, code, tests)
             context: Agent context with spec/plan paths
             thresholds: Quality thresholds per dimension
+            python_facts: AST fact sheet of a Python artifact (None = text heuristics)
+            specs: Spec entry per spec path (None = look up in the spec cache)
 
         Returns:
             Dictionary of dimension scores (0.0 to 1.0)
@@ -278,7 +470,9 @@ class VerificationAgent:
         scores = {}
 
         # Completeness: Check for required sections
-        scores["completeness"] = self._evaluate_completeness(artifact_content, artifact_type)
+        scores["completeness"] = self._evaluate_completeness(
+            artifact_content, artifact_type, python_facts
+        )
 
         # Constitutional Compliance: Check adherence to 14 principles
         scores["constitutional_compliance"] = self._evaluate_constitutional_compliance(
@@ -286,22 +480,30 @@ class VerificationAgent:
         )
 
         # Test Coverage: Only applicable for implementation phase
-        scores["test_coverage"] = self._evaluate_test_coverage(artifact_content, artifact_type)
+        scores["test_coverage"] = self._evaluate_test_coverage(
+            artifact_content, artifact_type, python_facts
+        )
 
         # Spec Alignment: Check alignment with specification
         scores["spec_alignment"] = self._evaluate_spec_alignment(
-            artifact_content, context.spec_path
+            artifact_content, context.spec_path, specs
         )
 
         return scores
 
-    def _evaluate_completeness(self, content: str, artifact_type: str) -> float:
+    def _evaluate_completeness(
+        self,
+        content: str,
+        artifact_type: str,
+        python_facts: Optional[PythonFacts] = None
+    ) -> float:
         """
         Evaluate completeness based on required sections.
 
         Args:
             content: Artifact content
             artifact_type: Type of artifact
+            python_facts: AST fact sheet (code/tests sections read from the parse)
 
         Returns:
             Completeness score (0.0 to 1.0)
@@ -318,6 +520,19 @@ class VerificationAgent:
         if not sections:
             return 1.0  # Unknown type, assume complete
 
+        if python_facts is not None:
+            if artifact_type == "code":
+                present = [
+                    python_facts.has_functions, python_facts.has_classes, python_facts.has_imports
+                ]
+            else:
+                present = [
+                    python_facts.has_test_functions,
+                    python_facts.assert_count > 0,
+                    "pytest" in python_facts.imports
+                ]
+            return sum(present) / len(present)
+
         found = sum(1 for section in sections if section in content)
         return found / len(sections)
 
@@ -355,13 +570,19 @@ class VerificationAgent:
 
         return sum(compliance_checks) / len(compliance_checks)
 
-    def _evaluate_test_coverage(self, content: str, artifact_type: str) -> float:
+    def _evaluate_test_coverage(
+        self,
+        content: str,
+        artifact_type: str,
+        python_facts: Optional[PythonFacts] = None
+    ) -> float:
         """
         Evaluate test coverage (simulated for now).
 
         Args:
             content: Artifact content
             artifact_type: Type of artifact
+            python_facts: AST fact sheet (functions counted from the parse)
 
         Returns:
             Coverage score (0.0 to 1.0)
@@ -371,8 +592,12 @@ class VerificationAgent:
             return 1.0
 
         # Simple heuristic: count test functions vs total functions
-        test_count = content.count("def test_")
-        function_count = content.count("def ")
+        if python_facts is not None:
+            test_count = len(python_facts.test_functions)
+            function_count = len(python_facts.functions)
+        else:
+            test_count = content.count("def test_")
+            function_count = content.count("def ")
 
         if function_count == 0:
             return 0.0
@@ -382,36 +607,49 @@ class VerificationAgent:
             return 0.85
         return 0.0
 
-    def _evaluate_spec_alignment(self, content: str, spec_path: str | None) -> float:
+    def _evaluate_spec_alignment(
+        self,
+        content: str,
+        spec_path: str | None,
+        specs: Optional[Dict[str, Optional[SpecEntry]]] = None
+    ) -> float:
         """
         Evaluate alignment with specification.
 
+        SCORING_KEYWORDS: share of SPEC_KEY_TERMS present in both spec and
+        artifact, plus 0.5 (capped at 1.0).
+        SCORING_COSINE: cosine similarity of the artifact's term vector with
+        the spec's cached vector, mapped from SPEC_ALIGNMENT_FLOOR at no
+        shared terms to 1.0 at ALIGNED_SIMILARITY or above.
+
         Args:
             content: Artifact content
             spec_path: Path to specification file
+            specs: Spec entry per spec path (looked up once per batch)
 
         Returns:
             Alignment score (0.0 to 1.0)
         """
         if not spec_path:
-            return 0.90  # Default if no spec available
-
-        spec_file = Path(spec_path)
-        if not spec_file.exists():
-            return 0.90  # Default if spec not found
-
-        # Simple heuristic: check for shared keywords
-        spec_content = spec_file.read_text().lower()
-        content_lower = content.lower()
-
-        # Extract key terms from spec
-        key_terms = ["user", "authentication", "api", "database", "test", "feature"]
-        matching_terms = sum(1 for term in key_terms if term in spec_content and term in content_lower)
+            return DEFAULT_SPEC_ALIGNMENT  # Default if no spec available
 
-        if len(key_terms) == 0:
-            return 1.0
+        if specs is not None and spec_path in specs:
+            spec = specs[spec_path]
+        else:
+            spec = self.spec_cache.get(spec_path)
+        if spec is None:
+            return DEFAULT_SPEC_ALIGNMENT  # Default if spec not found
+
+        if self.scoring_version == SCORING_KEYWORDS:
+            content_lower = content.lower()
+            matching_terms = sum(
+                1 for term in SPEC_KEY_TERMS if term in spec.text and term in content_lower
+            )
+            return min(1.0, matching_terms / len(SPEC_KEY_TERMS) + 0.5)
 
-        return min(1.0, matching_terms / len(key_terms) + 0.5)
+        similarity = spec.similarity(term_vector(content))
+        alignment = SPEC_ALIGNMENT_FLOOR + (1.0 - SPEC_ALIGNMENT_FLOOR) * similarity / ALIGNED_SIMILARITY
+        return min(1.0, alignment)
 
     def _calculate_quality_score(self, dimension_scores: Dict[str, float]) -> float:
         """
@@ -556,16 +794,15 @@ class VerificationAgent:
 
     def _persist_decision(self, task_id: str, decision: VerificationDecision) -> None:
         """
-        Persist decision to JSON file for audit trail.
+        Record decision for audit trail (buffered; see DecisionStore).
 
         Args:
             task_id: Task identifier
             decision: Verification decision to persist
         """
-        decision_file = self.decisions_dir / f"{task_id}.json"
-        decision_data = decision.model_dump()
-
-        with open(decision_file, 'w') as f:
-            json.dump(decision_data, f, indent=2, default=str)
+        self.decision_store.record(task_id, decision)
+        logger.debug(f"Decision recorded: task_id={task_id}")
 
-        logger.info(f"Decision persisted: {decision_file}")
+    def close(self) -> None:
+        """Flush pending decisions and stop the decision store's flusher."""
+        self.decision_store.close()
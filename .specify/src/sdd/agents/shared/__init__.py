@@ -5,7 +5,12 @@ DS-STAR Multi-Agent Enhancement - Feature 001
 Provides standardized data models for agent communication.
 """
 
+from .durable_queue import DurableMessageQueue
 from .models import AgentConfig, AgentContext, AgentInput, AgentOutput, WorkflowPhase
+from .output_store import OutputStore
+from .persistent import PersistentList
+from .tracing import Span, Tracer
+from .workers import WorkerPool
 
 __all__ = [
     "AgentInput",
@@ -13,4 +18,10 @@ __all__ = [
     "AgentContext",
     "AgentConfig",
     "WorkflowPhase",
+    "PersistentList",
+    "OutputStore",
+    "Span",
+    "Tracer",
+    "WorkerPool",
+    "DurableMessageQueue",
 ]
@@ -0,0 +1,75 @@
+"""
+Channel Tracing Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for AgentChannel span and handoff audit records.
+"""
+
+import json
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from sdd.agents.shared.communication import AgentChannel
+from sdd.agents.shared.durable_queue import DurableMessageQueue
+from sdd.agents.shared.models import AgentContext, AgentInput, AgentOutput
+from sdd.agents.shared.tracing import (
+    SPAN_KIND_MESSAGE,
+    SPAN_KIND_PROCESSING,
+    SPAN_STATUS_ERROR,
+)
+
+AGENT_ID = "quality.verifier"
+
+
+def test_invalid_response_finishes_processing_span_with_error(tmp_path):
+    task_id = str(uuid.uuid4())
+    channel = AgentChannel(audit_dir=str(tmp_path))
+    channel.send(AgentInput(
+        agent_id=AGENT_ID,
+        task_id=task_id,
+        phase="planning",
+        input_data={},
+        context=AgentContext()
+    ))
+    channel.receive(AGENT_ID)
+
+    invalid = AgentOutput.model_construct(
+        agent_id=AGENT_ID, task_id=task_id, success=True, output_data={},
+        reasoning="done", confidence=2.0, next_actions=[]
+    )
+    with pytest.raises(ValidationError):
+        channel.respond(invalid)
+
+    [span] = [s for s in channel.tracer.get_trace(task_id) if s.kind == SPAN_KIND_PROCESSING]
+    assert span.end_time is not None
+    assert span.status == SPAN_STATUS_ERROR
+
+
+def test_handoff_audit_records_serialization_seconds(tmp_path):
+    channel = AgentChannel(audit_dir=str(tmp_path))
+    channel.handoff(AGENT_ID, "architecture.router", AgentContext(), reason="test")
+
+    [line] = (tmp_path / "handoffs.jsonl").read_text().splitlines()
+    assert json.loads(line)['serialization_seconds'] is not None
+
+
+def test_send_records_durable_commit_separately(tmp_path):
+    task_id = str(uuid.uuid4())
+    queue = DurableMessageQueue(db_path=str(tmp_path / "queue.db"))
+    channel = AgentChannel(audit_dir=str(tmp_path), durable_queue=queue)
+    channel.send(AgentInput(
+        agent_id=AGENT_ID,
+        task_id=task_id,
+        phase="planning",
+        input_data={},
+        context=AgentContext()
+    ))
+
+    [span] = [s for s in channel.tracer.get_trace(task_id) if s.kind == SPAN_KIND_MESSAGE]
+    assert span.attributes['durable_commit_seconds'] > 0
+    assert span.attributes['serialization_seconds'] > 0
+    breakdown = channel.tracer.latency_breakdown(task_id)[AGENT_ID]
+    assert breakdown['durable_commit_seconds'] == span.attributes['durable_commit_seconds']
+    queue.close()
@@ -0,0 +1,86 @@
+"""
+Durable Delivery Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for AgentChannel acknowledgement and replay with a
+DurableMessageQueue.
+"""
+
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from sdd.agents.shared.communication import AgentChannel
+from sdd.agents.shared.durable_queue import DurableMessageQueue
+from sdd.agents.shared.models import AgentContext, AgentInput, AgentOutput
+
+AGENT_ID = "quality.verifier"
+
+
+def _input(task_id: str, n: int) -> AgentInput:
+    return AgentInput(
+        agent_id=AGENT_ID,
+        task_id=task_id,
+        phase="planning",
+        input_data={'n': n},
+        context=AgentContext()
+    )
+
+
+def _output(task_id: str, **overrides) -> AgentOutput:
+    fields = dict(
+        agent_id=AGENT_ID,
+        task_id=task_id,
+        success=True,
+        output_data={},
+        reasoning="done",
+        confidence=0.9,
+        next_actions=[]
+    )
+    fields.update(overrides)
+    return AgentOutput.model_construct(**fields)
+
+
+def _reopen(tmp_path) -> AgentChannel:
+    queue = DurableMessageQueue(db_path=str(tmp_path / "queue.db"))
+    return AgentChannel(audit_dir=str(tmp_path / "audit"), durable_queue=queue)
+
+
+def test_each_response_acks_one_delivered_message(tmp_path):
+    task_id = str(uuid.uuid4())
+    channel = _reopen(tmp_path)
+    for n in range(3):
+        channel.send(_input(task_id, n))
+
+    assert channel.receive(AGENT_ID).input_data == {'n': 0}
+    assert channel.receive(AGENT_ID).input_data == {'n': 1}
+    channel.respond(_output(task_id))
+    channel.durable_queue.close()
+
+    # Only the first delivery was answered: the second (delivered, unacked)
+    # and third (never delivered) are replayed
+    replayed = _reopen(tmp_path)
+    assert [e.payload.input_data for e in replayed.message_queue] == [{'n': 1}, {'n': 2}]
+
+    for _ in range(2):
+        replayed.receive(AGENT_ID)
+        replayed.respond(_output(task_id))
+    assert replayed.durable_queue.pending_count() == 0
+    replayed.durable_queue.close()
+
+
+def test_invalid_response_does_not_ack(tmp_path):
+    task_id = str(uuid.uuid4())
+    channel = _reopen(tmp_path)
+    channel.send(_input(task_id, 0))
+    channel.receive(AGENT_ID)
+
+    with pytest.raises(ValidationError):
+        channel.respond(_output(task_id, confidence=2.0))
+    channel.durable_queue.close()
+
+    replayed = _reopen(tmp_path)
+    assert [e.payload.input_data for e in replayed.message_queue] == [{'n': 0}]
+    assert replayed.message_queue[0].metadata['delivery_attempts'] == 1
+    replayed.durable_queue.close()
@@ -0,0 +1,71 @@
+"""
+Durable Message Queue Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for DurableMessageQueue group commit: enqueue() returns
+only after its message is committed.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+from sdd.agents.shared.durable_queue import DurableMessageQueue, QueuedMessage
+
+
+def _message(n: int) -> QueuedMessage:
+    return QueuedMessage(
+        message_id=f"msg-{n}",
+        receiver="quality.verifier",
+        sender=None,
+        task_id=None,
+        created_at=datetime.now(),
+        payload_json="{}",
+        metadata={}
+    )
+
+
+def _committed_count(db_path) -> int:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_enqueue_is_committed_on_return(tmp_path):
+    db_path = tmp_path / "queue.db"
+    queue = DurableMessageQueue(db_path=str(db_path), commit_interval_ms=50.0)
+    try:
+        queue.enqueue(_message(0))
+        # Visible to another connection, i.e. committed, without flush()
+        assert _committed_count(db_path) == 1
+    finally:
+        queue.close()
+
+
+def test_concurrent_enqueues_are_all_committed(tmp_path):
+    db_path = tmp_path / "queue.db"
+    queue = DurableMessageQueue(db_path=str(db_path), commit_batch_size=4)
+    threads = [
+        threading.Thread(target=lambda n=n: queue.enqueue(_message(n)))
+        for n in range(20)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert _committed_count(db_path) == 20
+    finally:
+        queue.close()
+
+
+def test_close_stops_flusher_thread(tmp_path):
+    queue = DurableMessageQueue(db_path=str(tmp_path / "queue.db"))
+    queue.enqueue(_message(0))
+    queue.ack("msg-0")
+    queue.close()
+    queue.close()
+    assert not queue._flusher.is_alive()
+    assert _committed_count(tmp_path / "queue.db") == 0
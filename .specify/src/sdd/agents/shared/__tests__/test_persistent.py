@@ -0,0 +1,31 @@
+"""
+Persistent List Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for PersistentList validation as a Pydantic field.
+"""
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from sdd.agents.shared.persistent import PersistentList
+
+
+class Example(BaseModel):
+    items: PersistentList[int] = Field(default_factory=PersistentList)
+
+
+def test_instance_items_are_validated():
+    with pytest.raises(ValidationError):
+        Example(items=PersistentList(['a']))
+
+
+def test_instance_items_are_coerced_into_new_list():
+    items = Example(items=PersistentList(['1'])).items
+    assert isinstance(items, PersistentList)
+    assert items.to_list() == [1]
+
+
+def test_valid_instance_is_shared_not_copied():
+    history = PersistentList([1, 2])
+    assert Example(items=history).items is history
@@ -0,0 +1,102 @@
+"""
+Worker Pool Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Tests for WorkerPool dispatch and crash recovery.
+"""
+
+import os
+import time
+import uuid
+from pathlib import Path
+
+from sdd.agents.shared.models import AgentContext, AgentInput, AgentOutput
+from sdd.agents.shared.workers import WorkerPool
+
+AGENT_ID = "quality.verifier"
+RESULT_TIMEOUT = 30
+
+
+def echo(agent_input: AgentInput) -> AgentOutput:
+    """Handler: echo input_data; crash the worker once per 'crash_marker' file."""
+    marker = agent_input.input_data.get('crash_marker')
+    if marker and not Path(marker).exists():
+        Path(marker).touch()
+        os._exit(1)
+    if agent_input.input_data.get('always_crash'):
+        os._exit(1)
+    if agent_input.input_data.get('crash_after'):
+        time.sleep(agent_input.input_data['crash_after'])
+        os._exit(1)
+    return AgentOutput(
+        agent_id=agent_input.agent_id,
+        task_id=agent_input.task_id,
+        success=True,
+        output_data=dict(agent_input.input_data),
+        reasoning="echo",
+        confidence=1.0,
+        next_actions=[]
+    )
+
+
+def _pool(**kwargs) -> WorkerPool:
+    return WorkerPool(
+        handlers={AGENT_ID: f"{__name__}:echo"},
+        start_method="fork",
+        poll_interval=0.02,
+        **kwargs
+    )
+
+
+def _input(**input_data) -> AgentInput:
+    return AgentInput(
+        agent_id=AGENT_ID,
+        task_id=str(uuid.uuid4()),
+        phase="planning",
+        input_data=input_data,
+        context=AgentContext()
+    )
+
+
+def test_results_for_more_messages_than_workers():
+    with _pool(num_workers=2) as pool:
+        for n in range(10):
+            pool.submit(f"m{n}", _input(n=n))
+        for n in range(10):
+            result = pool.get_result(f"m{n}", timeout=RESULT_TIMEOUT)
+            assert result.output.output_data == {'n': n}
+            assert result.attempts == 1
+        assert pool.pending_count() == 0
+
+
+def test_crashed_worker_message_is_retried(tmp_path):
+    with _pool(num_workers=1) as pool:
+        pool.submit("crash", _input(crash_marker=str(tmp_path / "crashed")))
+        pool.submit("after", _input(n=1))
+
+        result = pool.get_result("crash", timeout=RESULT_TIMEOUT)
+        assert result.output.success
+        assert result.attempts == 2
+        assert pool.get_result("after", timeout=RESULT_TIMEOUT).attempts == 1
+        assert pool.restarts == 1
+
+
+def test_message_fails_after_max_retries():
+    with _pool(num_workers=1, max_retries=1) as pool:
+        pool.submit("doomed", _input(always_crash=True))
+
+        result = pool.get_result("doomed", timeout=RESULT_TIMEOUT)
+        assert not result.output.success
+        assert result.attempts == 2
+
+
+def test_shutdown_fails_messages_of_crashed_workers():
+    pool = _pool(num_workers=1).start()
+    pool.submit("m1", _input(crash_after=0.2))
+    pool.submit("m2", _input(n=2))
+    pool.shutdown()
+
+    assert pool.pending_count() == 0
+    assert sorted(pool.as_completed(timeout=1)) == ["m1", "m2"]
+    for message_id in ("m1", "m2"):
+        assert not pool.get_result(message_id, timeout=1).output.success
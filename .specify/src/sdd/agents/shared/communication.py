@@ -11,6 +11,7 @@ Constitutional Compliance:
     - Principle I: Library-First - AgentChannel is standalone library
     - Principle III: Contract-First - Uses Pydantic models for contracts
     - Principle VII: Observability - Complete audit trail of communications
+      and span tracing of every send/receive/respond/handoff
 
 Usage:
     from sdd.agents.shared.communication import AgentChannel
@@ -38,18 +39,42 @@ Usage:
         to_agent="architecture.router",
         context=updated_context
     )
+
+    # De-duplicate outputs in the audit trail (records reference outputs by hash)
+    channel = AgentChannel(output_store=OutputStore())
+
+    # Find the slow agent in a chain (spans record queue-wait/processing/serialization)
+    print(channel.tracer.latency_breakdown(trace_id=task_id))
+    channel.export_trace(task_id, chrome=True)  # open in chrome://tracing
+
+    # Survive orchestrator crashes (unacknowledged messages replayed on restart)
+    channel = AgentChannel(durable_queue=DurableMessageQueue())
 """
 
 import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from pydantic import ValidationError
 
+from sdd.agents.shared.durable_queue import DurableMessageQueue, QueuedMessage
 from sdd.agents.shared.models import AgentContext, AgentInput, AgentOutput
+from sdd.agents.shared.output_store import PAYLOAD_REF_KEY, OutputStore
+from sdd.agents.shared.tracing import (
+    SPAN_KIND_HANDOFF,
+    SPAN_KIND_MESSAGE,
+    SPAN_KIND_PROCESSING,
+    SPAN_KIND_RESPONSE,
+    SPAN_STATUS_ERROR,
+    SPAN_STATUS_OK,
+    Span,
+    Tracer,
+)
+from sdd.agents.shared.workers import WorkerPool
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -75,7 +100,8 @@ class MessageEnvelope:
         sender: Sender agent ID (optional)
         receiver: Receiver agent ID
         payload: AgentInput or AgentOutput
-        metadata: Additional metadata
+        metadata: Additional metadata (includes trace_id/span_id when traced)
+        enqueued_at: perf_counter() when queued (for queue-wait timing)
     """
 
     def __init__(
@@ -91,19 +117,39 @@ class MessageEnvelope:
         self.receiver = receiver
         self.payload = payload
         self.metadata = metadata or {}
+        self.enqueued_at: Optional[float] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+    def to_dict(self, output_store: Optional[OutputStore] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            output_store: If provided, AgentOutputs are written to the store and
+                referenced by content hash instead of being inlined
+
+        Returns:
+            Envelope dictionary
+        """
+        data = {
             'message_id': self.message_id,
             'timestamp': self.timestamp.isoformat(),
             'sender': self.sender,
             'receiver': self.receiver,
             'payload_type': type(self.payload).__name__,
-            'payload': self.payload.model_dump(),
             'metadata': self.metadata
         }
 
+        if output_store is None:
+            data['payload'] = self.payload.model_dump(mode='json')
+        elif isinstance(self.payload, AgentOutput):
+            data[PAYLOAD_REF_KEY] = output_store.put(self.payload)
+        else:
+            payload = self.payload.model_dump(mode='json', exclude={'context'})
+            payload['context'] = output_store.dehydrate_context(self.payload.context)
+            data['payload'] = payload
+
+        return data
+
 
 class HandoffRecord:
     """
@@ -116,6 +162,9 @@ class HandoffRecord:
         to_agent: Destination agent ID
         context: AgentContext being handed off
         reason: Reason for handoff (optional)
+        trace_id: Trace the handoff belongs to (set by AgentChannel)
+        span_id: Handoff span identifier (set by AgentChannel)
+        serialization_seconds: Time spent building the audit record (to_dict)
     """
 
     def __init__(
@@ -131,16 +180,36 @@ class HandoffRecord:
         self.to_agent = to_agent
         self.context = context
         self.reason = reason
+        self.trace_id: Optional[str] = None
+        self.span_id: Optional[str] = None
+        self.serialization_seconds: Optional[float] = None
+
+    def to_dict(self, output_store: Optional[OutputStore] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            output_store: If provided, previous outputs in the context are
+                referenced by content hash instead of being inlined
+
+        Returns:
+            Handoff dictionary
+        """
+        if output_store is None:
+            context = self.context.model_dump(mode='json')
+        else:
+            context = output_store.dehydrate_context(self.context)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
         return {
             'handoff_id': self.handoff_id,
             'timestamp': self.timestamp.isoformat(),
             'from_agent': self.from_agent,
             'to_agent': self.to_agent,
-            'context': self.context.model_dump(),
-            'reason': self.reason
+            'context': context,
+            'reason': self.reason,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'serialization_seconds': self.serialization_seconds
         }
 
 
@@ -160,20 +229,37 @@ class AgentChannel:
         message_queue: In-memory message queue (FIFO)
         invocation_chain: List of agent invocations in current workflow
         handoff_history: List of context handoffs
+        output_store: Content-addressed store for de-duplicated outputs (optional)
+        tracer: Span tracer recording queue-wait, processing and serialization time
+        transport: Worker pool executing registered agents out of process (optional)
+        durable_queue: Persistent backing store for message_queue (optional)
     """
 
     def __init__(
         self,
-        audit_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/communication"
+        audit_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/communication",
+        output_store: Optional[OutputStore] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[WorkerPool] = None,
+        durable_queue: Optional[DurableMessageQueue] = None
     ):
         """
         Initialize Agent Channel.
 
         Args:
             audit_dir: Directory for audit trail storage
+            output_store: If provided, audit records reference AgentOutputs by
+                content hash (see OutputStore.expand_record to restore them)
+            tracer: Tracer for span recording (default: new Tracer)
+            transport: Started WorkerPool; messages for agents it handles are
+                dispatched to worker processes and returned via collect()
+            durable_queue: If provided, queued messages are persisted until
+                respond() acknowledges them; unacknowledged messages from a
+                previous run are replayed into message_queue
         """
         self.audit_dir = Path(audit_dir)
         self.audit_dir.mkdir(parents=True, exist_ok=True)
+        self.output_store = output_store
 
         # Message queue
         self.message_queue: List[MessageEnvelope] = []
@@ -182,6 +268,23 @@ class AgentChannel:
         self.invocation_chain: List[str] = []
         self.handoff_history: List[HandoffRecord] = []
 
+        # Tracing: queued message spans by message_id, open processing spans
+        # by (agent_id, task_id)
+        self.tracer = tracer or Tracer()
+        self._message_spans: Dict[str, Span] = {}
+        self._active_spans: Dict[Tuple[str, str], Span] = {}
+
+        # Out-of-process dispatch: message_id -> envelope awaiting collect()
+        self.transport = transport
+        self._dispatched: Dict[str, MessageEnvelope] = {}
+
+        # Durable delivery: (agent_id, task_id) -> delivered messages awaiting
+        # ack, oldest first (respond() acks one per response)
+        self.durable_queue = durable_queue
+        self._delivered: Dict[Tuple[str, str], List[str]] = {}
+        if durable_queue is not None:
+            self._replay_durable_queue()
+
         logger.info(f"AgentChannel initialized: audit_dir={self.audit_dir}")
 
     def send(
@@ -234,8 +337,40 @@ class AgentChannel:
             metadata={'timeout_seconds': timeout_seconds}
         )
 
-        # Add to queue
-        self.message_queue.append(envelope)
+        # Start queue span (child of the sender's processing span, if any)
+        parent = self._active_spans.get((sender, agent_input.task_id)) if sender else None
+        span = self.tracer.start_span(
+            name=f"queue:{agent_input.agent_id}",
+            kind=SPAN_KIND_MESSAGE,
+            trace_id=agent_input.task_id,
+            agent_id=agent_input.agent_id,
+            parent_span_id=parent.span_id if parent else None,
+            attributes={'message_id': envelope.message_id, 'sender': sender}
+        )
+        self._tag_envelope(envelope, span)
+
+        # Add to queue (or dispatch to a worker process)
+        if self.transport is not None and self.transport.handles(agent_input.agent_id):
+            self.transport.submit(envelope.message_id, agent_input)
+            self._dispatched[envelope.message_id] = envelope
+        else:
+            self.message_queue.append(envelope)
+            if self.durable_queue is not None:
+                serialize_start = time.perf_counter()
+                payload_json = agent_input.model_dump_json()
+                span.add_time('serialization_seconds', time.perf_counter() - serialize_start)
+
+                commit_start = time.perf_counter()
+                self.durable_queue.enqueue(QueuedMessage(
+                    message_id=envelope.message_id,
+                    receiver=envelope.receiver,
+                    sender=sender,
+                    task_id=agent_input.task_id,
+                    created_at=envelope.timestamp,
+                    payload_json=payload_json,
+                    metadata=envelope.metadata
+                ))
+                span.add_time('durable_commit_seconds', time.perf_counter() - commit_start)
 
         # Track invocation
         self.invocation_chain.append(agent_input.agent_id)
@@ -248,7 +383,10 @@ class AgentChannel:
         )
 
         # Audit trail
-        self._audit_message(envelope)
+        span.add_time('serialization_seconds', self._audit_message(envelope))
+
+        self._message_spans[envelope.message_id] = span
+        envelope.enqueued_at = time.perf_counter()
 
         return envelope.message_id
 
@@ -284,6 +422,13 @@ class AgentChannel:
                     f"receiver={envelope.receiver}"
                 )
 
+                self._start_processing_span(envelope)
+
+                if self.durable_queue is not None:
+                    self.durable_queue.mark_delivered(envelope.message_id)
+                    key = (envelope.receiver, envelope.payload.task_id)
+                    self._delivered.setdefault(key, []).append(envelope.message_id)
+
                 return envelope.payload
 
         return None
@@ -319,28 +464,55 @@ class AgentChannel:
             ... )
             >>> message_id = channel.respond(agent_output)
         """
-        # Validate output
-        try:
-            AgentOutput.model_validate(agent_output.model_dump())
-        except ValidationError as e:
-            logger.error(f"AgentOutput validation failed: {e}")
-            raise
-
-        # Create message envelope
-        envelope = MessageEnvelope(
-            receiver=receiver or "orchestrator",
-            payload=agent_output,
-            sender=agent_output.agent_id
-        )
-
-        # Log communication
-        logger.info(
-            f"Response sent: id={envelope.message_id}, "
-            f"sender={agent_output.agent_id}, success={agent_output.success}"
+        processing = self._active_spans.pop(
+            (agent_output.agent_id, agent_output.task_id), None
         )
-
-        # Audit trail
-        self._audit_message(envelope)
+        if processing is not None:
+            processing.add_time('processing_seconds', processing.duration_seconds)
+            span = processing
+        else:
+            span = self.tracer.start_span(
+                name=f"respond:{agent_output.agent_id}",
+                kind=SPAN_KIND_RESPONSE,
+                trace_id=agent_output.task_id,
+                agent_id=agent_output.agent_id
+            )
+
+        # A failed validation or audit still closes the span (status=error)
+        status = SPAN_STATUS_ERROR
+        try:
+            # Validate output
+            try:
+                AgentOutput.model_validate(agent_output.model_dump())
+            except ValidationError as e:
+                logger.error(f"AgentOutput validation failed: {e}")
+                raise
+
+            # Create message envelope
+            envelope = MessageEnvelope(
+                receiver=receiver or "orchestrator",
+                payload=agent_output,
+                sender=agent_output.agent_id
+            )
+            self._tag_envelope(envelope, span)
+
+            # Log communication
+            logger.info(
+                f"Response sent: id={envelope.message_id}, "
+                f"sender={agent_output.agent_id}, success={agent_output.success}"
+            )
+
+            # Audit trail
+            span.add_time('serialization_seconds', self._audit_message(envelope))
+
+            # Acknowledge only a validated, audited response (an invalid one
+            # leaves the message to be replayed)
+            if self.durable_queue is not None:
+                self._ack_delivered(agent_output.agent_id, agent_output.task_id)
+
+            status = SPAN_STATUS_OK
+        finally:
+            span.finish(status)
 
         return envelope.message_id
 
@@ -382,6 +554,19 @@ class AgentChannel:
             reason=reason
         )
 
+        # Handoff span (child of the source agent's latest processing span)
+        parent = self._find_active_span(from_agent)
+        span = self.tracer.start_span(
+            name=f"handoff:{from_agent}->{to_agent}",
+            kind=SPAN_KIND_HANDOFF,
+            trace_id=parent.trace_id if parent else handoff.handoff_id,
+            agent_id=from_agent,
+            parent_span_id=parent.span_id if parent else None,
+            attributes={'handoff_id': handoff.handoff_id, 'to_agent': to_agent}
+        )
+        handoff.trace_id = span.trace_id
+        handoff.span_id = span.span_id
+
         # Add to history
         self.handoff_history.append(handoff)
 
@@ -391,10 +576,78 @@ class AgentChannel:
         )
 
         # Audit trail
-        self._audit_handoff(handoff)
+        span.add_time('serialization_seconds', self._audit_handoff(handoff))
+        span.finish()
 
         return handoff.handoff_id
 
+    def collect(
+        self,
+        message_id: str,
+        timeout_seconds: Optional[float] = None
+    ) -> AgentOutput:
+        """
+        Wait for the response to a message dispatched to a worker process.
+
+        The worker's output goes through respond() (validation, audit trail,
+        tracing) exactly as if the agent had responded in-process.
+
+        Args:
+            message_id: Message ID returned by send()
+            timeout_seconds: Seconds to wait (None = forever)
+
+        Returns:
+            AgentOutput produced by the worker
+
+        Raises:
+            KeyError: If message_id was not dispatched to the transport
+            TimeoutError: If no response within timeout
+
+        Example:
+            >>> channel = AgentChannel(transport=pool)
+            >>> message_id = channel.send(agent_input)
+            >>> output = channel.collect(message_id, timeout_seconds=120)
+        """
+        envelope = self._dispatched.get(message_id)
+        if envelope is None or self.transport is None:
+            raise KeyError(f"Message not dispatched to a worker: {message_id}")
+
+        result = self.transport.get_result(message_id, timeout=timeout_seconds)
+        del self._dispatched[message_id]
+
+        logger.info(
+            f"Message received by worker: id={message_id}, receiver={envelope.receiver}, "
+            f"attempts={result.attempts}"
+        )
+
+        # Split remote round-trip into queue wait and worker processing time
+        queue_span = self._message_spans.pop(message_id, None)
+        if queue_span is not None:
+            if envelope.enqueued_at is not None:
+                round_trip = time.perf_counter() - envelope.enqueued_at
+                queue_span.add_time(
+                    'queue_wait_seconds', max(0.0, round_trip - result.processing_seconds)
+                )
+            queue_span.finish()
+
+        task_id = envelope.payload.task_id
+        self._active_spans[(result.output.agent_id, task_id)] = self.tracer.start_span(
+            name=f"process:{envelope.receiver}",
+            kind=SPAN_KIND_PROCESSING,
+            trace_id=task_id,
+            agent_id=envelope.receiver,
+            parent_span_id=queue_span.span_id if queue_span else None,
+            attributes={
+                'message_id': message_id,
+                'remote': True,
+                'attempts': result.attempts,
+                'processing_seconds': result.processing_seconds
+            }
+        )
+
+        self.respond(result.output, receiver=envelope.sender)
+        return result.output
+
     def get_invocation_chain(self) -> List[str]:
         """
         Get agent invocation chain for current workflow.
@@ -438,6 +691,13 @@ class AgentChannel:
         self.message_queue.clear()
         self.invocation_chain.clear()
         self.handoff_history.clear()
+        self._message_spans.clear()
+        self._active_spans.clear()
+        self._dispatched.clear()
+        self._delivered.clear()
+        if self.durable_queue is not None:
+            self.durable_queue.purge()
+        self.tracer.clear()
         logger.info("AgentChannel cleared")
 
     def export_audit_trail(
@@ -470,8 +730,9 @@ class AgentChannel:
             'task_id': task_id,
             'generated_at': datetime.now().isoformat(),
             'invocation_chain': self.invocation_chain,
-            'handoff_history': [h.to_dict() for h in self.handoff_history],
-            'message_count': len(self.message_queue)
+            'handoff_history': [h.to_dict(self.output_store) for h in self.handoff_history],
+            'message_count': len(self.message_queue) + len(self._dispatched),
+            'latency_breakdown': self.tracer.latency_breakdown(task_id)
         }
 
         output_file = Path(output_path)
@@ -481,17 +742,135 @@ class AgentChannel:
         logger.info(f"Audit trail exported: {output_path}")
         return str(output_file)
 
-    def _audit_message(self, envelope: MessageEnvelope) -> None:
-        """Write message to audit trail."""
+    def export_trace(
+        self,
+        task_id: str,
+        output_path: Optional[str] = None,
+        chrome: bool = False
+    ) -> str:
+        """
+        Export span trace for task.
+
+        Args:
+            task_id: Task identifier (trace id)
+            output_path: Path to save trace (default: audit_dir/{task_id}_trace[.chrome].json)
+            chrome: Export Chrome trace-event format instead of span JSON
+
+        Returns:
+            Path to exported trace
+
+        Example:
+            >>> channel = AgentChannel()
+            >>> # ... workflow complete ...
+            >>> path = channel.export_trace(task_id, chrome=True)
+            >>> # Open in chrome://tracing or https://ui.perfetto.dev
+        """
+        if chrome:
+            if output_path is None:
+                output_path = str(self.audit_dir / f"{task_id}_trace.chrome.json")
+            return self.tracer.export_chrome_trace(output_path, trace_id=task_id)
+
+        if output_path is None:
+            output_path = str(self.audit_dir / f"{task_id}_trace.json")
+        return self.tracer.export_json(output_path, trace_id=task_id)
+
+    def _start_processing_span(self, envelope: MessageEnvelope) -> None:
+        """Close the queue span of a received message and open its processing span."""
+        queue_span = self._message_spans.pop(envelope.message_id, None)
+        if queue_span is not None:
+            if envelope.enqueued_at is not None:
+                queue_span.add_time(
+                    'queue_wait_seconds', time.perf_counter() - envelope.enqueued_at
+                )
+            queue_span.finish()
+
+        task_id = envelope.payload.task_id
+        self._active_spans[(envelope.receiver, task_id)] = self.tracer.start_span(
+            name=f"process:{envelope.receiver}",
+            kind=SPAN_KIND_PROCESSING,
+            trace_id=task_id,
+            agent_id=envelope.receiver,
+            parent_span_id=queue_span.span_id if queue_span else None,
+            attributes={'message_id': envelope.message_id}
+        )
+
+    def _replay_durable_queue(self) -> None:
+        """Restore unacknowledged messages from the durable queue."""
+        for message in self.durable_queue.replay():
+            envelope = MessageEnvelope(
+                receiver=message.receiver,
+                payload=AgentInput.model_validate_json(message.payload_json),
+                sender=message.sender,
+                metadata={**message.metadata, 'delivery_attempts': message.attempts}
+            )
+            envelope.message_id = message.message_id
+            envelope.timestamp = message.created_at
+            envelope.enqueued_at = time.perf_counter()
+            self.message_queue.append(envelope)
+
+    def _ack_delivered(self, agent_id: str, task_id: str) -> None:
+        """Acknowledge the oldest delivered message awaiting a response."""
+        key = (agent_id, task_id)
+        pending = self._delivered.get(key)
+        if not pending:
+            return
+        self.durable_queue.ack(pending.pop(0))
+        if not pending:
+            del self._delivered[key]
+
+    def _find_active_span(self, agent_id: str) -> Optional[Span]:
+        """Get the most recently opened processing span for an agent."""
+        for (span_agent, _task_id), span in reversed(self._active_spans.items()):
+            if span_agent == agent_id:
+                return span
+        return None
+
+    @staticmethod
+    def _tag_envelope(envelope: MessageEnvelope, span: Span) -> None:
+        """Record trace identifiers in envelope metadata."""
+        envelope.metadata.update({
+            'trace_id': span.trace_id,
+            'span_id': span.span_id,
+            'parent_span_id': span.parent_span_id
+        })
+
+    def _audit_message(self, envelope: MessageEnvelope) -> float:
+        """
+        Write message to audit trail.
+
+        Returns:
+            Seconds spent serializing the record (to_dict and json.dumps)
+        """
+        start = time.perf_counter()
+        line = json.dumps(envelope.to_dict(self.output_store))
+        seconds = time.perf_counter() - start
+
         audit_file = self.audit_dir / "messages.jsonl"
         with open(audit_file, 'a') as f:
-            f.write(json.dumps(envelope.to_dict()) + '\n')
+            f.write(line + '\n')
+        return seconds
+
+    def _audit_handoff(self, handoff: HandoffRecord) -> float:
+        """
+        Write handoff to audit trail.
+
+        The record carries the time spent building it (to_dict); json.dumps
+        of the record itself is included in the returned time only.
+
+        Returns:
+            Seconds spent serializing the record (to_dict and json.dumps)
+        """
+        start = time.perf_counter()
+        record = handoff.to_dict(self.output_store)
+        handoff.serialization_seconds = time.perf_counter() - start
+        record['serialization_seconds'] = handoff.serialization_seconds
+        line = json.dumps(record)
+        seconds = time.perf_counter() - start
 
-    def _audit_handoff(self, handoff: HandoffRecord) -> None:
-        """Write handoff to audit trail."""
         audit_file = self.audit_dir / "handoffs.jsonl"
         with open(audit_file, 'a') as f:
-            f.write(json.dumps(handoff.to_dict()) + '\n')
+            f.write(line + '\n')
+        return seconds
 
 
 # ===================================================================
@@ -0,0 +1,365 @@
+"""
+Durable Message Queue - Crash-Recoverable Storage for AgentChannel
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Persists queued AgentInput messages in SQLite (WAL mode) so an orchestrator
+    crash mid-workflow does not lose them. Provides at-least-once delivery:
+    a message stays in the queue until the receiving agent responds, and every
+    unacknowledged message is replayed when the queue is reopened.
+
+Constitutional Compliance:
+    - Principle I: Library-First - DurableMessageQueue is standalone library
+    - Principle IV: Idempotent Operations - ack() and enqueue() are safe to repeat
+    - Principle VII: Observability - Delivery attempts recorded per message
+
+Delivery States:
+    queued -> delivered (receive) -> deleted (ack on respond)
+    On reopen, delivered-but-unacknowledged messages return to queued with
+    attempts incremented.
+
+Group Commit:
+    enqueue() returns only after its message is committed, so a message
+    accepted by AgentChannel.send() survives an orchestrator crash. Writes
+    join the open transaction and one long-lived flusher thread commits it;
+    senders that arrive while a commit is in progress share the next one
+    (group commit across concurrent senders). commit_interval_ms lets the
+    flusher wait for more writers before committing, and a batch reaching
+    commit_batch_size is committed at once.
+
+    mark_delivered() and ack() do not wait: a crash before the flusher
+    commits them replays the message (at-least-once) with an attempt count
+    one lower. WAL with synchronous=NORMAL keeps commits across a process
+    crash; an OS crash or power loss can drop the latest commits.
+
+Storage:
+    Queue stored at: .docs/agents/shared/communication/queue.db
+
+Usage:
+    from sdd.agents.shared.durable_queue import DurableMessageQueue
+    from sdd.agents.shared.communication import AgentChannel
+
+    queue = DurableMessageQueue(db_path="/tmp/queue.db")
+    channel = AgentChannel(durable_queue=queue)  # replays unacked messages
+
+    channel.send(agent_input)           # persisted
+    agent_input = channel.receive()     # marked delivered
+    channel.respond(agent_output)       # acknowledged (removed)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+STATE_QUEUED = "queued"
+STATE_DELIVERED = "delivered"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id TEXT NOT NULL UNIQUE,
+    receiver TEXT NOT NULL,
+    sender TEXT,
+    task_id TEXT,
+    created_at TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    metadata_json TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_messages_state ON messages (state, seq);
+"""
+
+
+# ===================================================================
+# QueuedMessage
+# ===================================================================
+
+class QueuedMessage:
+    """
+    Persisted queue entry.
+
+    Attributes:
+        message_id: Message identifier (envelope message_id)
+        receiver: Receiver agent ID
+        sender: Sender agent ID (optional)
+        task_id: Task identifier of the payload
+        created_at: When the envelope was created
+        payload_json: AgentInput JSON
+        metadata: Envelope metadata
+        attempts: Delivery attempts so far
+    """
+
+    def __init__(
+        self,
+        message_id: str,
+        receiver: str,
+        sender: Optional[str],
+        task_id: Optional[str],
+        created_at: datetime,
+        payload_json: str,
+        metadata: Dict[str, Any],
+        attempts: int = 0
+    ):
+        self.message_id = message_id
+        self.receiver = receiver
+        self.sender = sender
+        self.task_id = task_id
+        self.created_at = created_at
+        self.payload_json = payload_json
+        self.metadata = metadata
+        self.attempts = attempts
+
+
+# ===================================================================
+# DurableMessageQueue
+# ===================================================================
+
+class DurableMessageQueue:
+    """
+    SQLite-backed message queue with acknowledgement and replay.
+
+    Attributes:
+        db_path: Path to SQLite database
+        commit_batch_size: Pending writes that trigger an immediate commit
+        commit_interval_ms: Time the flusher waits for more writers to join a batch
+    """
+
+    def __init__(
+        self,
+        db_path: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/communication/queue.db",
+        commit_batch_size: int = 32,
+        commit_interval_ms: float = 0.0
+    ):
+        """
+        Open (or create) the durable queue.
+
+        Args:
+            db_path: Path to SQLite database
+            commit_batch_size: Pending writes that trigger an immediate commit (>= 1)
+            commit_interval_ms: Milliseconds the flusher waits for more writers
+                before committing (0 = commit as soon as it runs; every
+                enqueue() waits up to this long)
+        """
+        if commit_batch_size < 1:
+            raise ValueError(f"commit_batch_size must be >= 1, got: {commit_batch_size}")
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_batch_size = commit_batch_size
+        self.commit_interval_ms = commit_interval_ms
+
+        self._lock = threading.RLock()
+        self._cond = threading.Condition(self._lock)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Group commit state: open transaction number, last committed one
+        self._pending_writes = 0
+        self._first_pending_at: Optional[float] = None
+        self._batch = 0
+        self._committed_batch = 0
+        self._closed = False
+
+        # Performance: one flusher thread commits batches for all writers
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="durable-queue-flusher", daemon=True
+        )
+        self._flusher.start()
+
+        logger.info(f"DurableMessageQueue opened: db_path={self.db_path}")
+
+    # ---------------------------------------------------------------
+    # Queue operations
+    # ---------------------------------------------------------------
+
+    def enqueue(self, message: QueuedMessage) -> None:
+        """
+        Persist a queued message (no-op if message_id already stored).
+
+        Returns once the message is committed.
+
+        Args:
+            message: Message to persist
+        """
+        with self._lock:
+            self._write(
+                "INSERT OR IGNORE INTO messages "
+                "(message_id, receiver, sender, task_id, created_at, payload_json, "
+                "metadata_json, state, attempts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    message.message_id,
+                    message.receiver,
+                    message.sender,
+                    message.task_id,
+                    message.created_at.isoformat(),
+                    message.payload_json,
+                    json.dumps(message.metadata, default=str),
+                    STATE_QUEUED,
+                    message.attempts,
+                ),
+                wait=True
+            )
+
+    def mark_delivered(self, message_id: str) -> None:
+        """
+        Record that a message was handed to its receiver.
+
+        Args:
+            message_id: Message identifier
+        """
+        with self._lock:
+            self._write(
+                "UPDATE messages SET state = ?, attempts = attempts + 1 WHERE message_id = ?",
+                (STATE_DELIVERED, message_id)
+            )
+
+    def ack(self, message_id: str) -> None:
+        """
+        Acknowledge a message (removes it; safe to repeat).
+
+        Args:
+            message_id: Message identifier
+        """
+        with self._lock:
+            self._write("DELETE FROM messages WHERE message_id = ?", (message_id,))
+
+    def replay(self) -> List[QueuedMessage]:
+        """
+        Return every unacknowledged message in enqueue order.
+
+        Delivered-but-unacknowledged messages are reset to queued so they are
+        delivered again (at-least-once).
+
+        Returns:
+            Messages to restore into the in-memory queue
+        """
+        with self._lock:
+            self.flush()
+            self._conn.execute(
+                "UPDATE messages SET state = ? WHERE state = ?",
+                (STATE_QUEUED, STATE_DELIVERED)
+            )
+            rows = self._conn.execute(
+                "SELECT message_id, receiver, sender, task_id, created_at, payload_json, "
+                "metadata_json, attempts FROM messages ORDER BY seq"
+            ).fetchall()
+
+        messages = [
+            QueuedMessage(
+                message_id=row[0],
+                receiver=row[1],
+                sender=row[2],
+                task_id=row[3],
+                created_at=datetime.fromisoformat(row[4]),
+                payload_json=row[5],
+                metadata=json.loads(row[6]),
+                attempts=row[7]
+            )
+            for row in rows
+        ]
+
+        if messages:
+            logger.info(f"Replaying {len(messages)} unacknowledged messages from {self.db_path}")
+        return messages
+
+    def pending_count(self) -> int:
+        """Number of unacknowledged messages (queued or delivered)."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+    def purge(self) -> None:
+        """Delete all messages."""
+        with self._lock:
+            self._write("DELETE FROM messages", ())
+            self.flush()
+
+    # ---------------------------------------------------------------
+    # Group commit
+    # ---------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Commit pending writes now."""
+        with self._lock:
+            if self._pending_writes:
+                self._commit()
+
+    def close(self) -> None:
+        """Commit pending writes, stop the flusher and close the database."""
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join()
+        with self._lock:
+            self._conn.close()
+        logger.info(f"DurableMessageQueue closed: db_path={self.db_path}")
+
+    def _write(self, sql: str, params: tuple, wait: bool = False) -> None:
+        """
+        Execute a write inside the group-commit transaction.
+
+        Args:
+            sql: Write statement
+            params: Statement parameters
+            wait: Block until the write is committed
+        """
+        if self._closed:
+            raise RuntimeError(f"DurableMessageQueue is closed: {self.db_path}")
+        if self._pending_writes == 0:
+            self._conn.execute("BEGIN")
+            self._batch += 1
+            self._first_pending_at = time.monotonic()
+            self._cond.notify_all()
+
+        self._conn.execute(sql, params)
+        self._pending_writes += 1
+        batch = self._batch
+
+        if self._pending_writes >= self.commit_batch_size:
+            self._commit()
+        while wait and self._committed_batch < batch:
+            self._cond.wait()
+
+    def _commit(self) -> None:
+        """Commit the open transaction and wake writers waiting on it."""
+        self._conn.execute("COMMIT")
+        self._pending_writes = 0
+        self._first_pending_at = None
+        self._committed_batch = self._batch
+        self._cond.notify_all()
+
+    def _flush_loop(self) -> None:
+        """Flusher thread: commit each batch once commit_interval_ms has elapsed."""
+        with self._lock:
+            while not self._closed:
+                if not self._pending_writes:
+                    self._cond.wait()
+                    continue
+                remaining = (
+                    self.commit_interval_ms / 1000
+                    - (time.monotonic() - self._first_pending_at)
+                )
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                self._commit()
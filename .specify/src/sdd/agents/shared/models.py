@@ -39,6 +39,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from sdd.agents.shared.persistent import PersistentList
+
 
 # ===================================================================
 # Enumerations
@@ -322,6 +324,8 @@ class AgentContext(BaseModel):
 
     State Transitions:
         Grows with each agent invocation (append-only)
+        - History fields are PersistentLists: each add_* shares the existing
+          items with the previous context (O(1) append, same JSON shape)
         - Add outputs to previous_outputs (ordered by timestamp)
         - Append feedback to cumulative_feedback
         - Update refinement_state as iterations progress
@@ -356,13 +360,13 @@ class AgentContext(BaseModel):
         description="Path to implementation plan (optional)"
     )
 
-    previous_outputs: List[AgentOutput] = Field(
-        default_factory=list,
+    previous_outputs: PersistentList[AgentOutput] = Field(
+        default_factory=PersistentList,
         description="History of agent outputs (chronologically ordered)"
     )
 
-    cumulative_feedback: List[str] = Field(
-        default_factory=list,
+    cumulative_feedback: PersistentList[str] = Field(
+        default_factory=PersistentList,
         description="Accumulated feedback from verification failures"
     )
 
@@ -411,7 +415,7 @@ class AgentContext(BaseModel):
             >>> updated = context.add_output(output)
         """
         return self.model_copy(
-            update={"previous_outputs": self.previous_outputs + [output]}
+            update={"previous_outputs": self.previous_outputs.append(output)}
         )
 
     def add_feedback(self, feedback: str) -> "AgentContext":
@@ -429,7 +433,7 @@ class AgentContext(BaseModel):
             >>> updated = context.add_feedback("Add contract for POST /api/users")
         """
         return self.model_copy(
-            update={"cumulative_feedback": self.cumulative_feedback + [feedback]}
+            update={"cumulative_feedback": self.cumulative_feedback.append(feedback)}
         )
 
     def get_latest_output(self) -> Optional[AgentOutput]:
@@ -0,0 +1,359 @@
+"""
+Output Store - Content-Addressed Storage for Agent Outputs
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    De-duplicates AgentOutput payloads across message envelopes and audit records.
+    Every MessageEnvelope carries the full AgentContext, so without de-duplication
+    each previous output is serialized again on every hop and every audit line.
+    The store keeps one blob per distinct output, keyed by the SHA-256 hash of its
+    canonical JSON, and audit records reference outputs by hash instead.
+
+Constitutional Compliance:
+    - Principle I: Library-First - OutputStore is standalone library
+    - Principle IV: Idempotent Operations - put() is write-once per content hash
+    - Principle VII: Observability - Audit records stay fully reconstructable
+
+Storage:
+    Blobs stored at: .docs/agents/shared/output-store/{hash[:2]}/{hash}.json
+
+Usage:
+    from sdd.agents.shared.output_store import OutputStore
+    from sdd.agents.shared.communication import AgentChannel
+
+    store = OutputStore(store_dir="/tmp/output-store")
+    channel = AgentChannel(audit_dir="/tmp/audit", output_store=store)
+
+    # Store and resolve directly
+    digest = store.put(agent_output)
+    same_output = store.get(digest)
+
+    # Expand an audit record written with hash references
+    record = json.loads(line)
+    full_record = store.expand_record(record)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from sdd.agents.shared.models import AgentContext, AgentOutput
+from sdd.agents.shared.persistent import PersistentList
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# Key used in place of `previous_outputs` inside dehydrated contexts
+OUTPUT_REFS_KEY = "output_refs"
+
+# Key used in place of `payload` for dehydrated AgentOutput envelopes
+PAYLOAD_REF_KEY = "payload_ref"
+
+
+# ===================================================================
+# LazyOutputs
+# ===================================================================
+
+class LazyOutputs(Sequence[AgentOutput]):
+    """
+    Read-only sequence of outputs resolved from the store on first access.
+
+    Attributes:
+        refs: Output content hashes (chronological order)
+        store: OutputStore used to resolve hashes
+    """
+
+    def __init__(self, refs: Iterable[str], store: "OutputStore"):
+        self.refs: List[str] = list(refs)
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.store.get(ref) for ref in self.refs[index]]
+        return self.store.get(self.refs[index])
+
+    def __iter__(self) -> Iterator[AgentOutput]:
+        for ref in self.refs:
+            yield self.store.get(ref)
+
+
+# ===================================================================
+# OutputStore
+# ===================================================================
+
+class OutputStore:
+    """
+    Content-addressed blob store for AgentOutput payloads.
+
+    Outputs are frozen, so a content hash identifies them permanently. Hashes are
+    memoized per live output object, so an output is canonicalized and hashed at
+    most once no matter how many envelopes reference it.
+
+    Attributes:
+        store_dir: Directory for blob storage
+        cache_size: Maximum number of resolved outputs kept in memory (LRU)
+    """
+
+    def __init__(
+        self,
+        store_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/output-store",
+        cache_size: int = 256
+    ):
+        """
+        Initialize Output Store.
+
+        Args:
+            store_dir: Directory for blob storage
+            cache_size: Maximum number of resolved outputs kept in memory
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+
+        # id(output) -> (weakref, digest); entries drop when the output is collected
+        self._digests: Dict[int, Tuple[weakref.ref, str]] = {}
+        # Digests known to be on disk (avoids a stat per put)
+        self._written: Set[str] = set()
+        # LRU of resolved outputs
+        self._cache: "OrderedDict[str, AgentOutput]" = OrderedDict()
+
+        logger.info(f"OutputStore initialized: store_dir={self.store_dir}")
+
+    # ---------------------------------------------------------------
+    # Hashing and blob access
+    # ---------------------------------------------------------------
+
+    @staticmethod
+    def canonical_json(output: AgentOutput) -> str:
+        """
+        Canonical JSON form of an output (sorted keys, compact separators).
+
+        Args:
+            output: AgentOutput to canonicalize
+
+        Returns:
+            Canonical JSON string
+        """
+        return json.dumps(
+            output.model_dump(mode='json'),
+            sort_keys=True,
+            separators=(',', ':')
+        )
+
+    def digest(self, output: AgentOutput) -> str:
+        """
+        Get content hash of an output (memoized per output object).
+
+        Args:
+            output: AgentOutput to hash
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON
+        """
+        key = id(output)
+        entry = self._digests.get(key)
+        if entry is not None and entry[0]() is output:
+            return entry[1]
+
+        digest = hashlib.sha256(self.canonical_json(output).encode('utf-8')).hexdigest()
+        self._digests[key] = (
+            weakref.ref(output, lambda _ref, k=key: self._digests.pop(k, None)),
+            digest
+        )
+        return digest
+
+    def put(self, output: AgentOutput) -> str:
+        """
+        Store output (write-once) and return its content hash.
+
+        Args:
+            output: AgentOutput to store
+
+        Returns:
+            Content hash referencing the stored output
+
+        Example:
+            >>> store = OutputStore()
+            >>> digest = store.put(agent_output)
+            >>> assert store.put(agent_output) == digest  # no second write
+        """
+        digest = self.digest(output)
+        if digest in self._written:
+            return digest
+
+        blob_file = self._blob_path(digest)
+        if not blob_file.exists():
+            blob_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = blob_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(self.canonical_json(output))
+            os.replace(tmp_file, blob_file)
+            logger.debug(f"Output stored: {digest}")
+
+        self._written.add(digest)
+        self._remember(digest, output)
+        return digest
+
+    def get(self, digest: str) -> AgentOutput:
+        """
+        Resolve output by content hash.
+
+        Args:
+            digest: Content hash returned by put()
+
+        Returns:
+            Stored AgentOutput
+
+        Raises:
+            KeyError: If no blob exists for digest
+        """
+        cached = self._cache.get(digest)
+        if cached is not None:
+            self._cache.move_to_end(digest)
+            return cached
+
+        blob_file = self._blob_path(digest)
+        if not blob_file.exists():
+            raise KeyError(f"Output not found in store: {digest}")
+
+        output = AgentOutput.model_validate_json(blob_file.read_text())
+        self._remember(digest, output)
+        return output
+
+    def contains(self, digest: str) -> bool:
+        """
+        Check whether an output is stored.
+
+        Args:
+            digest: Content hash
+
+        Returns:
+            True if blob exists
+        """
+        return digest in self._written or self._blob_path(digest).exists()
+
+    # ---------------------------------------------------------------
+    # Context and record (de)hydration
+    # ---------------------------------------------------------------
+
+    def dehydrate_context(self, context: AgentContext) -> Dict[str, Any]:
+        """
+        Serialize context with previous outputs replaced by content hashes.
+
+        Outputs are excluded from the dump entirely, so the per-hop cost is
+        proportional to the number of new outputs, not the chain length.
+
+        Args:
+            context: AgentContext to serialize
+
+        Returns:
+            Context dict with `output_refs` instead of `previous_outputs`
+        """
+        data = context.model_dump(mode='json', exclude={'previous_outputs'})
+        data[OUTPUT_REFS_KEY] = [self.put(output) for output in context.previous_outputs]
+        return data
+
+    def rehydrate_context(self, data: Dict[str, Any]) -> AgentContext:
+        """
+        Rebuild AgentContext from a dehydrated dict.
+
+        Args:
+            data: Dict produced by dehydrate_context()
+
+        Returns:
+            AgentContext with previous outputs resolved from the store
+        """
+        return AgentContext.model_validate(self.expand_context(data))
+
+    def lazy_outputs(self, data: Dict[str, Any]) -> LazyOutputs:
+        """
+        Get previous outputs of a dehydrated context without resolving them yet.
+
+        Args:
+            data: Dict produced by dehydrate_context()
+
+        Returns:
+            LazyOutputs resolving each output on access
+        """
+        return LazyOutputs(data.get(OUTPUT_REFS_KEY, []), self)
+
+    def expand_context(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Restore the full `previous_outputs` shape in a dehydrated context dict.
+
+        Args:
+            data: Dehydrated context dict
+
+        Returns:
+            New dict in the original AgentContext JSON shape
+        """
+        if OUTPUT_REFS_KEY not in data:
+            return data
+
+        expanded = {k: v for k, v in data.items() if k != OUTPUT_REFS_KEY}
+        expanded['previous_outputs'] = PersistentList(
+            self.get(ref) for ref in data[OUTPUT_REFS_KEY]
+        )
+        return expanded
+
+    def expand_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Restore a dehydrated audit record (message or handoff) to full form.
+
+        Args:
+            record: Audit record written with hash references
+
+        Returns:
+            New record in the original (fully inlined) JSON shape
+        """
+        expanded = dict(record)
+
+        if PAYLOAD_REF_KEY in expanded:
+            ref = expanded.pop(PAYLOAD_REF_KEY)
+            expanded['payload'] = self.get(ref).model_dump(mode='json')
+
+        payload = expanded.get('payload')
+        if isinstance(payload, dict) and isinstance(payload.get('context'), dict):
+            expanded['payload'] = {**payload, 'context': self._expand_to_json(payload['context'])}
+
+        if isinstance(expanded.get('context'), dict):
+            expanded['context'] = self._expand_to_json(expanded['context'])
+
+        return expanded
+
+    def _expand_to_json(self, context_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Expand a dehydrated context dict to its JSON-compatible form."""
+        expanded = self.expand_context(context_data)
+        if expanded is context_data:
+            return context_data
+        return {
+            **expanded,
+            'previous_outputs': [o.model_dump(mode='json') for o in expanded['previous_outputs']]
+        }
+
+    # ---------------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------------
+
+    def _blob_path(self, digest: str) -> Path:
+        """Get blob file path for digest (two-character fan-out directory)."""
+        return self.store_dir / digest[:2] / f"{digest}.json"
+
+    def _remember(self, digest: str, output: AgentOutput) -> None:
+        """Insert resolved output into LRU cache."""
+        self._cache[digest] = output
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
@@ -0,0 +1,257 @@
+"""
+Persistent List - Structural Sharing for Append-Only Histories
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Provides an immutable, append-only sequence with O(1) amortized append.
+    Successive versions share one backing buffer, so growing a history by one
+    item does not copy the items already recorded. Used by AgentContext and
+    RefinementState, whose immutable add_* helpers previously rebuilt the whole
+    list on every append (quadratic copying over long workflows).
+
+Constitutional Compliance:
+    - Principle I: Library-First - PersistentList is a standalone utility
+    - Principle III: Contract-First - Validates and serializes as a plain JSON list
+    - Principle IV: Idempotent Operations - Versions never mutate once created
+
+Sharing Model:
+    Every PersistentList is a (buffer, length) view. append() on the newest
+    version extends the shared buffer in place and returns a longer view; older
+    views keep their own length and are unaffected. Appending to an older
+    version (branching history) copies its prefix once, then shares again.
+
+Usage:
+    from sdd.agents.shared.persistent import PersistentList
+
+    history = PersistentList()
+    v1 = history.append("Add error handling")
+    v2 = v1.append("Add contract for POST /api/users")
+
+    len(v1)   # 1 - unchanged by later appends
+    list(v2)  # ["Add error handling", "Add contract for POST /api/users"]
+
+    # As a Pydantic field (validates items, dumps to a JSON list)
+    class Example(BaseModel):
+        items: PersistentList[str] = Field(default_factory=PersistentList)
+"""
+
+import threading
+from copy import deepcopy
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    get_args,
+    overload,
+)
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+T = TypeVar("T")
+
+
+class _SharedBuffer:
+    """Append-only item buffer shared by successive PersistentList versions."""
+
+    __slots__ = ("items", "lock")
+
+    def __init__(self, items: Optional[List[Any]] = None):
+        self.items: List[Any] = items if items is not None else []
+        self.lock = threading.Lock()
+
+
+class PersistentList(Sequence[T], Generic[T]):
+    """
+    Immutable append-only sequence with structural sharing.
+
+    Behaves like a read-only list (len, indexing, slicing, iteration, equality
+    with lists) while append()/extend() return new versions in O(1) amortized
+    time per item.
+
+    Attributes:
+        _buffer: Backing buffer shared with related versions
+        _length: Number of buffer items visible to this version
+    """
+
+    __slots__ = ("_buffer", "_length")
+
+    def __init__(self, items: Optional[Iterable[T]] = None):
+        """
+        Create a persistent list.
+
+        Args:
+            items: Initial items (copied once; optional)
+        """
+        initial = list(items) if items is not None else []
+        self._buffer = _SharedBuffer(initial)
+        self._length = len(initial)
+
+    @classmethod
+    def _view(cls, buffer: _SharedBuffer, length: int) -> "PersistentList[T]":
+        """Create a version viewing the first `length` items of `buffer`."""
+        view = cls.__new__(cls)
+        view._buffer = buffer
+        view._length = length
+        return view
+
+    # ---------------------------------------------------------------
+    # Persistent updates
+    # ---------------------------------------------------------------
+
+    def append(self, item: T) -> "PersistentList[T]":
+        """
+        Return a new version with `item` appended (self is unchanged).
+
+        Args:
+            item: Item to append
+
+        Returns:
+            New PersistentList sharing this version's items
+
+        Example:
+            >>> history = PersistentList(["a"])
+            >>> history.append("b")
+            PersistentList(['a', 'b'])
+        """
+        return self.extend((item,))
+
+    def extend(self, items: Iterable[T]) -> "PersistentList[T]":
+        """
+        Return a new version with `items` appended (self is unchanged).
+
+        Args:
+            items: Items to append
+
+        Returns:
+            New PersistentList sharing this version's items
+        """
+        new_items = list(items)
+        if not new_items:
+            return self
+
+        buffer = self._buffer
+        with buffer.lock:
+            if len(buffer.items) == self._length:
+                # Newest version: grow the shared buffer in place
+                buffer.items.extend(new_items)
+                return self._view(buffer, self._length + len(new_items))
+
+        # Older version (history branches): copy prefix once into a new buffer
+        branched = _SharedBuffer(buffer.items[:self._length] + new_items)
+        return self._view(branched, len(branched.items))
+
+    def to_list(self) -> List[T]:
+        """
+        Materialize a plain list copy of this version.
+
+        Returns:
+            List of items visible to this version
+        """
+        return self._buffer.items[:self._length]
+
+    def copy(self) -> List[T]:
+        """Return a plain list copy (list.copy() compatibility)."""
+        return self.to_list()
+
+    # ---------------------------------------------------------------
+    # Sequence protocol
+    # ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PersistentList index out of range")
+        return self._buffer.items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        items = self._buffer.items
+        for i in range(self._length):
+            yield items[i]
+
+    def __add__(self, other: Iterable[T]) -> "PersistentList[T]":
+        return self.extend(other)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistentList):
+            if other._buffer is self._buffer:
+                return other._length == self._length
+            return len(other) == self._length and all(a == b for a, b in zip(self, other))
+        if isinstance(other, (list, tuple)):
+            return len(other) == self._length and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PersistentList({self.to_list()!r})"
+
+    def __copy__(self) -> "PersistentList[T]":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "PersistentList[T]":
+        return PersistentList(deepcopy(self.to_list(), memo))
+
+    def __reduce__(self) -> Any:
+        return (PersistentList, (self.to_list(),))
+
+    # ---------------------------------------------------------------
+    # Pydantic integration
+    # ---------------------------------------------------------------
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source_type: Any,
+        handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """
+        Validate from any list (items validated) and serialize as a plain list.
+
+        Existing PersistentList instances have their items validated too, but
+        are returned as-is when validation leaves every item unchanged, so
+        model_copy() and re-validation of already-built models do not copy
+        the history.
+        """
+        args = get_args(source_type)
+        item_schema = handler.generate_schema(args[0]) if args else core_schema.any_schema()
+        list_schema = core_schema.list_schema(item_schema)
+
+        def validate(value: Any, validate_items: core_schema.ValidatorFunctionWrapHandler) -> Any:
+            if not isinstance(value, cls):
+                return cls(validate_items(value))
+            if not args:
+                return value
+            items = validate_items(value.to_list())
+            if all(new is old for new, old in zip(items, value)):
+                return value
+            return cls(items)
+
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(cls, list_schema),
+            python_schema=core_schema.no_info_wrap_validator_function(validate, list_schema),
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                lambda value, serializer: serializer(
+                    value.to_list() if isinstance(value, PersistentList) else value
+                ),
+                schema=list_schema,
+            ),
+        )
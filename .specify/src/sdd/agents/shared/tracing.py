@@ -0,0 +1,330 @@
+"""
+Agent Tracing - Span-Based Latency Breakdown for Agent Communication
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Records where wall-clock time goes across AgentChannel send, receive,
+    respond and handoff. Each message belongs to a trace (the task) and carries
+    a parent span, so an invocation chain can be reconstructed as a tree with
+    queue-wait, processing, serialization and durable-commit time per hop.
+
+Constitutional Compliance:
+    - Principle I: Library-First - Tracer is standalone library
+    - Principle VII: Observability - Exportable traces for offline analysis
+
+Exports:
+    - JSON trace file: list of span dicts plus per-agent latency breakdown
+    - Chrome trace-event file: open in chrome://tracing or https://ui.perfetto.dev
+
+Usage:
+    from sdd.agents.shared.tracing import Tracer
+    from sdd.agents.shared.communication import AgentChannel
+
+    tracer = Tracer()
+    channel = AgentChannel(tracer=tracer)
+
+    # ... send / receive / respond / handoff ...
+
+    breakdown = tracer.latency_breakdown(trace_id=task_id)
+    tracer.export_json("/tmp/trace.json", trace_id=task_id)
+    tracer.export_chrome_trace("/tmp/trace.chrome.json", trace_id=task_id)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# Span kinds recorded by AgentChannel
+SPAN_KIND_MESSAGE = "message"        # send -> receive (queue wait)
+SPAN_KIND_PROCESSING = "processing"  # receive -> respond (agent work)
+SPAN_KIND_RESPONSE = "response"      # respond without a matching receive
+SPAN_KIND_HANDOFF = "handoff"        # context handoff between agents
+
+# Span status set by finish()
+SPAN_STATUS_OK = "ok"
+SPAN_STATUS_ERROR = "error"
+
+# Timing attributes aggregated by latency_breakdown()
+TIMING_ATTRIBUTES = (
+    "queue_wait_seconds",
+    "processing_seconds",
+    "serialization_seconds",
+    "durable_commit_seconds"
+)
+
+
+# ===================================================================
+# Span
+# ===================================================================
+
+class Span:
+    """
+    Timed unit of work within a trace.
+
+    Attributes:
+        span_id: Unique identifier
+        trace_id: Trace identifier (task_id for channel traces)
+        parent_span_id: Parent span (None for roots)
+        name: Span name (e.g., "process:quality.verifier")
+        kind: Span kind (message, processing, response, handoff)
+        agent_id: Agent the span is attributed to
+        start_time: Wall-clock start (epoch seconds)
+        end_time: Wall-clock end (None while open)
+        status: "ok" or "error" once finished (None while open)
+        attributes: Timing breakdown and extra metadata
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        trace_id: str,
+        agent_id: str,
+        parent_span_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.span_id = uuid4().hex[:16]
+        self.trace_id = trace_id
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.agent_id = agent_id
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.status: Optional[str] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self._start_perf = time.perf_counter()
+        self._duration: Optional[float] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        """Span duration (elapsed so far if still open)."""
+        if self._duration is not None:
+            return self._duration
+        return time.perf_counter() - self._start_perf
+
+    def add_time(self, attribute: str, seconds: float) -> None:
+        """Accumulate seconds into a timing attribute."""
+        self.attributes[attribute] = self.attributes.get(attribute, 0.0) + seconds
+
+    def finish(self, status: str = SPAN_STATUS_OK) -> None:
+        """Close span with a status (idempotent)."""
+        if self._duration is None:
+            self._duration = time.perf_counter() - self._start_perf
+            self.end_time = self.start_time + self._duration
+            self.status = status
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'span_id': self.span_id,
+            'trace_id': self.trace_id,
+            'parent_span_id': self.parent_span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'agent_id': self.agent_id,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'status': self.status,
+            'duration_seconds': self.duration_seconds,
+            'attributes': self.attributes
+        }
+
+
+# ===================================================================
+# Tracer
+# ===================================================================
+
+class Tracer:
+    """
+    Collects spans and exports traces.
+
+    Attributes:
+        spans: Recorded spans (open and finished), in start order
+        max_spans: Oldest spans are dropped beyond this limit
+    """
+
+    def __init__(self, max_spans: int = 100_000):
+        """
+        Initialize Tracer.
+
+        Args:
+            max_spans: Maximum spans retained in memory
+        """
+        self.spans: List[Span] = []
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+
+    def start_span(
+        self,
+        name: str,
+        kind: str,
+        trace_id: str,
+        agent_id: str,
+        parent_span_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        """
+        Start and record a new span.
+
+        Args:
+            name: Span name
+            kind: Span kind
+            trace_id: Trace identifier
+            agent_id: Agent the span is attributed to
+            parent_span_id: Parent span identifier (optional)
+            attributes: Initial attributes (optional)
+
+        Returns:
+            Open Span (call finish() when done)
+        """
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=trace_id,
+            agent_id=agent_id,
+            parent_span_id=parent_span_id,
+            attributes=attributes
+        )
+        with self._lock:
+            self.spans.append(span)
+            if len(self.spans) > self.max_spans:
+                del self.spans[:len(self.spans) - self.max_spans]
+        return span
+
+    def get_trace(self, trace_id: Optional[str] = None) -> List[Span]:
+        """
+        Get spans for a trace.
+
+        Args:
+            trace_id: Trace identifier (None = all spans)
+
+        Returns:
+            Spans in start order
+        """
+        with self._lock:
+            spans = list(self.spans)
+        if trace_id is None:
+            return spans
+        return [s for s in spans if s.trace_id == trace_id]
+
+    def latency_breakdown(self, trace_id: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate timing attributes per agent.
+
+        Args:
+            trace_id: Trace identifier (None = all spans)
+
+        Returns:
+            {agent_id: {queue_wait_seconds, processing_seconds,
+                        serialization_seconds, durable_commit_seconds,
+                        total_seconds, span_count}}
+
+        Example:
+            >>> breakdown = tracer.latency_breakdown(trace_id=task_id)
+            >>> slowest = max(breakdown, key=lambda a: breakdown[a]['total_seconds'])
+        """
+        breakdown: Dict[str, Dict[str, float]] = {}
+        for span in self.get_trace(trace_id):
+            entry = breakdown.setdefault(
+                span.agent_id,
+                {**{attr: 0.0 for attr in TIMING_ATTRIBUTES}, 'total_seconds': 0.0, 'span_count': 0}
+            )
+            for attr in TIMING_ATTRIBUTES:
+                value = span.attributes.get(attr, 0.0)
+                entry[attr] += value
+                entry['total_seconds'] += value
+            entry['span_count'] += 1
+        return breakdown
+
+    def export_json(self, output_path: str, trace_id: Optional[str] = None) -> str:
+        """
+        Export spans and latency breakdown as a JSON trace file.
+
+        Args:
+            output_path: Destination file path
+            trace_id: Trace identifier (None = all spans)
+
+        Returns:
+            Path to exported file
+        """
+        data = {
+            'trace_id': trace_id,
+            'exported_at': time.time(),
+            'spans': [s.to_dict() for s in self.get_trace(trace_id)],
+            'latency_breakdown': self.latency_breakdown(trace_id)
+        }
+        return self._write(output_path, data)
+
+    def export_chrome_trace(self, output_path: str, trace_id: Optional[str] = None) -> str:
+        """
+        Export spans in Chrome trace-event format.
+
+        Each agent gets its own lane (tid); spans become complete ("X") events
+        with their timing attributes as args.
+
+        Args:
+            output_path: Destination file path
+            trace_id: Trace identifier (None = all spans)
+
+        Returns:
+            Path to exported file
+        """
+        pid = os.getpid()
+        lanes: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+
+        for span in self.get_trace(trace_id):
+            if span.agent_id not in lanes:
+                lanes[span.agent_id] = len(lanes) + 1
+                events.append({
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': lanes[span.agent_id],
+                    'args': {'name': span.agent_id}
+                })
+            events.append({
+                'name': span.name,
+                'cat': span.kind,
+                'ph': 'X',
+                'ts': span.start_time * 1_000_000,
+                'dur': span.duration_seconds * 1_000_000,
+                'pid': pid,
+                'tid': lanes[span.agent_id],
+                'args': {
+                    'trace_id': span.trace_id,
+                    'span_id': span.span_id,
+                    'parent_span_id': span.parent_span_id,
+                    'status': span.status,
+                    **span.attributes
+                }
+            })
+
+        return self._write(output_path, {'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self.spans.clear()
+
+    def _write(self, output_path: str, data: Dict[str, Any]) -> str:
+        """Write JSON export to file."""
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(json.dumps(data, indent=2, default=str))
+        logger.info(f"Trace exported: {output_file}")
+        return str(output_file)
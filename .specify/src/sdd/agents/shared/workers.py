@@ -0,0 +1,599 @@
+"""
+Agent Worker Pool - Multi-Process Agent Execution Transport
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Runs agents in worker processes so CPU-bound agents (ConstitutionalValidator,
+    VerificationAgent scoring, ContextAnalyzerAgent scanning) are not limited to a
+    single core by the GIL. AgentChannel dispatches messages for registered agents
+    to the pool instead of its in-memory queue; responses come back through the
+    channel's normal respond() path, so audit trail and tracing are unchanged.
+
+    # Performance: one interpreter per worker is the only way to spread pure-Python
+    # agent scoring across cores; messages cross processes as JSON strings.
+    # The supervisor hands each idle worker one message at a time over the
+    # worker's own task pipe (load balancing) and records the assignment before
+    # sending it, so the message a dead worker was running is always known.
+
+Constitutional Compliance:
+    - Principle I: Library-First - WorkerPool is standalone library
+    - Principle III: Contract-First - Workers exchange AgentInput/AgentOutput JSON
+    - Principle V: Progressive Enhancement - Optional transport; in-process by default
+    - Principle VII: Observability - Worker crashes, restarts and retries are logged
+
+Supervision:
+    A supervisor thread dispatches messages to idle workers, collects results and
+    checks worker liveness. When a worker dies, it is restarted and the message
+    assigned to it is re-queued (up to max_retries), after which a failed
+    AgentOutput is returned for that message.
+
+Usage:
+    from sdd.agents.shared.workers import WorkerPool
+    from sdd.agents.shared.communication import AgentChannel
+
+    pool = WorkerPool(
+        handlers={"quality.verifier": "sdd.agents.quality.verifier:VerificationAgent.verify"},
+        handler_kwargs={"quality.verifier": {"decisions_dir": "/tmp/decisions"}},
+        num_workers=4
+    )
+    with pool:
+        channel = AgentChannel(transport=pool)
+        message_id = channel.send(agent_input)      # dispatched to a worker
+        agent_output = channel.collect(message_id)  # waits, then audits via respond()
+"""
+
+import atexit
+import importlib
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from sdd.agents.shared.models import AgentInput, AgentOutput
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# Sentinel telling a worker to exit
+_SHUTDOWN = None
+
+
+# ===================================================================
+# Worker Process
+# ===================================================================
+
+def resolve_handler(spec: str, kwargs: Optional[Dict[str, Any]] = None) -> Callable[[AgentInput], Any]:
+    """
+    Resolve a handler import spec to a callable.
+
+    Args:
+        spec: "package.module:function" or "package.module:Class.method"
+              (Class is instantiated once with kwargs)
+        kwargs: Constructor kwargs for Class specs (optional)
+
+    Returns:
+        Callable accepting an AgentInput
+
+    Raises:
+        ValueError: If spec is malformed
+    """
+    if ":" not in spec:
+        raise ValueError(f"Handler spec must be 'module:attr', got: {spec}")
+
+    module_name, attr_path = spec.split(":", 1)
+    module = importlib.import_module(module_name)
+
+    if "." in attr_path:
+        class_name, method_name = attr_path.split(".", 1)
+        instance = getattr(module, class_name)(**(kwargs or {}))
+        return getattr(instance, method_name)
+    return getattr(module, attr_path)
+
+
+def _close_handlers(resolved: Dict[str, Callable[[AgentInput], Any]]) -> None:
+    """
+    Close agent instances behind resolved handlers (e.g., flush buffered decisions).
+
+    Worker processes exit without running atexit handlers, so agents with
+    buffered state are closed explicitly on shutdown.
+
+    Args:
+        resolved: agent_id -> resolved handler
+    """
+    for agent_id, handler in resolved.items():
+        close = getattr(getattr(handler, "__self__", None), "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.error(f"Closing handler for {agent_id} failed: {e!r}")
+
+
+def _error_output(agent_input: AgentInput, error: str) -> AgentOutput:
+    """Build a failed AgentOutput for a message that could not be processed."""
+    return AgentOutput(
+        agent_id=agent_input.agent_id,
+        task_id=agent_input.task_id,
+        success=False,
+        output_data={"error": error},
+        reasoning=f"Worker execution failed: {error}",
+        confidence=0.0,
+        next_actions=["Fix error and retry"],
+        metadata={},
+        timestamp=datetime.now()
+    )
+
+
+def _worker_main(
+    worker_id: int,
+    handlers: Dict[str, str],
+    handler_kwargs: Dict[str, Dict[str, Any]],
+    task_conn: multiprocessing.connection.Connection,
+    result_conn: multiprocessing.connection.Connection
+) -> None:
+    """
+    Worker process loop: execute AgentInputs with the registered handlers.
+
+    Args:
+        worker_id: Worker slot number
+        handlers: agent_id -> handler spec
+        handler_kwargs: agent_id -> constructor kwargs
+        task_conn: Incoming (message_id, agent_input_json) items, one at a time
+        result_conn: Outgoing (worker_id, message_id, output_json, seconds) items
+    """
+    resolved: Dict[str, Callable[[AgentInput], Any]] = {}
+
+    while True:
+        try:
+            item = task_conn.recv()
+        except EOFError:
+            # Supervisor gone
+            item = _SHUTDOWN
+        if item is _SHUTDOWN:
+            _close_handlers(resolved)
+            return
+
+        message_id, input_json = item
+        start = time.perf_counter()
+
+        agent_input = AgentInput.model_validate_json(input_json)
+        try:
+            handler = resolved.get(agent_input.agent_id)
+            if handler is None:
+                handler = resolve_handler(
+                    handlers[agent_input.agent_id],
+                    handler_kwargs.get(agent_input.agent_id)
+                )
+                resolved[agent_input.agent_id] = handler
+
+            result = handler(agent_input)
+            # Agents return either AgentOutput or its JSON-mode dict
+            output = result if isinstance(result, AgentOutput) else AgentOutput.model_validate(result)
+        except Exception as e:
+            output = _error_output(agent_input, str(e))
+
+        result_conn.send((
+            worker_id, message_id, output.model_dump_json(), time.perf_counter() - start
+        ))
+
+
+# ===================================================================
+# WorkerPool
+# ===================================================================
+
+class WorkerResult:
+    """
+    Completed remote execution.
+
+    Attributes:
+        message_id: Message identifier
+        output: AgentOutput produced by the worker
+        processing_seconds: Handler execution time in the worker
+        attempts: Number of executions (>1 after worker crashes)
+    """
+
+    def __init__(
+        self,
+        message_id: str,
+        output: AgentOutput,
+        processing_seconds: float,
+        attempts: int
+    ):
+        self.message_id = message_id
+        self.output = output
+        self.processing_seconds = processing_seconds
+        self.attempts = attempts
+
+
+class WorkerPool:
+    """
+    Supervised pool of agent worker processes.
+
+    Attributes:
+        handlers: agent_id -> handler spec ("module:Class.method")
+        handler_kwargs: agent_id -> handler constructor kwargs
+        num_workers: Number of worker processes
+        max_retries: Re-executions allowed after a worker crash
+        poll_interval: Supervisor liveness check interval (seconds)
+        restarts: Number of workers restarted after crashes
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, str],
+        handler_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+        num_workers: Optional[int] = None,
+        max_retries: int = 2,
+        poll_interval: float = 0.1,
+        start_method: Optional[str] = None
+    ):
+        """
+        Initialize Worker Pool (call start() or use as context manager).
+
+        Args:
+            handlers: agent_id -> handler spec
+            handler_kwargs: agent_id -> handler constructor kwargs (optional)
+            num_workers: Worker process count (default: CPU count)
+            max_retries: Re-executions allowed after a worker crash
+            poll_interval: Supervisor liveness check interval in seconds
+            start_method: multiprocessing start method (default: platform default)
+        """
+        self.handlers = dict(handlers)
+        self.handler_kwargs = dict(handler_kwargs or {})
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.max_retries = max_retries
+        self.poll_interval = poll_interval
+        self.restarts = 0
+
+        self._ctx = multiprocessing.get_context(start_method)
+        self._workers: List[Optional[multiprocessing.process.BaseProcess]] = [None] * self.num_workers
+        # Per worker: task pipe (to worker) and result pipe (from worker)
+        self._task_conns: List[Optional[multiprocessing.connection.Connection]] = [None] * self.num_workers
+        self._conns: List[Optional[multiprocessing.connection.Connection]] = [None] * self.num_workers
+
+        # message_id -> (input_json, attempts); messages not yet assigned, in
+        # dispatch order; assigned message by worker slot; slots told to exit
+        self._pending: Dict[str, Tuple[str, int]] = {}
+        self._backlog: Deque[Tuple[str, str]] = deque()
+        self._in_flight: Dict[int, str] = {}
+        self._shut_down: Set[int] = set()
+        self._results: Dict[str, WorkerResult] = {}
+        self._completed_order: "queue.Queue[str]" = queue.Queue()
+
+        self._lock = threading.Condition()
+        self._supervisor: Optional[threading.Thread] = None
+        self._stopping = False
+
+    # ---------------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------------
+
+    def start(self) -> "WorkerPool":
+        """
+        Start worker processes and the supervisor thread.
+
+        Returns:
+            self (for chaining)
+        """
+        if self._supervisor is not None:
+            return self
+
+        for slot in range(self.num_workers):
+            self._spawn(slot)
+
+        self._supervisor = threading.Thread(
+            target=self._supervise, name="sdd-worker-supervisor", daemon=True
+        )
+        self._supervisor.start()
+        # Stop before multiprocessing's own exit handler terminates the workers,
+        # otherwise the supervisor would see them die and respawn them
+        atexit.register(self.shutdown)
+
+        logger.info(
+            f"WorkerPool started: workers={self.num_workers}, "
+            f"agents={sorted(self.handlers)}"
+        )
+        return self
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Stop workers and supervisor.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit before terminating it
+        """
+        if self._supervisor is None:
+            return
+
+        atexit.unregister(self.shutdown)
+        with self._lock:
+            # Workers exit once the backlog is drained
+            self._stopping = True
+            self._dispatch()
+        for process in self._workers:
+            if process is None:
+                continue
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self._supervisor.join(timeout)
+        self._supervisor = None
+
+        # Collect results sent just before exit, then fail whatever is left
+        # (crashed or terminated during shutdown) so no waiter blocks forever
+        for conn in self._conns:
+            if conn is not None:
+                self._drain(conn)
+        self._fail_pending("worker pool shut down before the message completed")
+        logger.info(f"WorkerPool stopped: restarts={self.restarts}")
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    # ---------------------------------------------------------------
+    # Dispatch and results
+    # ---------------------------------------------------------------
+
+    def handles(self, agent_id: str) -> bool:
+        """Check whether agent_id is executed by this pool."""
+        return agent_id in self.handlers
+
+    def submit(self, message_id: str, agent_input: AgentInput) -> None:
+        """
+        Queue an AgentInput for execution by a worker.
+
+        Args:
+            message_id: Message identifier (result key)
+            agent_input: Input for a registered agent
+
+        Raises:
+            ValueError: If no handler is registered for the agent
+            RuntimeError: If the pool is not started
+        """
+        if not self.handles(agent_input.agent_id):
+            raise ValueError(f"No worker handler registered for agent: {agent_input.agent_id}")
+        if self._supervisor is None:
+            raise RuntimeError("WorkerPool not started")
+
+        input_json = agent_input.model_dump_json()
+        with self._lock:
+            self._pending[message_id] = (input_json, 1)
+            self._backlog.append((message_id, input_json))
+            self._dispatch()
+
+    def get_result(self, message_id: str, timeout: Optional[float] = None) -> WorkerResult:
+        """
+        Wait for a message's result.
+
+        Args:
+            message_id: Message identifier passed to submit()
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            WorkerResult for the message
+
+        Raises:
+            TimeoutError: If the result is not ready within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while message_id not in self._results:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No result for message {message_id} within {timeout}s")
+                self._lock.wait(remaining)
+            return self._results.pop(message_id)
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Yield message ids in completion order until no messages are pending.
+
+        Results already consumed through get_result() are skipped.
+
+        Args:
+            timeout: Seconds to wait for each next completion (None = forever)
+
+        Returns:
+            Iterator of message ids (pass to get_result)
+
+        Raises:
+            TimeoutError: If no completion arrives within timeout
+        """
+        while True:
+            with self._lock:
+                if not self._pending and self._completed_order.empty():
+                    return
+            try:
+                message_id = self._completed_order.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No completion within {timeout}s") from None
+            with self._lock:
+                ready = message_id in self._results
+            if ready:
+                yield message_id
+
+    def pending_count(self) -> int:
+        """Number of submitted messages without a result yet."""
+        with self._lock:
+            return len(self._pending)
+
+    # ---------------------------------------------------------------
+    # Supervision
+    # ---------------------------------------------------------------
+
+    def _spawn(self, slot: int) -> None:
+        """Start a worker process (with its own task and result pipes) in the given slot."""
+        task_reader, task_writer = self._ctx.Pipe(duplex=False)
+        reader, writer = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(slot, self.handlers, self.handler_kwargs, task_reader, writer),
+            name=f"sdd-agent-worker-{slot}",
+            daemon=True
+        )
+        process.start()
+        task_reader.close()
+        writer.close()
+
+        with self._lock:
+            for old_conn in (self._task_conns[slot], self._conns[slot]):
+                if old_conn is not None:
+                    old_conn.close()
+            self._workers[slot] = process
+            self._task_conns[slot] = task_writer
+            self._conns[slot] = reader
+
+    def _dispatch(self) -> None:
+        """
+        Assign backlog messages to idle workers (caller holds the lock).
+
+        The assignment is recorded before the message is sent, so a worker
+        that dies at any point after receiving it is retried. Once stopping
+        and the backlog is empty, idle workers are told to exit.
+        """
+        for slot, task_conn in enumerate(self._task_conns):
+            if task_conn is None or slot in self._in_flight or slot in self._shut_down:
+                continue
+            process = self._workers[slot]
+            if process is None or not process.is_alive():
+                continue
+
+            if self._backlog:
+                message_id, input_json = self._backlog.popleft()
+                self._in_flight[slot] = message_id
+                item: Any = (message_id, input_json)
+            elif self._stopping:
+                self._shut_down.add(slot)
+                item = _SHUTDOWN
+            else:
+                return
+
+            try:
+                task_conn.send(item)
+            except OSError:
+                # Worker died; _check_workers() retries its assignment
+                pass
+
+    def _supervise(self) -> None:
+        """Collect worker results and restart crashed workers."""
+        while True:
+            conns = [c for c in self._conns if c is not None]
+            for conn in multiprocessing.connection.wait(conns, timeout=self.poll_interval):
+                self._drain(conn)
+
+            with self._lock:
+                if self._stopping and not any(
+                    process is not None and process.is_alive() for process in self._workers
+                ):
+                    return
+            self._check_workers()
+
+    def _drain(self, conn: multiprocessing.connection.Connection) -> None:
+        """Handle every notification currently readable on a worker pipe."""
+        try:
+            while conn.poll():
+                self._handle_worker_message(conn.recv())
+        except (EOFError, OSError):
+            # Worker exited; give the process a moment to be reported dead
+            slot = self._conns.index(conn)
+            process = self._workers[slot]
+            if process is not None:
+                process.join(self.poll_interval)
+
+    def _handle_worker_message(self, item: Tuple[Any, ...]) -> None:
+        """Record a result from a worker and give it the next message."""
+        worker_id, message_id, output_json, processing_seconds = item
+        with self._lock:
+            if self._in_flight.get(worker_id) == message_id:
+                del self._in_flight[worker_id]
+            _input_json, attempts = self._pending.pop(message_id, ("", 1))
+            self._results[message_id] = WorkerResult(
+                message_id=message_id,
+                output=AgentOutput.model_validate_json(output_json),
+                processing_seconds=processing_seconds,
+                attempts=attempts
+            )
+            self._completed_order.put(message_id)
+            self._lock.notify_all()
+            self._dispatch()
+
+    def _fail_pending(self, error: str) -> None:
+        """Resolve every unfinished message with a failed result."""
+        with self._lock:
+            for message_id, (input_json, attempts) in self._pending.items():
+                agent_input = AgentInput.model_validate_json(input_json)
+                self._results[message_id] = WorkerResult(
+                    message_id=message_id,
+                    output=_error_output(agent_input, error),
+                    processing_seconds=0.0,
+                    attempts=attempts
+                )
+                self._completed_order.put(message_id)
+            if self._pending:
+                logger.warning(f"WorkerPool failed {len(self._pending)} unfinished messages: {error}")
+            self._pending.clear()
+            self._backlog.clear()
+            self._in_flight.clear()
+            self._lock.notify_all()
+
+    def _check_workers(self) -> None:
+        """Restart dead workers and re-queue or fail their in-flight message."""
+        for slot, process in enumerate(self._workers):
+            if process is None or process.is_alive():
+                continue
+
+            # Handle notifications the dead worker sent before exiting
+            conn = self._conns[slot]
+            if conn is not None:
+                self._drain(conn)
+
+            with self._lock:
+                if self._stopping:
+                    return
+                message_id = self._in_flight.pop(slot, None)
+                retry = None
+                if message_id is not None and message_id in self._pending:
+                    input_json, attempts = self._pending[message_id]
+                    if attempts <= self.max_retries:
+                        self._pending[message_id] = (input_json, attempts + 1)
+                        retry = (message_id, input_json)
+                        self._backlog.appendleft(retry)
+                    else:
+                        del self._pending[message_id]
+                        agent_input = AgentInput.model_validate_json(input_json)
+                        self._results[message_id] = WorkerResult(
+                            message_id=message_id,
+                            output=_error_output(
+                                agent_input,
+                                f"worker crashed {attempts} times (exitcode={process.exitcode})"
+                            ),
+                            processing_seconds=0.0,
+                            attempts=attempts
+                        )
+                        self._completed_order.put(message_id)
+                        self._lock.notify_all()
+
+            logger.warning(
+                f"Agent worker {slot} died (exitcode={process.exitcode}); restarting. "
+                f"in_flight={message_id}, retry={retry is not None}"
+            )
+            self.restarts += 1
+            self._spawn(slot)
+            with self._lock:
+                self._dispatch()
@@ -0,0 +1,129 @@
+"""
+Checkpoint Resume Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Tests for RefinementEngine._resume_from_checkpoint: a restarted loop reuses
+or finishes the sub-steps an interrupted run checkpointed.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sdd.infrastructure.path_provider")
+
+from sdd.agents.quality.models import VerificationDecision  # noqa: E402
+from sdd.refinement.checkpoint import (  # noqa: E402
+    STEP_VERIFIED,
+    CheckpointStore,
+    IterationCheckpoint,
+)
+from sdd.refinement.engine import RefinementEngine  # noqa: E402
+from sdd.refinement.models import IterationRecord, RefinementState  # noqa: E402
+from sdd.refinement.verification_cache import VerificationCache  # noqa: E402
+
+CHECKPOINT_SCORE = 0.42
+VERIFIER_SCORE = 0.61
+
+
+def _decision(score: float) -> VerificationDecision:
+    return VerificationDecision(
+        decision="insufficient",
+        quality_score=score,
+        dimension_scores={"completeness": score},
+        feedback=["Improve"],
+        violations=[],
+        passed_checks=[]
+    )
+
+
+class _Verifier:
+    """Counts verify() calls; always returns VERIFIER_SCORE."""
+
+    agent_id = "quality.verifier"
+
+    def __init__(self):
+        self.calls = 0
+
+    def verify(self, agent_input):
+        self.calls += 1
+        return {"output_data": _decision(VERIFIER_SCORE).model_dump(mode="json")}
+
+
+def _setup(tmp_path, checkpoint_round: int, artifact_hash=None):
+    """Engine (max 2 rounds) plus a task whose round 1 is saved and checkpointed."""
+    config = tmp_path / "refinement.conf"
+    config.write_text("MAX_REFINEMENT_ROUNDS=2\n")
+    state_dir = tmp_path / "state"
+    artifact = tmp_path / "plan.md"
+    artifact.write_text("# Plan\n")
+
+    engine = RefinementEngine(
+        config_path=str(config), state_dir=str(state_dir), use_checkpoints=True
+    )
+    state = RefinementState(
+        task_id=str(uuid.uuid4()), phase="planning", current_round=0, max_rounds=2
+    ).add_iteration(IterationRecord(
+        round=1,
+        timestamp=datetime.now(),
+        input_state={},
+        output_state={},
+        verification_result=_decision(0.5).model_dump(),
+        quality_score=0.5,
+        duration_seconds=0.1
+    ))
+    state.save_to_file(str(state_dir))
+    CheckpointStore(str(state_dir)).save(IterationCheckpoint(
+        task_id=state.task_id,
+        round=checkpoint_round,
+        step=STEP_VERIFIED,
+        artifact_hash=artifact_hash or VerificationCache.hash_file(str(artifact)),
+        decision=_decision(CHECKPOINT_SCORE).model_dump(mode="json"),
+        agent_invocations=["quality.verifier"]
+    ))
+    return engine, state.task_id, artifact
+
+
+def _counters(engine: RefinementEngine) -> dict:
+    return engine.instrumentation.stats()["counters"]
+
+
+def test_crash_after_verified_reuses_checkpointed_decision(tmp_path):
+    engine, task_id, artifact = _setup(tmp_path, checkpoint_round=2)
+    verifier = _Verifier()
+
+    final = engine.refine_until_sufficient(task_id, "planning", str(artifact), verifier)
+
+    assert verifier.calls == 0
+    assert final.current_round == 2
+    assert final.iterations[1].quality_score == CHECKPOINT_SCORE
+    assert _counters(engine)["checkpoint_verifications_reused"] == 1
+
+
+def test_artifact_hash_mismatch_forces_reverification(tmp_path):
+    engine, task_id, artifact = _setup(tmp_path, checkpoint_round=2, artifact_hash="stale")
+    verifier = _Verifier()
+
+    final = engine.refine_until_sufficient(task_id, "planning", str(artifact), verifier)
+
+    assert verifier.calls == 1
+    assert final.iterations[1].quality_score == VERIFIER_SCORE
+    assert "checkpoint_verifications_reused" not in _counters(engine)
+
+
+def test_crash_before_refined_applies_refinement_once(tmp_path):
+    engine, task_id, artifact = _setup(tmp_path, checkpoint_round=1)
+    verifier = _Verifier()
+    refined_rounds = []
+
+    final = engine.refine_until_sufficient(
+        task_id, "planning", str(artifact), verifier,
+        refinement_fn=lambda state: refined_rounds.append(state.current_round)
+    )
+
+    # Round 1 is refined on resume; round 2 hits max rounds before refining
+    assert refined_rounds == [1]
+    assert verifier.calls == 1
+    assert final.current_round == 2
+    assert _counters(engine)["checkpoint_refinements_resumed"] == 1
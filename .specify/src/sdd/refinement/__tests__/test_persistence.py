@@ -0,0 +1,177 @@
+"""
+Refinement State Persistence Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Tests for RefinementState snapshot + append-only iteration log persistence.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from sdd.refinement import models
+from sdd.refinement.models import IterationRecord, RefinementState
+
+STARTED = datetime(2026, 10, 19, 10, 0, 0)
+
+
+def _iteration(round_number: int, score: float = 0.5) -> IterationRecord:
+    return IterationRecord(
+        round=round_number,
+        timestamp=STARTED + timedelta(minutes=round_number),
+        input_state={"version": round_number - 1},
+        output_state={"version": round_number},
+        verification_result={
+            "decision": "insufficient",
+            "quality_score": score,
+            "feedback": [f"Feedback {round_number}"]
+        },
+        quality_score=score,
+        duration_seconds=1.0
+    )
+
+
+def _advance(state: RefinementState, rounds: int) -> RefinementState:
+    for _ in range(rounds):
+        state = state.add_iteration(_iteration(state.current_round + 1))
+    return state
+
+
+def _state() -> RefinementState:
+    return RefinementState(
+        task_id=str(uuid.uuid4()),
+        phase="planning",
+        current_round=0,
+        max_rounds=50,
+        started_at=STARTED,
+        updated_at=STARTED
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_markers():
+    yield
+    with models._persisted_lock:
+        models._persisted.clear()
+
+
+def _files(tmp_path, state: RefinementState):
+    state_file = tmp_path / f"{state.task_id}.json"
+    return state_file, RefinementState.log_path(state_file)
+
+
+def _log_lines(log_file) -> list:
+    return log_file.read_text().splitlines() if log_file.exists() else []
+
+
+def test_snapshot_and_deltas_round_trip(tmp_path):
+    state = _advance(_state(), 1)
+    state.save_to_file(str(tmp_path))
+    for _ in range(3):
+        state = _advance(state, 2)
+        state.save_to_file(str(tmp_path))
+
+    _, log_file = _files(tmp_path, state)
+    assert len(_log_lines(log_file)) == 3
+
+    loaded = RefinementState.load_from_file(state.task_id, str(tmp_path))
+    assert loaded.model_dump() == state.model_dump()
+
+
+def test_torn_last_log_line_is_ignored(tmp_path):
+    state = _advance(_state(), 1)
+    state.save_to_file(str(tmp_path))
+    state = _advance(state, 1)
+    state.save_to_file(str(tmp_path))
+
+    state_file, log_file = _files(tmp_path, state)
+    with open(log_file, "a") as f:
+        f.write('{"start": 2, "feedback_start": 2, "iterations": [{"rou')
+
+    loaded = RefinementState.load_from_file(state.task_id, str(tmp_path))
+    assert loaded.model_dump() == state.model_dump()
+
+    # The next save rewrites the snapshot instead of appending after the torn line
+    advanced = _advance(loaded, 1)
+    advanced.save_to_file(str(tmp_path))
+    assert not log_file.exists()
+    reloaded = RefinementState.load_from_file(state.task_id, str(tmp_path))
+    assert reloaded.model_dump() == advanced.model_dump()
+
+
+def test_corrupt_log_line_before_the_last_raises(tmp_path):
+    state = _advance(_state(), 1)
+    state.save_to_file(str(tmp_path))
+    state = _advance(state, 1)
+    state.save_to_file(str(tmp_path))
+
+    _, log_file = _files(tmp_path, state)
+    lines = _log_lines(log_file)
+    log_file.write_text("\n".join(["{not json", *lines]) + "\n")
+
+    with pytest.raises(ValueError, match="Corrupt refinement log line 1"):
+        RefinementState.load_from_file(state.task_id, str(tmp_path))
+
+
+def test_out_of_sequence_delta_raises(tmp_path):
+    state = _advance(_state(), 1)
+    state.save_to_file(str(tmp_path))
+    for _ in range(2):
+        state = _advance(state, 1)
+        state.save_to_file(str(tmp_path))
+
+    _, log_file = _files(tmp_path, state)
+    first, second = _log_lines(log_file)
+    delta = json.loads(second)
+    delta["start"] += 1
+    log_file.write_text(first + "\n" + json.dumps(delta) + "\n")
+
+    with pytest.raises(ValueError, match="out of sequence at line 2"):
+        RefinementState.load_from_file(state.task_id, str(tmp_path))
+
+
+def test_log_compacts_after_compact_every_deltas(tmp_path):
+    state = _advance(_state(), 1)
+    state.save_to_file(str(tmp_path), compact_every=3)
+    state_file, log_file = _files(tmp_path, state)
+
+    for expected_lines in (1, 2, 3):
+        state = _advance(state, 1)
+        state.save_to_file(str(tmp_path), compact_every=3)
+        assert len(_log_lines(log_file)) == expected_lines
+
+    state = _advance(state, 1)
+    state.save_to_file(str(tmp_path), compact_every=3)
+    assert not log_file.exists()
+    assert len(json.loads(state_file.read_text())["iterations"]) == 5
+
+    loaded = RefinementState.load_from_file(state.task_id, str(tmp_path))
+    assert loaded.model_dump() == state.model_dump()
+
+
+def test_forget_persisted_drops_marker(tmp_path):
+    state = _advance(_state(), 2)
+    state.save_to_file(str(tmp_path))
+    key = str((tmp_path / f"{state.task_id}.json").resolve())
+    assert key in models._persisted
+
+    RefinementState.forget_persisted(state.task_id, str(tmp_path))
+    assert key not in models._persisted
+
+    # Without a marker the next save rewrites the snapshot
+    state = _advance(state, 1)
+    state.save_to_file(str(tmp_path))
+    assert not RefinementState.log_path(tmp_path / f"{state.task_id}.json").exists()
+
+
+def test_persist_markers_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(models, "MAX_PERSIST_MARKERS", 2)
+    states = [_advance(_state(), 1) for _ in range(3)]
+    for state in states:
+        state.save_to_file(str(tmp_path))
+
+    keys = [str((tmp_path / f"{s.task_id}.json").resolve()) for s in states]
+    assert keys[0] not in models._persisted
+    assert keys[1] in models._persisted and keys[2] in models._persisted
@@ -0,0 +1,66 @@
+"""
+Speculative Refinement Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Tests for SpeculativeRefiner cost budget enforcement.
+"""
+
+import threading
+import uuid
+
+from sdd.agents.quality.models import VerificationDecision
+from sdd.refinement.models import RefinementState
+from sdd.refinement.speculative import SpeculativeRefiner
+
+
+def _verify(candidate_path):
+    return VerificationDecision(
+        decision="insufficient",
+        quality_score=0.5,
+        dimension_scores={"completeness": 0.5},
+        feedback=["Improve"],
+        violations=[],
+        passed_checks=[]
+    ), False
+
+
+def _run(tmp_path, cost, **kwargs):
+    started = []
+    lock = threading.Lock()
+
+    def candidate_fn(state, candidate_path, index):
+        with lock:
+            started.append(index)
+        return cost
+
+    artifact = tmp_path / "plan.md"
+    artifact.write_text("# Plan\n")
+    state = RefinementState(task_id=str(uuid.uuid4()), phase="planning", current_round=0)
+    refiner = SpeculativeRefiner(candidate_fn, num_candidates=4, **kwargs)
+    best, results = refiner.run_round(state, str(artifact), tmp_path / "candidates", _verify)
+    return started, results
+
+
+def test_budget_limits_candidates_started(tmp_path):
+    # Module docstring configuration with candidates costing the whole budget
+    started, results = _run(tmp_path, cost=0.10, cost_budget=0.10)
+    assert len(started) == 1
+    assert sum(c.cost for c in results) <= 0.10
+
+
+def test_budget_uses_observed_cost_as_estimate(tmp_path):
+    started, results = _run(tmp_path, cost=0.03, cost_budget=0.10)
+    assert len(started) == 3
+    assert sum(c.cost for c in results) <= 0.10
+
+
+def test_cost_estimate_reserves_before_start(tmp_path):
+    # Two reservations fill the budget; a third starts once 0.04 is spent
+    started, results = _run(tmp_path, cost=0.02, cost_budget=0.10, cost_estimate=0.05)
+    assert len(started) == 3
+    assert sum(c.cost for c in results) <= 0.10
+
+
+def test_no_budget_starts_every_candidate(tmp_path):
+    started, _results = _run(tmp_path, cost=1.0)
+    assert sorted(started) == [0, 1, 2, 3]
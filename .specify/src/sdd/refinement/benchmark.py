@@ -0,0 +1,559 @@
+"""
+Refinement Benchmark - Synthetic End-to-End Workload Driver
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Load-tests the refinement pipeline (RefinementEngine, VerificationAgent,
+    FeedbackAccumulator, MetricsCollector) with synthetic plan artifacts and
+    deterministic scripted refinements. Runs hundreds of concurrent refinement
+    tasks in a temporary directory and reports throughput, per-iteration
+    latency distributions, bytes written per task and peak memory, for sizing
+    workers and catching performance regressions.
+
+Constitutional Compliance:
+    - Principle I: Library-First - run_benchmark() is standalone library
+    - Principle IV: Idempotent Operations - Same seed, same artifacts and refinements
+    - Principle VII: Observability - JSON report with latency and I/O statistics
+
+Workload:
+    Each task gets a synthetic plan (`artifact_bytes` of filler text) missing
+    some of the sections and principle keywords VerificationAgent scores.
+    Each round, its ScriptedRefinement records the verifier feedback in the
+    FeedbackAccumulator and, with probability `improvement_rate` (seeded per
+    task), applies the next scripted improvement. Finished tasks are recorded
+    with MetricsCollector. Tasks run through RefinementScheduler.
+
+Report:
+    - tasks_per_second, iterations_per_second, wall_seconds
+    - iteration_latency: p50/p90/p95/p99/max of per-iteration stage totals
+    - stages: per-stage histograms from EngineInstrumentation
+    - bytes_written_per_task: bytes passed to write() (/proc/self/io, Linux)
+    - disk_bytes_per_task: final on-disk footprint, by component
+    - peak_rss_bytes (process lifetime), peak_traced_bytes (trace_memory=True)
+
+Usage:
+    from sdd.refinement.benchmark import run_benchmark
+
+    report = run_benchmark(num_tasks=200, concurrency=16)
+    print(report.format_text())
+
+CLI:
+    python -m sdd.refinement.benchmark --tasks 500 --concurrency 32 --json
+    python -m sdd.refinement.benchmark --tasks 200 --write-behind --trace-memory
+    python -m sdd.refinement.benchmark --tasks 500 --no-decision-persistence
+"""
+
+import argparse
+import json
+import logging
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sdd.agents.quality.verifier import VerificationAgent
+from sdd.feedback.accumulator import FeedbackAccumulator
+from sdd.metrics.collector import MetricsCollector
+from sdd.metrics.models import TaskMetrics
+from sdd.refinement.engine import RefinementEngine
+from sdd.refinement.instrumentation import EngineInstrumentation
+from sdd.refinement.models import RefinementState
+from sdd.refinement.persister import WriteBehindPersister
+from sdd.refinement.scheduler import RefinementJob, RefinementResult, RefinementScheduler
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# Improvements VerificationAgent rewards for "plan" artifacts (sections and
+# Principle I-III keywords), applied one per successful round
+IMPROVEMENTS = (
+    "\n## Phase 1\n\nImplement the core modules behind a standalone library interface.\n",
+    "\n## Technical Approach\n\nLayered design with explicit module boundaries.\n",
+    "\nEach component ships as a library with a CLI entry point.\n",
+    "\nTest-first: contract and integration tests are written before implementation.\n",
+    "\nAPI contract files are defined in contracts/ before any endpoint code.\n",
+)
+
+_FILLER_WORDS = (
+    "module", "service", "handler", "queue", "schema", "request", "response",
+    "cache", "index", "worker", "config", "storage", "session", "record"
+)
+
+LATENCY_QUANTILES = (0.50, 0.90, 0.95, 0.99)
+
+
+# ===================================================================
+# Synthetic Workload
+# ===================================================================
+
+def generate_artifact(path: Path, rng: random.Random, artifact_bytes: int) -> int:
+    """
+    Write a synthetic plan artifact.
+
+    Args:
+        path: Artifact path
+        rng: Seeded random generator for this task
+        artifact_bytes: Approximate size of filler text
+
+    Returns:
+        Number of scripted improvements already present (0-2)
+    """
+    lines = ["# Implementation Plan", "", "## Phase 0", ""]
+    size = 0
+    while size < artifact_bytes:
+        line = " ".join(rng.choice(_FILLER_WORDS) for _ in range(12)) + "."
+        lines.append(line)
+        size += len(line) + 1
+
+    # Some tasks start partially refined so rounds-to-threshold varies
+    already_applied = rng.randint(0, 2)
+    path.write_text("\n".join(lines) + "\n" + "".join(IMPROVEMENTS[:already_applied]))
+    return already_applied
+
+
+class ScriptedRefinement:
+    """
+    Deterministic stand-in for an LLM refinement function.
+
+    Attributes:
+        artifact_path: Artifact to refine
+        next_improvement: Index of the next IMPROVEMENTS entry to apply
+        improvement_rate: Probability a round applies an improvement
+        accumulator: FeedbackAccumulator receiving each round's feedback
+    """
+
+    def __init__(
+        self,
+        artifact_path: Path,
+        seed: int,
+        next_improvement: int,
+        improvement_rate: float,
+        accumulator: FeedbackAccumulator
+    ):
+        self.artifact_path = artifact_path
+        self.next_improvement = next_improvement
+        self.improvement_rate = improvement_rate
+        self.accumulator = accumulator
+        self._rng = random.Random(seed)
+
+    def __call__(self, state: RefinementState) -> None:
+        """Record latest feedback, then maybe apply the next improvement."""
+        latest = state.get_latest_iteration()
+        if latest is not None:
+            for feedback in latest.verification_result.get("feedback", []):
+                self.accumulator.add(
+                    task_id=state.task_id,
+                    feedback=feedback,
+                    iteration=latest.round,
+                    quality_score=latest.quality_score,
+                    agent_id="quality.verifier"
+                )
+
+        if self.next_improvement >= len(IMPROVEMENTS):
+            return
+        if self._rng.random() < self.improvement_rate:
+            with self.artifact_path.open("a") as f:
+                f.write(IMPROVEMENTS[self.next_improvement])
+            self.next_improvement += 1
+
+
+# ===================================================================
+# Report
+# ===================================================================
+
+class BenchmarkReport:
+    """
+    Benchmark results.
+
+    Attributes:
+        parameters: Benchmark parameters
+        results: Per-task outcome counts, throughput and latency statistics
+    """
+
+    def __init__(self, parameters: Dict[str, Any], results: Dict[str, Any]):
+        self.parameters = parameters
+        self.results = results
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {'parameters': self.parameters, 'results': self.results}
+
+    def format_text(self) -> str:
+        """Human-readable summary."""
+        r = self.results
+        latency = r['iteration_latency']
+        lines = [
+            "Refinement Benchmark",
+            f"  tasks:            {r['tasks']} ({r['succeeded']} succeeded, "
+            f"{r['escalated']} escalated, {r['failed']} failed)",
+            f"  iterations:       {r['iterations']} ({r['avg_rounds']:.2f} rounds/task)",
+            f"  wall time:        {r['wall_seconds']:.2f}s",
+            f"  throughput:       {r['tasks_per_second']:.2f} tasks/s, "
+            f"{r['iterations_per_second']:.2f} iterations/s",
+            "  iteration latency: " + ", ".join(
+                f"{name}={_format_seconds(latency[name])}"
+                for name in ('p50', 'p90', 'p95', 'p99', 'max')
+            ),
+        ]
+        for stage, histogram in sorted(r['stages'].items()):
+            lines.append(
+                f"    {stage:<18} mean={_format_seconds(histogram['mean_seconds'])} "
+                f"p95={_format_seconds(histogram['p95_seconds'])}"
+            )
+        written = r['bytes_written_per_task']
+        lines.append(
+            "  bytes written:    "
+            + (f"{written:,.0f}/task" if written is not None else "n/a (no /proc/self/io)")
+        )
+        lines.append(f"  disk footprint:   {r['disk_bytes_per_task']['total']:,.0f}/task")
+        for component, size in sorted(r['disk_bytes_per_task'].items()):
+            if component != 'total':
+                lines.append(f"    {component:<18} {size:,.0f}")
+        lines.append(f"  peak RSS:         {r['peak_rss_bytes'] / 2**20:,.1f} MiB")
+        if r['peak_traced_bytes'] is not None:
+            lines.append(f"  peak traced:      {r['peak_traced_bytes'] / 2**20:,.1f} MiB")
+        return "\n".join(lines)
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    """Format seconds as milliseconds."""
+    return "n/a" if seconds is None else f"{seconds * 1000:.2f}ms"
+
+
+def _quantile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank quantile of sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(q * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _io_bytes_written() -> Optional[int]:
+    """Bytes this process passed to write() so far (Linux only)."""
+    try:
+        for line in Path("/proc/self/io").read_text().splitlines():
+            if line.startswith("wchar:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss_bytes() -> int:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _dir_bytes(path: Path) -> int:
+    """Total size of files under path."""
+    if not path.exists():
+        return 0
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+# ===================================================================
+# Driver
+# ===================================================================
+
+def run_benchmark(
+    num_tasks: int = 200,
+    concurrency: int = 16,
+    artifact_bytes: int = 4096,
+    improvement_rate: float = 0.7,
+    seed: int = 0,
+    phase: str = "planning",
+    config_path: Optional[str] = None,
+    write_behind: bool = False,
+    use_verification_cache: bool = True,
+    persist_decisions: bool = True,
+    trace_memory: bool = False,
+    work_dir: Optional[str] = None
+) -> BenchmarkReport:
+    """
+    Run the synthetic refinement workload end to end.
+
+    Args:
+        num_tasks: Refinement tasks to run
+        concurrency: Loops running at once (RefinementScheduler threads)
+        artifact_bytes: Filler size of each synthetic artifact
+        improvement_rate: Probability a round applies the next improvement
+        seed: Workload seed (same seed, same workload)
+        phase: Workflow phase of every task
+        config_path: refinement.conf (None = engine default resolution)
+        write_behind: Persist states with WriteBehindPersister
+        use_verification_cache: Enable the engine's verification cache
+        persist_decisions: Write verifier decisions (False = memory only)
+        trace_memory: Track peak Python heap with tracemalloc (slower)
+        work_dir: Directory for all files (None = temporary, removed afterwards)
+
+    Returns:
+        BenchmarkReport
+
+    Raises:
+        ValueError: If num_tasks or concurrency < 1
+    """
+    if num_tasks < 1 or concurrency < 1:
+        raise ValueError(
+            f"num_tasks and concurrency must be >= 1, got: {num_tasks}, {concurrency}"
+        )
+
+    parameters = {
+        'num_tasks': num_tasks,
+        'concurrency': concurrency,
+        'artifact_bytes': artifact_bytes,
+        'improvement_rate': improvement_rate,
+        'seed': seed,
+        'phase': phase,
+        'write_behind': write_behind,
+        'use_verification_cache': use_verification_cache,
+        'persist_decisions': persist_decisions,
+        'trace_memory': trace_memory
+    }
+
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix="sdd-refinement-benchmark-")
+        work_dir = temp_dir.name
+    root = Path(work_dir)
+
+    try:
+        results = _run(root, parameters, config_path)
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    report = BenchmarkReport(parameters, results)
+    logger.info(
+        f"Benchmark complete: {results['tasks']} tasks, "
+        f"{results['tasks_per_second']:.2f} tasks/s"
+    )
+    return report
+
+
+def _run(root: Path, parameters: Dict[str, Any], config_path: Optional[str]) -> Dict[str, Any]:
+    """Build the pipeline under root, run all tasks and collect results."""
+    num_tasks = parameters['num_tasks']
+    dirs = {
+        'artifacts': root / "artifacts",
+        'refinement_state': root / "refinement-state",
+        'verifier_decisions': root / "verifier-decisions",
+        'feedback': root / "feedback",
+        'metrics': root / "metrics",
+    }
+    dirs['artifacts'].mkdir(parents=True, exist_ok=True)
+
+    persister = (
+        WriteBehindPersister(base_path=str(dirs['refinement_state']))
+        if parameters['write_behind'] else None
+    )
+    verifier_kwargs = {
+        'decisions_dir': str(dirs['verifier_decisions']),
+        'persist_decisions': parameters['persist_decisions']
+    }
+    engine_kwargs: Dict[str, Any] = {}
+    if config_path is not None:
+        verifier_kwargs['config_path'] = config_path
+        engine_kwargs['config_path'] = config_path
+
+    verifier = VerificationAgent(**verifier_kwargs)
+    accumulator = FeedbackAccumulator(
+        feedback_dir=str(dirs['feedback']),
+        archive_dir=str(dirs['feedback'] / "archive")
+    )
+    collector = MetricsCollector(
+        metrics_dir=str(dirs['metrics']),
+        baseline_file=str(dirs['metrics'] / "baseline.json")
+    )
+    engine = RefinementEngine(
+        state_dir=str(dirs['refinement_state']),
+        use_verification_cache=parameters['use_verification_cache'],
+        # Measure the engine with its optional stores enabled (off by default)
+        use_state_index=True,
+        use_checkpoints=True,
+        # Keep every iteration's timings for exact latency quantiles
+        instrumentation=EngineInstrumentation(max_recent=num_tasks * 64),
+        persister=persister,
+        **engine_kwargs
+    )
+    scheduler = RefinementScheduler(engine, max_concurrency=parameters['concurrency'])
+
+    jobs = []
+    master_rng = random.Random(parameters['seed'])
+    for i in range(num_tasks):
+        task_seed = master_rng.getrandbits(64)
+        rng = random.Random(task_seed)
+        task_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        artifact_path = dirs['artifacts'] / f"plan-{i:05d}.md"
+        applied = generate_artifact(artifact_path, rng, parameters['artifact_bytes'])
+        jobs.append(RefinementJob(
+            task_id=task_id,
+            phase=parameters['phase'],
+            artifact_path=str(artifact_path),
+            verifier=verifier,
+            refinement_fn=ScriptedRefinement(
+                artifact_path, task_seed, applied, parameters['improvement_rate'], accumulator
+            )
+        ))
+
+    if parameters['trace_memory']:
+        tracemalloc.start()
+    written_before = _io_bytes_written()
+    start = time.perf_counter()
+
+    outcomes = {'succeeded': 0, 'escalated': 0, 'failed': 0}
+    iterations = 0
+    for result in scheduler.run(jobs):
+        if result.state is None:
+            outcomes['failed'] += 1
+            logger.warning(f"Benchmark task failed: {result.job.task_id}: {result.error!r}")
+            continue
+        iterations += result.state.current_round
+        outcomes['succeeded' if result.succeeded else 'escalated'] += 1
+        collector.record_task(_task_metrics(result))
+
+    if persister is not None:
+        persister.close()
+    verifier.close()
+    wall_seconds = time.perf_counter() - start
+    written_after = _io_bytes_written()
+    peak_traced = None
+    if parameters['trace_memory']:
+        peak_traced = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    latencies = sorted(
+        sum(entry['stages'].values())
+        for entry in engine.instrumentation.iteration_timings()
+    )
+    iteration_latency = {
+        f"p{int(q * 100)}": _quantile(latencies, q) for q in LATENCY_QUANTILES
+    }
+    iteration_latency['max'] = latencies[-1] if latencies else None
+    iteration_latency['mean'] = sum(latencies) / len(latencies) if latencies else None
+
+    disk = {name: _dir_bytes(path) / num_tasks for name, path in dirs.items()}
+    disk['total'] = sum(disk.values())
+    if engine.state_index is not None:
+        engine.state_index.close()
+
+    return {
+        'tasks': num_tasks,
+        **outcomes,
+        'iterations': iterations,
+        'avg_rounds': iterations / num_tasks,
+        'wall_seconds': wall_seconds,
+        'tasks_per_second': num_tasks / wall_seconds,
+        'iterations_per_second': iterations / wall_seconds,
+        'iteration_latency': iteration_latency,
+        'stages': engine.get_stats()['stages'],
+        'bytes_written_per_task': (
+            (written_after - written_before) / num_tasks
+            if written_before is not None and written_after is not None else None
+        ),
+        'disk_bytes_per_task': disk,
+        'peak_rss_bytes': _peak_rss_bytes(),
+        'peak_traced_bytes': peak_traced
+    }
+
+
+def _task_metrics(result: RefinementResult) -> TaskMetrics:
+    """Build TaskMetrics for a finished benchmark task."""
+    state = result.state
+    scores = [iteration.quality_score for iteration in state.iterations]
+    return TaskMetrics(
+        task_id=state.task_id,
+        phase=state.phase,
+        started_at=state.started_at,
+        completed_at=datetime.now(),
+        duration_seconds=max(result.duration_seconds, 1e-6),
+        refinement_rounds=state.current_round,
+        refinement_quality_scores=scores,
+        early_stopped=state.should_early_stop(),
+        verification_checks=state.current_round,
+        verification_passes_first_time=int(
+            bool(state.iterations)
+            and state.iterations[0].verification_result.get("decision") == "sufficient"
+        ),
+        completed_without_intervention=result.succeeded,
+        escalated_to_human=not result.succeeded
+    )
+
+
+# ===================================================================
+# CLI
+# ===================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (1 if any task failed)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sdd.refinement.benchmark",
+        description="Run a synthetic end-to-end refinement workload"
+    )
+    parser.add_argument("--tasks", type=int, default=200, help="Refinement tasks to run")
+    parser.add_argument("--concurrency", type=int, default=16, help="Loops running at once")
+    parser.add_argument("--artifact-bytes", type=int, default=4096, help="Synthetic artifact size")
+    parser.add_argument("--improvement-rate", type=float, default=0.7,
+                        help="Probability a round applies an improvement")
+    parser.add_argument("--seed", type=int, default=0, help="Workload seed")
+    parser.add_argument("--phase", default="planning", help="Workflow phase of every task")
+    parser.add_argument("--config", help="Path to refinement.conf")
+    parser.add_argument("--write-behind", action="store_true",
+                        help="Persist states with WriteBehindPersister")
+    parser.add_argument("--no-verification-cache", action="store_true",
+                        help="Always invoke the verifier")
+    parser.add_argument("--no-decision-persistence", action="store_true",
+                        help="Keep verifier decisions in memory only")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Track peak Python heap with tracemalloc (slower)")
+    parser.add_argument("--work-dir", help="Keep files here instead of a temporary directory")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--log-level", default="WARNING", help="Log level during the run")
+
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    report = run_benchmark(
+        num_tasks=args.tasks,
+        concurrency=args.concurrency,
+        artifact_bytes=args.artifact_bytes,
+        improvement_rate=args.improvement_rate,
+        seed=args.seed,
+        phase=args.phase,
+        config_path=args.config,
+        write_behind=args.write_behind,
+        use_verification_cache=not args.no_verification_cache,
+        persist_decisions=not args.no_decision_persistence,
+        trace_memory=args.trace_memory,
+        work_dir=args.work_dir
+    )
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format_text())
+    return 1 if report.results['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Iteration Checkpoints - Intra-Iteration Progress for Crash Recovery
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    RefinementState is saved once per completed iteration, so a worker that
+    dies mid-iteration used to redo the interrupted verification (and, after a
+    crash between saving a round and finishing refinement_fn, verified an
+    unrefined artifact). Checkpoints record how far the round in progress got
+    so RefinementEngine can skip completed sub-steps on restart.
+
+Constitutional Compliance:
+    - Principle I: Library-First - CheckpointStore is standalone library
+    - Principle IV: Idempotent Operations - Atomic writes; stale checkpoints ignored
+    - Principle VII: Observability - Resumed sub-steps are logged
+
+Steps (one checkpoint per task, overwritten as the round progresses):
+    verified  Verification of `round` finished (decision, cache_hit, agent
+              invocations, candidates) against artifact `artifact_hash`
+    refined   refinement_fn applied after `round`; artifact now `artifact_hash`
+
+Resume Rules (state saved through round R):
+    verified, round R+1, artifact unchanged  -> reuse decision, skip verifier
+    verified, round R                        -> refinement not confirmed; apply
+                                                refinement_fn before round R+1
+    refined,  round R                        -> nothing to redo
+    anything else                            -> stale, ignored
+
+Storage:
+    Checkpoints stored at: .docs/agents/shared/refinement-state/{task_id}.checkpoint
+
+Usage:
+    from sdd.refinement.checkpoint import STEP_VERIFIED, CheckpointStore, IterationCheckpoint
+
+    store = CheckpointStore(state_dir=".docs/agents/shared/refinement-state")
+    store.save(IterationCheckpoint(task_id, 3, STEP_VERIFIED, artifact_hash, decision=...))
+    checkpoint = store.load(task_id)
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+STEP_VERIFIED = "verified"
+STEP_REFINED = "refined"
+
+
+class IterationCheckpoint:
+    """
+    Progress of one refinement round.
+
+    Attributes:
+        task_id: Task identifier
+        round: Round the checkpoint belongs to
+        step: Last completed sub-step (STEP_VERIFIED or STEP_REFINED)
+        artifact_hash: Artifact content hash after the step
+        decision: Verification decision (JSON form, verified step)
+        cache_hit: Decision came from the verification cache
+        agent_invocations: Agents invoked for the verification
+        candidates: Speculative candidate records of the round
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        round: int,
+        step: str,
+        artifact_hash: str,
+        decision: Optional[Dict[str, Any]] = None,
+        cache_hit: bool = False,
+        agent_invocations: Optional[List[str]] = None,
+        candidates: Optional[List[Dict[str, Any]]] = None
+    ):
+        self.task_id = task_id
+        self.round = round
+        self.step = step
+        self.artifact_hash = artifact_hash
+        self.decision = decision
+        self.cache_hit = cache_hit
+        self.agent_invocations = list(agent_invocations or [])
+        self.candidates = list(candidates or [])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'task_id': self.task_id,
+            'round': self.round,
+            'step': self.step,
+            'artifact_hash': self.artifact_hash,
+            'decision': self.decision,
+            'cache_hit': self.cache_hit,
+            'agent_invocations': self.agent_invocations,
+            'candidates': self.candidates
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IterationCheckpoint":
+        """Create from dictionary."""
+        return cls(
+            task_id=data['task_id'],
+            round=data['round'],
+            step=data['step'],
+            artifact_hash=data['artifact_hash'],
+            decision=data.get('decision'),
+            cache_hit=data.get('cache_hit', False),
+            agent_invocations=data.get('agent_invocations'),
+            candidates=data.get('candidates')
+        )
+
+
+class CheckpointStore:
+    """
+    Stores the latest IterationCheckpoint per task next to its state file.
+
+    Attributes:
+        state_dir: Refinement state directory
+    """
+
+    def __init__(self, state_dir: str):
+        """
+        Initialize Checkpoint Store.
+
+        Args:
+            state_dir: Refinement state directory
+        """
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def path(self, task_id: str) -> Path:
+        """Checkpoint file of a task."""
+        return self.state_dir / f"{task_id}.checkpoint"
+
+    def save(self, checkpoint: IterationCheckpoint) -> None:
+        """
+        Write a checkpoint atomically (replaces the task's previous one).
+
+        Args:
+            checkpoint: Checkpoint to write
+        """
+        checkpoint_file = self.path(checkpoint.task_id)
+        tmp_file = checkpoint_file.with_name(f".{checkpoint_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(checkpoint.to_dict()))
+        os.replace(tmp_file, checkpoint_file)
+
+    def load(self, task_id: str) -> Optional[IterationCheckpoint]:
+        """
+        Read a task's checkpoint.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            IterationCheckpoint, or None if missing or unreadable
+        """
+        checkpoint_file = self.path(task_id)
+        if not checkpoint_file.exists():
+            return None
+        try:
+            return IterationCheckpoint.from_dict(json.loads(checkpoint_file.read_text()))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {checkpoint_file}: {e}")
+            return None
+
+    def clear(self, task_id: str) -> None:
+        """
+        Delete a task's checkpoint.
+
+        Args:
+            task_id: Task identifier
+        """
+        self.path(task_id).unlink(missing_ok=True)
@@ -18,6 +18,42 @@ Configuration:
     - MAX_REFINEMENT_ROUNDS (default: 20)
     - EARLY_STOP_THRESHOLD (default: 0.95)
     - Quality thresholds per phase
+
+    Verification Cache (opt-in: use_verification_cache=True):
+    - Decisions cached by artifact/spec content hash, phase and thresholds
+    - Unchanged artifacts (no-op refinement, resumed loop) skip the verifier
+    - Hits recorded in IterationRecord.cache_hit
+
+    Stopping Policies:
+    - Optional convergence predictors (sdd.refinement.stopping) evaluated each round
+    - Stop with human escalation when the threshold is projected unreachable
+    - Shadow policies only record statistics (rounds saved vs outcomes changed)
+
+    Speculative Refinement:
+    - Optional SpeculativeRefiner generates N candidates per round concurrently
+    - Candidates verified in parallel; best quality_score promoted to the artifact
+    - All candidates recorded in IterationRecord.candidates
+
+    Instrumentation:
+    - Per-stage timings (input_state, verification, output_state, persistence,
+      refinement) aggregated into histograms; counters for engine events
+    - get_stats() returns histograms, counters, cache and stopping statistics
+    - Optional structured log events and cProfile of chosen task ids
+
+    State Index (opt-in: use_state_index=True):
+    - SQLite summary of every task (round, EMA, phase, status, updated time)
+    - Updated on each save/escalation; see sdd.refinement.state_index (query API + CLI)
+
+    Write-Behind Persistence:
+    - Optional WriteBehindPersister saves states on a background thread so the
+      next verification starts without waiting on disk; pending saves coalesce
+    - Flushed and fsynced on escalation, loop completion and shutdown
+
+    Iteration Checkpoints (opt-in: use_checkpoints=True):
+    - {task_id}.checkpoint records verification done / refinement applied and
+      the resulting artifact hash (see sdd.refinement.checkpoint)
+    - On restart, a finished verification is reused and an unconfirmed
+      refinement_fn is applied before the next round
     
     Path Resolution (Dependency Inversion Principle):
     - Uses PathProvider abstraction for path resolution
@@ -63,14 +99,33 @@ import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sdd.agents.quality.models import VerificationDecision
 from sdd.agents.quality.verifier import VerificationAgent
 from sdd.agents.shared.models import AgentContext, AgentInput
 from sdd.infrastructure.path_provider import DefaultPathProvider, PathProvider
+from sdd.refinement.checkpoint import (
+    STEP_REFINED,
+    STEP_VERIFIED,
+    CheckpointStore,
+    IterationCheckpoint,
+)
+from sdd.refinement.instrumentation import (
+    STAGE_INPUT_STATE,
+    STAGE_OUTPUT_STATE,
+    STAGE_PERSISTENCE,
+    STAGE_REFINEMENT,
+    STAGE_VERIFICATION,
+    EngineInstrumentation,
+)
 from sdd.refinement.models import IterationRecord, RefinementState
+from sdd.refinement.persister import WriteBehindPersister
+from sdd.refinement.speculative import SpeculativeRefiner
+from sdd.refinement.state_index import StateIndex
+from sdd.refinement.stopping import StoppingPolicy
+from sdd.refinement.verification_cache import VerificationCache
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -94,13 +149,30 @@ class RefinementEngine:
         max_rounds: Maximum refinement iterations (from config)
         early_stop_threshold: Quality score for early stopping (from config)
         path_provider: PathProvider instance (for dependency injection)
+        verification_cache: Cache of verification decisions (None = disabled)
+        stopping_policies: Convergence-based stopping policies (may be empty)
+        speculative: Parallel candidate refinement (None = single refinement_fn)
+        instrumentation: Stage timings, counters and profiling hook
+        state_index: Task summary index for bulk queries (None = disabled)
+        persister: Background state writer (None = save synchronously)
+        checkpoints: Intra-iteration checkpoint store (None = disabled)
     """
 
     def __init__(
         self,
         path_provider: Optional[PathProvider] = None,
         config_path: Optional[str] = None,
-        state_dir: Optional[str] = None
+        state_dir: Optional[str] = None,
+        verification_cache: Optional[VerificationCache] = None,
+        use_verification_cache: bool = False,
+        stopping_policies: Optional[List[StoppingPolicy]] = None,
+        speculative: Optional[SpeculativeRefiner] = None,
+        instrumentation: Optional[EngineInstrumentation] = None,
+        state_index: Optional[StateIndex] = None,
+        use_state_index: bool = False,
+        persister: Optional[WriteBehindPersister] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        use_checkpoints: bool = False
     ):
         """
         Initialize Refinement Engine.
@@ -114,6 +186,31 @@ class RefinementEngine:
             state_dir: Optional explicit directory for state persistence.
                        If provided, overrides path_provider for this path.
                        If None, uses path_provider.get_state_dir("refinement-state").
+            verification_cache: Optional VerificationCache instance
+                               (enables the cache).
+            use_verification_cache: Cache decisions in state_dir/verification-cache
+                                   (default off: every round invokes the verifier).
+            stopping_policies: Optional StoppingPolicy list. A non-shadow policy
+                              that predicts the threshold is unreachable stops
+                              the loop and escalates to human.
+            speculative: Optional SpeculativeRefiner. From round 2 on, each round
+                        verifies N concurrent candidates instead of applying
+                        refinement_fn, and keeps the best.
+            instrumentation: Optional EngineInstrumentation (structured log
+                            events, cProfile task ids). Default records
+                            timings and counters only.
+            state_index: Optional StateIndex instance (enables the index).
+            use_state_index: Maintain state_dir/index.db (default off).
+            persister: Optional WriteBehindPersister writing to state_dir.
+                      Iteration saves are handed to it instead of blocking
+                      the loop; it updates the state index after each write.
+
+            checkpoints: Optional CheckpointStore instance (enables checkpoints).
+            use_checkpoints: Write intra-iteration checkpoints to state_dir
+                            (default off).
+
+        Raises:
+            ValueError: If persister writes to a directory other than state_dir
 
         Note:
             Prefer using path_provider for testability and portability.
@@ -137,6 +234,43 @@ class RefinementEngine:
         self.path_provider = path_provider
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+        # Optional stores are off unless enabled or passed in
+        if verification_cache is not None:
+            self.verification_cache = verification_cache
+        elif use_verification_cache:
+            self.verification_cache = VerificationCache(
+                cache_dir=str(self.state_dir / "verification-cache")
+            )
+        else:
+            self.verification_cache = None
+
+        self.stopping_policies: List[StoppingPolicy] = list(stopping_policies or [])
+        self.speculative = speculative
+        self.instrumentation = instrumentation or EngineInstrumentation()
+
+        if state_index is not None:
+            self.state_index = state_index
+        elif use_state_index:
+            self.state_index = StateIndex(state_dir=str(self.state_dir))
+        else:
+            self.state_index = None
+
+        if persister is not None:
+            if persister.base_path.resolve() != self.state_dir.resolve():
+                raise ValueError(
+                    f"persister.base_path ({persister.base_path}) must be state_dir ({self.state_dir})"
+                )
+            if persister.on_saved is None and self.state_index is not None:
+                persister.on_saved = self.state_index.update
+        self.persister = persister
+
+        if checkpoints is not None:
+            self.checkpoints = checkpoints
+        elif use_checkpoints:
+            self.checkpoints = CheckpointStore(state_dir=str(self.state_dir))
+        else:
+            self.checkpoints = None
+
         # Load configuration
         self.config = self._load_config()
         self.max_rounds = int(self.config.get("MAX_REFINEMENT_ROUNDS", 20))
@@ -281,6 +415,12 @@ class RefinementEngine:
             f"current_round={state.current_round}, max_rounds={self.max_rounds}"
         )
 
+        # Round at which each stopping policy stopped (or would have)
+        policy_stop_rounds: List[Optional[int]] = [None] * len(self.stopping_policies)
+
+        # Skip sub-steps an interrupted run already completed
+        resumed = self._resume_from_checkpoint(state, artifact_path, refinement_fn)
+
         # Refinement loop
         while state.can_continue():
             iteration_start = time.time()
@@ -289,20 +429,68 @@ class RefinementEngine:
             logger.info(f"Refinement iteration {current_round}/{self.max_rounds}")
 
             # Capture input state
+            stage_start = time.perf_counter()
             input_state = input_state_fn() if input_state_fn else {"round": current_round}
+            self._record_stage(task_id, current_round, STAGE_INPUT_STATE, stage_start)
+
+            # Speculative round: verify N candidates, promote the best
+            stage_start = time.perf_counter()
+            candidates = None
+            if resumed is not None:
+                # Verification finished before the interruption
+                verification_result = VerificationDecision.model_validate(resumed.decision)
+                cache_hit = resumed.cache_hit
+                agent_invocations = resumed.agent_invocations
+                candidate_records = resumed.candidates
+            elif self.speculative is not None and state.current_round > 0:
+                candidates = self._run_speculative_round(
+                    state=state,
+                    phase=phase,
+                    artifact_path=artifact_path,
+                    verifier=verifier,
+                    context=context,
+                    quality_threshold=quality_threshold
+                )
 
-            # Invoke verification agent
-            verification_result = self._verify_artifact(
-                task_id=task_id,
-                phase=phase,
-                artifact_path=artifact_path,
-                verifier=verifier,
-                context=context,
-                quality_threshold=quality_threshold
-            )
+            if resumed is not None:
+                resumed = None  # only the first round after restart
+            elif candidates is not None:
+                best, results = candidates
+                verification_result, cache_hit = best.decision, best.cache_hit
+                agent_invocations = [
+                    verifier.agent_id for c in results if c.decision and not c.cache_hit
+                ]
+                candidate_records = [c.to_dict(selected=c is best) for c in results]
+            else:
+                # Invoke verification agent (or reuse cached decision)
+                verification_result, cache_hit = self._verify_artifact(
+                    task_id=task_id,
+                    phase=phase,
+                    artifact_path=artifact_path,
+                    verifier=verifier,
+                    context=context,
+                    quality_threshold=quality_threshold
+                )
+                agent_invocations = [] if cache_hit else [verifier.agent_id]
+                candidate_records = []
+
+            if self.checkpoints is not None:
+                self.checkpoints.save(IterationCheckpoint(
+                    task_id=task_id,
+                    round=current_round,
+                    step=STEP_VERIFIED,
+                    artifact_hash=VerificationCache.hash_file(artifact_path),
+                    decision=verification_result.model_dump(mode="json"),
+                    cache_hit=cache_hit,
+                    agent_invocations=agent_invocations,
+                    candidates=candidate_records
+                ))
+            self._record_stage(task_id, current_round, STAGE_VERIFICATION, stage_start)
 
             # Capture output state
+            stage_start = time.perf_counter()
             output_state = output_state_fn() if output_state_fn else {"round": current_round}
+            self._record_stage(task_id, current_round, STAGE_OUTPUT_STATE, stage_start)
 
             # Create iteration record
             iteration_duration = time.time() - iteration_start
@@ -314,18 +502,33 @@ class RefinementEngine:
                 verification_result=verification_result.model_dump(),
                 quality_score=verification_result.quality_score,
                 duration_seconds=iteration_duration,
-                agent_invocations=[verifier.agent_id]
+                agent_invocations=agent_invocations,
+                cache_hit=cache_hit,
+                candidates=candidate_records
             )
 
             # Update state
+            stage_start = time.perf_counter()
             state = state.add_iteration(iteration)
-            state.save_to_file(str(self.state_dir))
+            if self.persister is not None:
+                self.persister.submit(state)
+            else:
+                state.save_to_file(str(self.state_dir))
+                if self.state_index is not None:
+                    self.state_index.update(state)
+            self._record_stage(task_id, current_round, STAGE_PERSISTENCE, stage_start)
+
+            self.instrumentation.increment("iterations")
+            self.instrumentation.increment("verifier_invocations", len(agent_invocations))
+            self.instrumentation.increment("speculative_candidates", len(candidate_records))
+            if cache_hit:
+                self.instrumentation.increment("cache_hits")
 
             logger.info(
                 f"Iteration {current_round} complete: "
                 f"quality={verification_result.quality_score:.3f}, "
                 f"ema_quality={state.ema_quality:.3f}, "
-                f"decision={verification_result.decision.value}"
+                f"decision={verification_result.decision.value}, cache_hit={cache_hit}"
             )
 
             # Check early stopping (exceptional quality)
@@ -334,6 +537,7 @@ class RefinementEngine:
                     f"Early stopping triggered: ema_quality={state.ema_quality:.3f} >= "
                     f"threshold={self.early_stop_threshold}"
                 )
+                self._finish_loop(state, policy_stop_rounds)
                 return state
 
             # Check quality threshold met
@@ -342,6 +546,7 @@ class RefinementEngine:
                     f"Quality threshold achieved: ema_quality={state.ema_quality:.3f} >= "
                     f"threshold={quality_threshold}"
                 )
+                self._finish_loop(state, policy_stop_rounds)
                 return state
 
             # Check max rounds reached
@@ -352,16 +557,267 @@ class RefinementEngine:
                     f"Escalating to human."
                 )
                 self._escalate_to_human(state, artifact_path)
+                self._finish_loop(state, policy_stop_rounds)
+                return state
+
+            # Check convergence prediction
+            stop_reason = self._evaluate_stopping_policies(state, policy_stop_rounds)
+            if stop_reason is not None:
+                logger.warning(
+                    f"Stopping policy ended refinement at round {state.current_round}: "
+                    f"{stop_reason}. Escalating to human."
+                )
+                self._escalate_to_human(state, artifact_path, reason=stop_reason)
+                self._finish_loop(state, policy_stop_rounds)
                 return state
 
-            # Apply refinement if function provided
-            if refinement_fn:
-                logger.info("Applying refinement based on accumulated feedback")
-                refinement_fn(state)
+            # Apply refinement if function provided (speculative mode refines
+            # through candidates at the start of the next round instead)
+            if refinement_fn and self.speculative is None:
+                self._apply_refinement(state, artifact_path, refinement_fn)
 
         # If we exit loop, return final state
+        self._finish_loop(state, policy_stop_rounds)
         return state
 
+    def _apply_refinement(
+        self,
+        state: RefinementState,
+        artifact_path: str,
+        refinement_fn: Callable[[RefinementState], None]
+    ) -> None:
+        """
+        Apply refinement_fn after the latest round and checkpoint the result.
+
+        Args:
+            state: Refinement state (latest round completed)
+            artifact_path: Path to artifact
+            refinement_fn: Refinement function
+        """
+        logger.info("Applying refinement based on accumulated feedback")
+        stage_start = time.perf_counter()
+        self.instrumentation.profile_call(state.task_id, "refinement_fn", refinement_fn, state)
+        self._record_stage(state.task_id, state.current_round, STAGE_REFINEMENT, stage_start)
+        self.instrumentation.increment("refinements")
+
+        if self.checkpoints is not None:
+            self.checkpoints.save(IterationCheckpoint(
+                task_id=state.task_id,
+                round=state.current_round,
+                step=STEP_REFINED,
+                artifact_hash=VerificationCache.hash_file(artifact_path)
+            ))
+
+    def _resume_from_checkpoint(
+        self,
+        state: RefinementState,
+        artifact_path: str,
+        refinement_fn: Optional[Callable[[RefinementState], None]]
+    ) -> Optional[IterationCheckpoint]:
+        """
+        Finish or reuse sub-steps recorded by an interrupted run.
+
+        Args:
+            state: Loaded refinement state
+            artifact_path: Path to artifact
+            refinement_fn: Refinement function (optional)
+
+        Returns:
+            Verified checkpoint of the next round to reuse, or None
+        """
+        if self.checkpoints is None:
+            return None
+        checkpoint = self.checkpoints.load(state.task_id)
+        if checkpoint is None or checkpoint.step != STEP_VERIFIED:
+            return None
+
+        if checkpoint.round == state.current_round + 1:
+            if (
+                checkpoint.decision is not None
+                and checkpoint.artifact_hash == VerificationCache.hash_file(artifact_path)
+            ):
+                logger.info(
+                    f"Resuming round {checkpoint.round} of task_id={state.task_id}: "
+                    f"reusing checkpointed verification"
+                )
+                self.instrumentation.increment("checkpoint_verifications_reused")
+                return checkpoint
+            return None
+
+        if (
+            checkpoint.round == state.current_round
+            and state.can_continue()
+            and refinement_fn
+            and self.speculative is None
+        ):
+            # Round saved, but refinement_fn did not finish before the interruption
+            logger.info(
+                f"Resuming task_id={state.task_id} after round {state.current_round}: "
+                f"refinement not checkpointed, applying refinement_fn"
+            )
+            self.instrumentation.increment("checkpoint_refinements_resumed")
+            self._apply_refinement(state, artifact_path, refinement_fn)
+        return None
+
+    def _record_stage(
+        self,
+        task_id: str,
+        round_number: int,
+        stage: str,
+        stage_start: float
+    ) -> None:
+        """Record elapsed time since stage_start (perf_counter) for a stage."""
+        self.instrumentation.record_stage(
+            task_id, round_number, stage, time.perf_counter() - stage_start
+        )
+
+    def _run_speculative_round(
+        self,
+        state: RefinementState,
+        phase: str,
+        artifact_path: str,
+        verifier: VerificationAgent,
+        context: AgentContext,
+        quality_threshold: float
+    ) -> Optional[Tuple[Any, List[Any]]]:
+        """
+        Generate and verify candidates concurrently; best replaces the artifact.
+
+        Args:
+            state: Current refinement state
+            phase: Workflow phase
+            artifact_path: Path to artifact
+            verifier: VerificationAgent instance
+            context: Agent context
+            quality_threshold: Quality threshold
+
+        Returns:
+            (best CandidateResult, all CandidateResults), or None if every
+            candidate failed (caller verifies the unchanged artifact)
+        """
+        outcome = self.speculative.run_round(
+            state=state,
+            artifact_path=artifact_path,
+            candidate_dir=self.state_dir / "candidates" / state.task_id,
+            verify_fn=lambda candidate_path: self._verify_artifact(
+                task_id=state.task_id,
+                phase=phase,
+                artifact_path=candidate_path,
+                verifier=verifier,
+                context=context,
+                quality_threshold=quality_threshold
+            )
+        )
+        if outcome is None:
+            logger.warning(
+                f"All speculative candidates failed for task_id={state.task_id}; "
+                f"verifying unchanged artifact"
+            )
+        return outcome
+
+    def _evaluate_stopping_policies(
+        self,
+        state: RefinementState,
+        policy_stop_rounds: List[Optional[int]]
+    ) -> Optional[str]:
+        """
+        Evaluate stopping policies after an iteration that did not finish the loop.
+
+        Args:
+            state: Current refinement state
+            policy_stop_rounds: Per-policy stop round (updated in place)
+
+        Returns:
+            Stop reason if an enforced policy stops the loop, None otherwise
+        """
+        stop_reason = None
+        for i, policy in enumerate(self.stopping_policies):
+            if policy_stop_rounds[i] is not None:
+                continue
+            decision = policy.evaluate(state)
+            if not decision.stop:
+                continue
+            policy_stop_rounds[i] = state.current_round
+            if policy.shadow:
+                logger.info(
+                    f"Shadow stopping policy '{policy.name}' would stop at round "
+                    f"{state.current_round}: {decision.reason}"
+                )
+            elif stop_reason is None:
+                stop_reason = f"{policy.name}: {decision.reason}"
+        return stop_reason
+
+    def _finish_loop(
+        self,
+        state: RefinementState,
+        policy_stop_rounds: List[Optional[int]]
+    ) -> None:
+        """
+        Make the final state durable, drop its checkpoint and record stopping statistics.
+
+        Args:
+            state: Final refinement state
+            policy_stop_rounds: Per-policy stop round (None if never stopped)
+        """
+        if self.persister is not None:
+            self.persister.flush(state.task_id, fsync=True)
+        # Loop is over: don't pin its last iteration in the persist markers
+        RefinementState.forget_persisted(state.task_id, str(self.state_dir))
+        if self.checkpoints is not None:
+            self.checkpoints.clear(state.task_id)
+        self._record_stopping_stats(state, policy_stop_rounds)
+
+    def _record_stopping_stats(
+        self,
+        state: RefinementState,
+        policy_stop_rounds: List[Optional[int]]
+    ) -> None:
+        """
+        Record loop outcome in each stopping policy's statistics.
+
+        Args:
+            state: Final refinement state
+            policy_stop_rounds: Per-policy stop round (None if never stopped)
+        """
+        succeeded = state.ema_quality >= state.quality_threshold
+        for policy, stop_round in zip(self.stopping_policies, policy_stop_rounds):
+            policy.stats.record(
+                stop_round=stop_round,
+                final_round=state.current_round,
+                max_rounds=state.max_rounds,
+                succeeded=succeeded,
+                shadow=policy.shadow
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with stage histograms ("stages"), event counters
+            ("counters"), verification cache hit rate and stopping policy stats
+
+        Example:
+            >>> stats = engine.get_stats()
+            >>> stats["stages"]["persistence"]["p95_seconds"]
+            >>> stats["counters"]["verifier_invocations"]
+        """
+        stats = self.instrumentation.stats()
+        stats['verification_cache'] = (
+            self.verification_cache.stats() if self.verification_cache is not None else None
+        )
+        stats['stopping_policies'] = self.get_stopping_stats()
+        return stats
+
+    def get_stopping_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get statistics of configured stopping policies.
+
+        Returns:
+            List of per-policy statistics dicts (rounds saved, outcomes changed)
+        """
+        return [policy.stats.to_dict() for policy in self.stopping_policies]
+
     def _load_or_create_state(
         self,
         task_id: str,
@@ -378,6 +834,8 @@ class RefinementEngine:
             RefinementState (loaded or newly created)
         """
         state_file = self.state_dir / f"{task_id}.json"
+        if self.persister is not None:
+            self.persister.flush(task_id, fsync=False)
 
         if state_file.exists():
             logger.info(f"Loading existing refinement state: {state_file}")
@@ -406,7 +864,7 @@ class RefinementEngine:
         verifier: VerificationAgent,
         context: AgentContext,
         quality_threshold: float
-    ) -> VerificationDecision:
+    ) -> Tuple[VerificationDecision, bool]:
         """
         Args:
             task_id: Task identifier
@@ -417,8 +875,31 @@ class RefinementEngine:
             quality_threshold: Quality threshold
 
         Returns:
-            VerificationDecision from verifier
+            Tuple of (VerificationDecision, cache_hit)
         """
+        quality_thresholds = {
+            "completeness": quality_threshold,
+            "constitutional_compliance": quality_threshold,
+            "test_coverage": quality_threshold,
+            "spec_alignment": quality_threshold
+        }
+
+        # Reuse decision if artifact, spec, phase and thresholds are unchanged
+        cache_key = None
+        if self.verification_cache is not None:
+            cache_key = self.verification_cache.make_key(
+                artifact_path=artifact_path,
+                phase=phase,
+                thresholds=quality_thresholds,
+                spec_path=context.spec_path,
+                agent_id=verifier.agent_id,
+                scoring_version=verifier.scoring_version
+            )
+            cached = self.verification_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Verification cache hit: task_id={task_id}, key={cache_key[:12]}")
+                return cached, True
+
         # Create agent input
         agent_input = AgentInput(
             agent_id=verifier.agent_id,
@@ -426,30 +907,36 @@ class RefinementEngine:
             phase=phase,
             input_data={
                 "artifact_path": artifact_path,
-                "quality_thresholds": {
-                    "completeness": quality_threshold,
-                    "constitutional_compliance": quality_threshold,
-                    "test_coverage": quality_threshold,
-                    "spec_alignment": quality_threshold
-                }
+                "quality_thresholds": quality_thresholds
             },
             context=context
         )
 
-        # Invoke verifier
-        agent_output = verifier.verify(agent_input)
+        # Invoke verifier (profiled for selected task ids)
+        agent_output = self.instrumentation.profile_call(
+            task_id, "verify", verifier.verify, agent_input
+        )
+
+        # Extract verification decision (verify() returns the AgentOutput as a dict)
+        if isinstance(agent_output, dict):
+            decision_data = agent_output["output_data"]
+        else:
+            decision_data = agent_output.output_data
+        decision = VerificationDecision.model_validate(decision_data)
 
-        # Extract verification decision
-        decision_data = agent_output.output_data
-        return VerificationDecision.model_validate(decision_data)
+        if cache_key is not None:
+            self.verification_cache.put(cache_key, decision)
+        return decision, False
 
     def _escalate_to_human(
         self,
         state: RefinementState,
-        artifact_path: str
+        artifact_path: str,
+        reason: Optional[str] = None
     ) -> None:
         """
-        Escalate to human when max rounds reached without achieving quality.
+        Escalate to human when max rounds reached without achieving quality
+        (or a stopping policy predicts the threshold is unreachable).
 
         Logs full context including:
         - All iteration history
@@ -460,6 +947,7 @@ class RefinementEngine:
         Args:
             state: Final refinement state
             artifact_path: Path to artifact that failed to meet quality
+            reason: Why refinement stopped (default: max rounds reached)
         """
         escalation_msg = f"""
 ================================================================================
@@ -469,6 +957,7 @@ HUMAN ESCALATION REQUIRED
 Task ID: {state.task_id}
 Phase: {state.phase}
 Artifact: {artifact_path}
+Stop Reason: {reason or "Max refinement rounds reached"}
 
 Quality Status:
 - Current EMA Quality: {state.ema_quality:.3f}
@@ -505,6 +994,14 @@ or adjust quality thresholds if appropriate.
 """
 
         logger.error(escalation_msg)
+        self.instrumentation.increment("escalations")
+        if self.persister is not None:
+            # Index row must exist before it can be marked escalated
+            self.persister.flush(state.task_id, fsync=True)
+        if self.state_index is not None:
+            self.state_index.mark_escalated(
+                state.task_id, reason or "Max refinement rounds reached"
+            )
 
         # Save escalation report
         escalation_file = self.state_dir / f"{state.task_id}_escalation.txt"
@@ -519,6 +1016,8 @@ or adjust quality thresholds if appropriate.
         Returns:
             RefinementState if exists, None otherwise
         """
+        if self.persister is not None:
+            self.persister.flush(task_id, fsync=False)
         try:
             return RefinementState.load_from_file(task_id, str(self.state_dir))
         except FileNotFoundError:
@@ -533,6 +1032,16 @@ or adjust quality thresholds if appropriate.
             True if state was deleted, False if didn't exist
         """
         state_file = self.state_dir / f"{task_id}.json"
+        log_file = RefinementState.log_path(state_file)
+        if self.persister is not None:
+            self.persister.discard(task_id)
+        RefinementState.forget_persisted(task_id, str(self.state_dir))
+        if self.checkpoints is not None:
+            self.checkpoints.clear(task_id)
+        if log_file.exists():
+            log_file.unlink()
+        if self.state_index is not None:
+            self.state_index.remove(task_id)
         if state_file.exists():
             state_file.unlink()
             logger.info(f"Deleted refinement state: {state_file}")
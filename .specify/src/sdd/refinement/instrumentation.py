@@ -0,0 +1,327 @@
+"""
+Refinement Instrumentation - Per-Stage Timings, Counters and Profiling
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Breaks each refinement iteration into stages (input-state capture,
+    verification, output-state capture, persistence, refinement) so a slow
+    round can be attributed to the verifier, save_to_file or refinement_fn.
+    Aggregates stage timings into histograms, counts engine events, optionally
+    emits structured log events, and profiles chosen tasks with cProfile.
+
+Constitutional Compliance:
+    - Principle I: Library-First - EngineInstrumentation is standalone library
+    - Principle VII: Observability - Stage histograms, counters, log events, profiles
+
+Stages:
+    input_state, verification, output_state, persistence, refinement
+
+Structured Log Events (emit_events=True):
+    {"event": "refinement.stage", "task_id": ..., "round": 3,
+     "stage": "verification", "seconds": 0.412}
+
+Profiling:
+    Calls wrapped with profile_call() for task ids in `profile_task_ids` run
+    under cProfile every `profile_every`-th call (skipped while another call is
+    being profiled, since one profiler runs at a time); stats are dumped to
+    {profile_dir}/{task_id}_{label}_{n:04d}.prof (open with pstats or snakeviz).
+
+Usage:
+    from sdd.refinement.engine import RefinementEngine
+    from sdd.refinement.instrumentation import EngineInstrumentation
+
+    instrumentation = EngineInstrumentation(
+        emit_events=True,
+        profile_task_ids={"550e8400-e29b-41d4-a716-446655440000"},
+        profile_dir="/tmp/profiles"
+    )
+    engine = RefinementEngine(instrumentation=instrumentation)
+    ...
+    stats = engine.get_stats()
+    print(stats["stages"]["verification"]["p95_seconds"])
+"""
+
+import bisect
+import cProfile
+import json
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+STAGE_INPUT_STATE = "input_state"
+STAGE_VERIFICATION = "verification"
+STAGE_OUTPUT_STATE = "output_state"
+STAGE_PERSISTENCE = "persistence"
+STAGE_REFINEMENT = "refinement"
+
+# Histogram bucket upper bounds (seconds); last bucket is unbounded
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+# ===================================================================
+# StageHistogram
+# ===================================================================
+
+class StageHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Attributes:
+        buckets: Bucket upper bounds (seconds)
+        counts: Observations per bucket (len(buckets) + 1, last = overflow)
+        count: Total observations
+        total_seconds: Sum of observations
+        min_seconds: Smallest observation
+        max_seconds: Largest observation
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.min_seconds: Optional[float] = None
+        self.max_seconds: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.min_seconds = seconds if self.min_seconds is None else min(self.min_seconds, seconds)
+        self.max_seconds = seconds if self.max_seconds is None else max(self.max_seconds, seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile (upper bound of the bucket containing it).
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated seconds (max observation for the overflow bucket), None if empty
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if i == len(self.buckets):
+                    return self.max_seconds
+                return min(self.buckets[i], self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'count': self.count,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.count if self.count else None,
+            'min_seconds': self.min_seconds,
+            'max_seconds': self.max_seconds,
+            'p50_seconds': self.quantile(0.50),
+            'p95_seconds': self.quantile(0.95),
+            'p99_seconds': self.quantile(0.99),
+            'buckets': {
+                **{f"le_{bound:g}": n for bound, n in zip(self.buckets, self.counts)},
+                'overflow': self.counts[-1]
+            }
+        }
+
+
+# ===================================================================
+# EngineInstrumentation
+# ===================================================================
+
+class EngineInstrumentation:
+    """
+    Collects per-stage timings and counters for RefinementEngine.
+
+    Attributes:
+        emit_events: Log a structured JSON event per stage timing
+        profile_task_ids: Task ids whose wrapped calls are profiled
+        profile_dir: Directory for .prof files
+        profile_every: Profile every Nth wrapped call per task and label
+        max_recent: Per-iteration timing records kept in memory
+    """
+
+    def __init__(
+        self,
+        emit_events: bool = False,
+        profile_task_ids: Optional[Iterable[str]] = None,
+        profile_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/refinement-state/profiles",
+        profile_every: int = 1,
+        max_recent: int = 1000
+    ):
+        """
+        Initialize Engine Instrumentation.
+
+        Args:
+            emit_events: Log a structured JSON event per stage timing
+            profile_task_ids: Task ids to profile (None = profiling off)
+            profile_dir: Directory for .prof files
+            profile_every: Profile every Nth call (1 = every call)
+            max_recent: Per-iteration timing records kept in memory
+        """
+        if profile_every < 1:
+            raise ValueError(f"profile_every must be >= 1, got: {profile_every}")
+
+        self.emit_events = emit_events
+        self.profile_task_ids = set(profile_task_ids or [])
+        self.profile_dir = Path(profile_dir)
+        self.profile_every = profile_every
+        self.max_recent = max_recent
+
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=max_recent)
+        self._open: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._profile_calls: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        # Only one cProfile profiler may be active per process
+        self._profile_lock = threading.Lock()
+
+    # ---------------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------------
+
+    def record_stage(self, task_id: str, round_number: int, stage: str, seconds: float) -> None:
+        """
+        Record one stage timing.
+
+        Args:
+            task_id: Task identifier
+            round_number: Iteration round
+            stage: Stage name (STAGE_* constant)
+            seconds: Elapsed seconds
+        """
+        with self._lock:
+            self._histograms.setdefault(stage, StageHistogram()).observe(seconds)
+
+            key = (task_id, round_number)
+            entry = self._open.get(key)
+            if entry is None:
+                entry = {'task_id': task_id, 'round': round_number, 'stages': {}}
+                self._open[key] = entry
+                self._recent.append(entry)
+                if len(self._open) > self.max_recent:
+                    self._open.pop(next(iter(self._open)))
+            entry['stages'][stage] = entry['stages'].get(stage, 0.0) + seconds
+
+        if self.emit_events:
+            logger.info(json.dumps({
+                'event': 'refinement.stage',
+                'task_id': task_id,
+                'round': round_number,
+                'stage': stage,
+                'seconds': seconds
+            }))
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """
+        Increment an event counter.
+
+        Args:
+            counter: Counter name (e.g., "verifier_invocations")
+            amount: Increment
+        """
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    # ---------------------------------------------------------------
+    # Profiling
+    # ---------------------------------------------------------------
+
+    def profile_call(self, task_id: str, label: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call fn, under cProfile if task_id is selected for profiling.
+
+        Args:
+            task_id: Task identifier
+            label: Call label used in the profile file name (e.g., "verify")
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            fn's return value
+        """
+        if task_id not in self.profile_task_ids:
+            return fn(*args, **kwargs)
+
+        with self._lock:
+            key = (task_id, label)
+            call_number = self._profile_calls.get(key, 0) + 1
+            self._profile_calls[key] = call_number
+
+        if (call_number - 1) % self.profile_every:
+            return fn(*args, **kwargs)
+
+        # Concurrent calls (speculative candidates) skip profiling while
+        # another profile is running
+        if not self._profile_lock.acquire(blocking=False):
+            return fn(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(fn, *args, **kwargs)
+        finally:
+            self._profile_lock.release()
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profile_file = self.profile_dir / f"{task_id}_{label}_{call_number:04d}.prof"
+            profiler.dump_stats(str(profile_file))
+            logger.info(f"Profile saved: {profile_file}")
+
+    # ---------------------------------------------------------------
+    # Stats API
+    # ---------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get aggregated stage histograms and counters.
+
+        Returns:
+            {"stages": {stage: histogram dict}, "counters": {name: count}}
+        """
+        with self._lock:
+            return {
+                'stages': {stage: h.to_dict() for stage, h in self._histograms.items()},
+                'counters': dict(self._counters)
+            }
+
+    def iteration_timings(self, task_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get recent per-iteration stage timings.
+
+        Args:
+            task_id: Filter by task (None = all)
+
+        Returns:
+            List of {"task_id", "round", "stages": {stage: seconds}}
+        """
+        with self._lock:
+            entries = [
+                {**e, 'stages': dict(e['stages'])} for e in self._recent
+                if task_id is None or e['task_id'] == task_id
+            ]
+        return entries
+
+    def reset(self) -> None:
+        """Drop all recorded timings and counters."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._recent.clear()
+            self._open.clear()
@@ -40,18 +40,50 @@ Usage:
         updated_at=datetime.now()
     )
 
-    # Save to file
-    state_path = Path(f".docs/agents/shared/refinement-state/{state.task_id}.json")
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(state.model_dump_json(indent=2))
+    # Save to file (snapshot + append-only iteration log)
+    state.save_to_file(".docs/agents/shared/refinement-state")
+    state = RefinementState.load_from_file(state.task_id, ".docs/agents/shared/refinement-state")
+
+Persistence Format:
+    {task_id}.json       Base snapshot (full RefinementState JSON)
+    {task_id}.log.jsonl  Append-only deltas since the snapshot, one line per save:
+                         {"start": <iterations already persisted>,
+                          "feedback_start": <feedback items already persisted>,
+                          "iterations": [...new IterationRecords...],
+                          "feedback": [...new feedback...],
+                          "state": {...scalar fields...}}
+    Compaction rewrites the snapshot (and drops the log) every
+    `compact_every` deltas, so each save costs O(new iterations).
 """
 
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from sdd.agents.shared.persistent import PersistentList
+
+logger = logging.getLogger(__name__)
+
+
+# Smoothing factor of RefinementState.ema_quality
+EMA_ALPHA = 0.3
+
+# Deltas appended to the iteration log before the snapshot is rewritten
+DEFAULT_COMPACT_EVERY = 32
+
+# Fields stored as deltas; everything else is written in full on each save
+_DELTA_FIELDS = {"iterations", "cumulative_feedback"}
+
+# State files whose persist marker is kept (least recently saved dropped first)
+MAX_PERSIST_MARKERS = 1024
+
 
 # ===================================================================
 # IterationRecord (T026)
@@ -73,6 +105,10 @@ class IterationRecord(BaseModel):
         quality_score: Quality score for this iteration (0.0 to 1.0)
         duration_seconds: Time taken for iteration
         agent_invocations: Agents invoked this iteration
+        cache_hit: True if the verification decision was reused from the
+            verification cache (verifier not invoked)
+        candidates: Speculative candidates evaluated this round (empty
+            unless speculative refinement is enabled)
 
     Validation:
         - round must match position in iterations list (enforced by RefinementState)
@@ -145,6 +181,16 @@ class IterationRecord(BaseModel):
         description="Agents invoked this iteration"
     )
 
+    cache_hit: bool = Field(
+        False,
+        description="Verification decision reused from cache (verifier not invoked)"
+    )
+
+    candidates: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Speculative candidates evaluated this round (index, quality_score, cost, selected)"
+    )
+
     model_config = {
         "frozen": True,  # Immutable after creation (audit trail)
         "json_schema_extra": {
@@ -169,7 +215,9 @@ class IterationRecord(BaseModel):
                     },
                     "quality_score": 0.78,
                     "duration_seconds": 45.2,
-                    "agent_invocations": ["quality.verifier", "architecture.router"]
+                    "agent_invocations": ["quality.verifier", "architecture.router"],
+                    "cache_hit": False,
+                    "candidates": []
                 }
             ]
         }
@@ -188,6 +236,41 @@ class IterationRecord(BaseModel):
         return self
 
 
+# ===================================================================
+# Persistence bookkeeping
+# ===================================================================
+
+class _PersistMarker:
+    """What has been written for one state file (iteration/feedback counts)."""
+
+    def __init__(
+        self,
+        iteration_count: int,
+        feedback_count: int,
+        last_iteration: Optional[IterationRecord],
+        log_entries: int
+    ):
+        self.iteration_count = iteration_count
+        self.feedback_count = feedback_count
+        self.last_iteration = last_iteration
+        self.log_entries = log_entries
+
+
+# Resolved snapshot path -> marker (states are immutable and share history,
+# so a state extends the persisted one iff it holds the same last iteration).
+# A missing marker only costs a snapshot rewrite on the next save.
+_persisted: "OrderedDict[str, _PersistMarker]" = OrderedDict()
+_persisted_lock = threading.Lock()
+
+
+def _remember_marker(key: str, marker: _PersistMarker) -> None:
+    """Store a marker, evicting the least recently saved beyond MAX_PERSIST_MARKERS."""
+    _persisted[key] = marker
+    _persisted.move_to_end(key)
+    while len(_persisted) > MAX_PERSIST_MARKERS:
+        _persisted.popitem(last=False)
+
+
 # ===================================================================
 # RefinementState (T025)
 # ===================================================================
@@ -221,6 +304,7 @@ class RefinementState(BaseModel):
     State Transitions:
         1. Initialize at round 0
         2. Each iteration: increment current_round, append IterationRecord
+           (iterations/cumulative_feedback are PersistentLists shared between states)
         3. Terminal states: quality achieved OR max_rounds reached
 
     Storage:
@@ -269,13 +353,13 @@ class RefinementState(BaseModel):
         description="Maximum iterations allowed (default 20 from refinement.conf)"
     )
 
-    iterations: List[IterationRecord] = Field(
-        default_factory=list,
+    iterations: PersistentList[IterationRecord] = Field(
+        default_factory=PersistentList,
         description="History of all iterations (chronologically ordered)"
     )
 
-    cumulative_feedback: List[str] = Field(
-        default_factory=list,
+    cumulative_feedback: PersistentList[str] = Field(
+        default_factory=PersistentList,
         description="Accumulated feedback from all iterations"
     )
 
@@ -435,18 +519,18 @@ class RefinementState(BaseModel):
         # Calculate new EMA quality (exponential moving average)
         # EMA formula: new_ema = alpha * new_value + (1 - alpha) * old_ema
         # Use alpha = 0.3 for reasonable smoothing
-        alpha = 0.3
+        alpha = EMA_ALPHA
         new_ema = alpha * iteration.quality_score + (1 - alpha) * self.ema_quality
 
-        # Accumulate feedback from verification result
-        new_feedback = self.cumulative_feedback.copy()
-        if "feedback" in iteration.verification_result:
-            new_feedback.extend(iteration.verification_result["feedback"])
+        # Accumulate feedback from verification result (shares existing items)
+        new_feedback = self.cumulative_feedback.extend(
+            iteration.verification_result.get("feedback", [])
+        )
 
         return self.model_copy(
             update={
                 "current_round": self.current_round + 1,
-                "iterations": self.iterations + [iteration],
+                "iterations": self.iterations.append(iteration),
                 "cumulative_feedback": new_feedback,
                 "ema_quality": new_ema,
                 "updated_at": datetime.now(),
@@ -468,15 +552,25 @@ class RefinementState(BaseModel):
         """
         return self.iterations[-1] if self.iterations else None
 
-    def save_to_file(self, base_path: str = ".docs/agents/shared/refinement-state") -> Path:
+    def save_to_file(
+        self,
+        base_path: str = ".docs/agents/shared/refinement-state",
+        compact_every: int = DEFAULT_COMPACT_EVERY
+    ) -> Path:
         """
-        Save refinement state to JSON file.
+        Save refinement state (snapshot plus append-only iteration log).
+
+        If this state extends the last one saved to the same file, only the
+        new iterations and feedback are appended to {task_id}.log.jsonl.
+        Otherwise, or once the log holds `compact_every` deltas, the full
+        snapshot is rewritten and the log removed.
 
         Args:
             base_path: Base directory for state files (default from constitution)
+            compact_every: Deltas appended before the snapshot is rewritten
 
         Returns:
-            Path to saved file
+            Path to snapshot file
 
         Example:
             >>> state = RefinementState(...)
@@ -487,10 +581,98 @@ class RefinementState(BaseModel):
         state_dir.mkdir(parents=True, exist_ok=True)
 
         state_file = state_dir / f"{self.task_id}.json"
-        state_file.write_text(self.model_dump_json(indent=2))
+        key = str(state_file.resolve())
+
+        with _persisted_lock:
+            marker = _persisted.get(key)
+            if (
+                marker is not None
+                and state_file.exists()
+                and self._extends(marker)
+                and marker.log_entries < compact_every
+            ):
+                self._append_delta(state_file, marker)
+                _persisted.move_to_end(key)
+            else:
+                self._write_snapshot(state_file)
+                _remember_marker(key, _PersistMarker(
+                    iteration_count=len(self.iterations),
+                    feedback_count=len(self.cumulative_feedback),
+                    last_iteration=self.iterations[-1] if self.iterations else None,
+                    log_entries=0
+                ))
 
         return state_file
 
+    @staticmethod
+    def forget_persisted(
+        task_id: str,
+        base_path: str = ".docs/agents/shared/refinement-state"
+    ) -> None:
+        """
+        Drop the in-memory record of what was saved for a task (e.g., after
+        its loop finished or on reset). The next save rewrites the snapshot.
+
+        Args:
+            task_id: Task identifier
+            base_path: Base directory for state files
+        """
+        state_file = Path(base_path) / f"{task_id}.json"
+        with _persisted_lock:
+            _persisted.pop(str(state_file.resolve()), None)
+
+    @staticmethod
+    def log_path(state_file: Path) -> Path:
+        """
+        Get iteration log path for a snapshot file.
+
+        Args:
+            state_file: Snapshot path ({task_id}.json)
+
+        Returns:
+            Log path ({task_id}.log.jsonl)
+        """
+        return state_file.with_name(f"{state_file.stem}.log.jsonl")
+
+    def _extends(self, marker: _PersistMarker) -> bool:
+        """Check whether this state's history extends the persisted history."""
+        if len(self.iterations) < marker.iteration_count:
+            return False
+        if len(self.cumulative_feedback) < marker.feedback_count:
+            return False
+        if marker.iteration_count == 0:
+            return True
+        return self.iterations[marker.iteration_count - 1] is marker.last_iteration
+
+    def _append_delta(self, state_file: Path, marker: _PersistMarker) -> None:
+        """Append new iterations, feedback and current scalar fields to the log."""
+        new_iterations = self.iterations[marker.iteration_count:]
+        delta = {
+            "start": marker.iteration_count,
+            "feedback_start": marker.feedback_count,
+            "iterations": [i.model_dump(mode="json") for i in new_iterations],
+            "feedback": list(self.cumulative_feedback[marker.feedback_count:]),
+            "state": self.model_dump(mode="json", exclude=_DELTA_FIELDS),
+        }
+        with open(self.log_path(state_file), "a") as f:
+            f.write(json.dumps(delta, separators=(",", ":")) + "\n")
+
+        marker.iteration_count = len(self.iterations)
+        marker.feedback_count = len(self.cumulative_feedback)
+        if new_iterations:
+            marker.last_iteration = self.iterations[-1]
+        marker.log_entries += 1
+
+    def _write_snapshot(self, state_file: Path) -> None:
+        """Write full snapshot atomically, then drop the (now folded-in) log."""
+        tmp_file = state_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(self.model_dump_json(indent=2))
+        os.replace(tmp_file, state_file)
+
+        log_file = self.log_path(state_file)
+        if log_file.exists():
+            log_file.unlink()
+
     @classmethod
     def load_from_file(cls, task_id: str, base_path: str = ".docs/agents/shared/refinement-state") -> "RefinementState":
         """
@@ -511,4 +693,55 @@ class RefinementState(BaseModel):
         if not state_file.exists():
             raise FileNotFoundError(f"Refinement state not found: {state_file}")
 
-        return cls.model_validate_json(state_file.read_text())
+        data = json.loads(state_file.read_text())
+        log_entries = 0
+        torn = False
+
+        log_file = cls.log_path(state_file)
+        if log_file.exists():
+            lines = log_file.read_text().splitlines()
+            for line_number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    delta = json.loads(line)
+                except json.JSONDecodeError as e:
+                    if line_number == len(lines):
+                        # Torn final append (crash mid-write): never completed
+                        logger.warning(f"Ignoring incomplete last line of {log_file}")
+                        torn = True
+                        break
+                    raise ValueError(
+                        f"Corrupt refinement log line {line_number}: {log_file}"
+                    ) from e
+
+                persisted = (len(data["iterations"]), len(data["cumulative_feedback"]))
+                start = (delta["start"], delta["feedback_start"])
+                end = (start[0] + len(delta["iterations"]), start[1] + len(delta["feedback"]))
+                if start != persisted:
+                    if end[0] <= persisted[0] and end[1] <= persisted[1]:
+                        continue  # Already folded into snapshot (crash during compaction)
+                    raise ValueError(
+                        f"Refinement log out of sequence at line {line_number}: "
+                        f"start={start}, persisted={persisted} ({log_file})"
+                    )
+                data["iterations"].extend(delta["iterations"])
+                data["cumulative_feedback"].extend(delta["feedback"])
+                data.update(delta["state"])
+                log_entries += 1
+
+        state = cls.model_validate(data)
+
+        with _persisted_lock:
+            if torn:
+                # Next save rewrites the snapshot instead of appending after garbage
+                _persisted.pop(str(state_file.resolve()), None)
+                return state
+            _remember_marker(str(state_file.resolve()), _PersistMarker(
+                iteration_count=len(state.iterations),
+                feedback_count=len(state.cumulative_feedback),
+                last_iteration=state.iterations[-1] if state.iterations else None,
+                log_entries=log_entries
+            ))
+
+        return state
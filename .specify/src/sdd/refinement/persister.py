@@ -0,0 +1,240 @@
+"""
+Write-Behind Persister - Background RefinementState Saves
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Takes RefinementState persistence off the refinement loop's critical path.
+    The loop hands each new state to a background writer and starts the next
+    verification immediately; saves still pending for the same task are
+    coalesced, so only the latest state is written. Saves are made durable
+    (fsync) on escalation, loop completion and shutdown.
+
+Constitutional Compliance:
+    - Principle I: Library-First - WriteBehindPersister is standalone library
+    - Principle IV: Idempotent Operations - Latest state wins; re-saving is safe
+    - Principle VII: Observability - Save/coalesce counters
+
+Crash Recovery:
+    State files are written with RefinementState.save_to_file (snapshot plus
+    append-only log), so a crash leaves the last written state loadable. A
+    crash can lose only saves still queued; the loop resumes from the last
+    written round and repeats the lost rounds.
+
+Usage:
+    from sdd.refinement.engine import RefinementEngine
+    from sdd.refinement.persister import WriteBehindPersister
+
+    persister = WriteBehindPersister(base_path="/tmp/refinement-state")
+    engine = RefinementEngine(state_dir="/tmp/refinement-state", persister=persister)
+    ...
+    persister.close()  # flush + fsync (also registered with atexit)
+"""
+
+import atexit
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sdd.refinement.models import DEFAULT_COMPACT_EVERY, RefinementState
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def fsync_path(path: Path) -> None:
+    """
+    Flush a file (or directory entry table) to stable storage.
+
+    Args:
+        path: File or directory (missing paths are ignored)
+    """
+    if not path.exists():
+        return
+    flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) if path.is_dir() else os.O_RDONLY
+    fd = os.open(str(path), flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class WriteBehindPersister:
+    """
+    Background writer for refinement states.
+
+    Attributes:
+        base_path: State directory passed to save_to_file
+        compact_every: Log compaction interval passed to save_to_file
+        on_saved: Callback run after each write (e.g., StateIndex.update)
+        saves: States written
+        coalesced: States replaced by a newer one before being written
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        on_saved: Optional[Any] = None
+    ):
+        """
+        Initialize and start the background writer.
+
+        Args:
+            base_path: State directory
+            compact_every: Log compaction interval
+            on_saved: Callable(state) run after each write (optional)
+        """
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.compact_every = compact_every
+        self.on_saved = on_saved
+        self.saves = 0
+        self.coalesced = 0
+
+        self._pending: Dict[str, RefinementState] = {}
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()  # one writer per file at a time
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        # Performance: saves run on a background thread, off the loop's critical path
+        self._thread = threading.Thread(
+            target=self._run, name="refinement-persister", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+        logger.info(f"WriteBehindPersister started: base_path={self.base_path}")
+
+    def submit(self, state: RefinementState) -> None:
+        """
+        Queue a state for writing (replaces a pending state of the same task).
+
+        Args:
+            state: State to persist
+
+        Raises:
+            RuntimeError: If the persister is closed or a background write failed
+        """
+        self._raise_if_failed()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("WriteBehindPersister is closed")
+            if state.task_id in self._pending:
+                self.coalesced += 1
+            self._pending[state.task_id] = state
+            self._condition.notify()
+
+    def flush(self, task_id: Optional[str] = None, fsync: bool = True) -> None:
+        """
+        Write pending state(s) now, optionally making them durable.
+
+        Args:
+            task_id: Task to flush (None = all tasks)
+            fsync: fsync state files and directory after writing
+
+        Raises:
+            RuntimeError: If a background write failed
+        """
+        with self._condition:
+            if task_id is None:
+                states = list(self._pending.values())
+                self._pending.clear()
+            else:
+                state = self._pending.pop(task_id, None)
+                states = [state] if state is not None else []
+
+        # Waits for an in-flight background write of the same file
+        with self._write_lock:
+            for state in states:
+                self._save(state)
+            if fsync:
+                task_ids = [task_id] if task_id is not None else self._state_task_ids()
+                for tid in task_ids:
+                    state_file = self.base_path / f"{tid}.json"
+                    fsync_path(state_file)
+                    fsync_path(RefinementState.log_path(state_file))
+                fsync_path(self.base_path)
+
+        self._raise_if_failed()
+
+    def discard(self, task_id: str) -> None:
+        """
+        Drop a pending state without writing it (e.g., before reset).
+
+        Args:
+            task_id: Task identifier
+        """
+        with self._condition:
+            self._pending.pop(task_id, None)
+        with self._write_lock:
+            pass  # wait out an in-flight write of the task
+
+    def pending_count(self) -> int:
+        """Number of states waiting to be written."""
+        with self._condition:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Flush and fsync all pending states, then stop the writer (idempotent)."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush(fsync=True)
+        atexit.unregister(self.close)
+        logger.info(
+            f"WriteBehindPersister closed: saves={self.saves}, coalesced={self.coalesced}"
+        )
+
+    # ---------------------------------------------------------------
+    # Background writer
+    # ---------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Write pending states until closed."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                task_id = next(iter(self._pending))
+                # Hold the write lock before releasing the pending entry so
+                # flush() cannot observe "not pending" while it is being written
+                self._write_lock.acquire()
+                state = self._pending.pop(task_id)
+            try:
+                self._save(state)
+            except BaseException as e:
+                logger.error(f"Background save failed for task_id={task_id}: {e!r}")
+                self._error = e
+            finally:
+                self._write_lock.release()
+
+    def _save(self, state: RefinementState) -> None:
+        """Write one state and run the on_saved callback (caller holds write lock)."""
+        state.save_to_file(str(self.base_path), compact_every=self.compact_every)
+        self.saves += 1
+        if self.on_saved is not None:
+            self.on_saved(state)
+
+    def _state_task_ids(self) -> List[str]:
+        """Task ids with a snapshot in base_path."""
+        return [
+            p.stem for p in self.base_path.glob("*.json")
+        ]
+
+    def _raise_if_failed(self) -> None:
+        """Re-raise a background write failure in the caller's thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Background refinement state save failed: {error!r}") from error
@@ -0,0 +1,348 @@
+"""
+Refinement Scheduler - Concurrent Multi-Artifact Refinement
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Runs many RefinementEngine.refine_until_sufficient loops concurrently so the
+    refinement phase of a workflow (spec, plan, contracts, tasks) takes roughly
+    as long as the slowest artifact instead of the sum of all of them.
+
+Constitutional Compliance:
+    - Principle I: Library-First - RefinementScheduler is standalone library
+    - Principle IV: Idempotent Operations - Each job keeps its own persisted state
+    - Principle VII: Observability - Per-job results with duration and error
+
+Scheduling:
+    - Global limit: at most `max_concurrency` loops run at once
+    - Per-phase quotas: at most `phase_quotas[phase]` loops of a phase at once
+    - Fair interleaving: pending jobs are dispatched round-robin across phases,
+      so one phase with many artifacts cannot starve the others
+    - Results are yielded in completion order
+
+Executors:
+    - "thread" (default): loops share the engine; suited to I/O-bound verifiers
+    - "process": engine, verifier and callbacks must be picklable
+      (module-level functions, not lambdas or closures)
+
+Usage:
+    from sdd.refinement.engine import RefinementEngine
+    from sdd.refinement.scheduler import RefinementJob, RefinementScheduler
+    from sdd.agents.quality.verifier import VerificationAgent
+
+    engine = RefinementEngine()
+    verifier = VerificationAgent()
+    scheduler = RefinementScheduler(
+        engine, max_concurrency=4, phase_quotas={"planning": 2}
+    )
+
+    jobs = [
+        RefinementJob(task_id=spec_task, phase="specification",
+                      artifact_path="spec.md", verifier=verifier),
+        RefinementJob(task_id=plan_task, phase="planning",
+                      artifact_path="plan.md", verifier=verifier),
+    ]
+    for result in scheduler.run(jobs):
+        print(result.job.artifact_path, result.succeeded, result.duration_seconds)
+"""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+from sdd.agents.quality.verifier import VerificationAgent
+from sdd.agents.shared.models import AgentContext
+from sdd.refinement.engine import RefinementEngine
+from sdd.refinement.models import RefinementState
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+# ===================================================================
+# Job and Result Models
+# ===================================================================
+
+class RefinementJob:
+    """
+    One artifact to refine (arguments of refine_until_sufficient).
+
+    Attributes:
+        task_id: Task identifier (UUID format, unique among running jobs)
+        phase: Workflow phase (used for quotas and interleaving)
+        artifact_path: Path to artifact being refined
+        verifier: VerificationAgent instance
+        context: Agent context (optional)
+        input_state_fn: Input state snapshot function (optional)
+        output_state_fn: Output state snapshot function (optional)
+        refinement_fn: Refinement function (optional)
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        phase: str,
+        artifact_path: str,
+        verifier: VerificationAgent,
+        context: Optional[AgentContext] = None,
+        input_state_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+        output_state_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+        refinement_fn: Optional[Callable[[RefinementState], None]] = None
+    ):
+        self.task_id = task_id
+        self.phase = phase
+        self.artifact_path = artifact_path
+        self.verifier = verifier
+        self.context = context
+        self.input_state_fn = input_state_fn
+        self.output_state_fn = output_state_fn
+        self.refinement_fn = refinement_fn
+
+
+class RefinementResult:
+    """
+    Outcome of one refinement job.
+
+    Attributes:
+        job: The job that ran
+        state: Final RefinementState (None if the loop raised)
+        error: Exception raised by the loop (None on success)
+        duration_seconds: Wall-clock time from dispatch to completion
+    """
+
+    def __init__(
+        self,
+        job: RefinementJob,
+        state: Optional[RefinementState],
+        error: Optional[BaseException],
+        duration_seconds: float
+    ):
+        self.job = job
+        self.state = state
+        self.error = error
+        self.duration_seconds = duration_seconds
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the loop finished and met the phase quality threshold."""
+        return (
+            self.state is not None
+            and self.state.ema_quality >= self.state.quality_threshold
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'task_id': self.job.task_id,
+            'phase': self.job.phase,
+            'artifact_path': self.job.artifact_path,
+            'succeeded': self.succeeded,
+            'rounds': self.state.current_round if self.state else None,
+            'ema_quality': self.state.ema_quality if self.state else None,
+            'error': repr(self.error) if self.error else None,
+            'duration_seconds': self.duration_seconds
+        }
+
+
+def _run_job(engine: RefinementEngine, job: RefinementJob) -> RefinementState:
+    """Run one refinement loop (module-level so process pools can pickle it)."""
+    return engine.refine_until_sufficient(
+        task_id=job.task_id,
+        phase=job.phase,
+        artifact_path=job.artifact_path,
+        verifier=job.verifier,
+        context=job.context,
+        input_state_fn=job.input_state_fn,
+        output_state_fn=job.output_state_fn,
+        refinement_fn=job.refinement_fn
+    )
+
+
+# ===================================================================
+# RefinementScheduler
+# ===================================================================
+
+class RefinementScheduler:
+    """
+    Concurrent scheduler for refinement loops.
+
+    Attributes:
+        engine: RefinementEngine running each loop
+        max_concurrency: Global limit on concurrently running loops
+        phase_quotas: Per-phase limits (phases not listed are bounded only
+            by max_concurrency)
+        executor_type: "thread" or "process"
+    """
+
+    def __init__(
+        self,
+        engine: RefinementEngine,
+        max_concurrency: int = 4,
+        phase_quotas: Optional[Dict[str, int]] = None,
+        executor_type: str = EXECUTOR_THREAD
+    ):
+        """
+        Initialize Refinement Scheduler.
+
+        Args:
+            engine: RefinementEngine instance
+            max_concurrency: Maximum loops running at once (>= 1)
+            phase_quotas: Maximum loops per phase running at once (each >= 1)
+            executor_type: "thread" or "process"
+
+        Raises:
+            ValueError: If limits are not positive or executor_type is unknown
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got: {max_concurrency}")
+        phase_quotas = {p.lower(): q for p, q in (phase_quotas or {}).items()}
+        for phase, quota in phase_quotas.items():
+            if quota < 1:
+                raise ValueError(f"Quota for phase '{phase}' must be >= 1, got: {quota}")
+        if executor_type not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(
+                f"executor_type must be '{EXECUTOR_THREAD}' or '{EXECUTOR_PROCESS}', "
+                f"got: {executor_type}"
+            )
+
+        self.engine = engine
+        self.max_concurrency = max_concurrency
+        self.phase_quotas = phase_quotas
+        self.executor_type = executor_type
+
+        logger.info(
+            f"RefinementScheduler initialized: max_concurrency={max_concurrency}, "
+            f"phase_quotas={phase_quotas}, executor={executor_type}"
+        )
+
+    def run(self, jobs: Iterable[RefinementJob]) -> Iterator[RefinementResult]:
+        """
+        Run refinement jobs concurrently, yielding results as they finish.
+
+        A job that raises produces a result with `error` set; other jobs keep
+        running. Closing the generator early cancels jobs not yet dispatched
+        and waits for running ones.
+
+        Args:
+            jobs: Jobs to run (task_ids must be unique)
+
+        Yields:
+            RefinementResult in completion order
+
+        Raises:
+            ValueError: If two jobs share a task_id (they would share state)
+
+        Example:
+            >>> scheduler = RefinementScheduler(engine, max_concurrency=4)
+            >>> for result in scheduler.run(jobs):
+            ...     if not result.succeeded:
+            ...         print(f"Needs attention: {result.job.artifact_path}")
+        """
+        jobs = list(jobs)
+        seen = set()
+        for job in jobs:
+            if job.task_id in seen:
+                raise ValueError(f"Duplicate task_id in refinement jobs: {job.task_id}")
+            seen.add(job.task_id)
+
+        # Per-phase FIFO queues; dict order is the round-robin order
+        pending: "OrderedDict[str, Deque[RefinementJob]]" = OrderedDict()
+        for job in jobs:
+            pending.setdefault(job.phase.lower(), deque()).append(job)
+
+        running: Dict[Future, RefinementJob] = {}
+        started: Dict[Future, float] = {}
+        running_per_phase: Dict[str, int] = {phase: 0 for phase in pending}
+
+        logger.info(f"Scheduling {len(jobs)} refinement jobs across {len(pending)} phases")
+
+        executor = self._create_executor(min(self.max_concurrency, max(len(jobs), 1)))
+        try:
+            while pending or running:
+                # Dispatch round-robin while capacity remains
+                while len(running) < self.max_concurrency:
+                    phase = self._next_phase(pending, running_per_phase)
+                    if phase is None:
+                        break
+                    job = pending[phase].popleft()
+                    if not pending[phase]:
+                        del pending[phase]
+                    else:
+                        pending.move_to_end(phase)
+
+                    future = executor.submit(_run_job, self.engine, job)
+                    running[future] = job
+                    started[future] = time.perf_counter()
+                    running_per_phase[phase] += 1
+                    logger.info(
+                        f"Refinement job started: task_id={job.task_id}, phase={phase}, "
+                        f"running={len(running)}"
+                    )
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    running_per_phase[job.phase.lower()] -= 1
+                    duration = time.perf_counter() - started.pop(future)
+
+                    error = future.exception()
+                    if error is not None:
+                        logger.error(f"Refinement job failed: task_id={job.task_id}: {error!r}")
+                        result = RefinementResult(job, None, error, duration)
+                    else:
+                        result = RefinementResult(job, future.result(), None, duration)
+                        logger.info(
+                            f"Refinement job finished: task_id={job.task_id}, "
+                            f"ema_quality={result.state.ema_quality:.3f}, "
+                            f"duration={duration:.2f}s"
+                        )
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run_all(self, jobs: Iterable[RefinementJob]) -> List[RefinementResult]:
+        """
+        Run refinement jobs and collect all results (completion order).
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            List of RefinementResult
+        """
+        return list(self.run(jobs))
+
+    def _next_phase(
+        self,
+        pending: "OrderedDict[str, Deque[RefinementJob]]",
+        running_per_phase: Dict[str, int]
+    ) -> Optional[str]:
+        """Get the first phase in round-robin order that is under its quota."""
+        for phase in pending:
+            quota = self.phase_quotas.get(phase)
+            if quota is None or running_per_phase[phase] < quota:
+                return phase
+        return None
+
+    def _create_executor(self, workers: int) -> Executor:
+        """Create thread or process pool."""
+        # Performance: loops run in parallel; each job has its own task_id state file
+        if self.executor_type == EXECUTOR_PROCESS:
+            return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="refinement")
@@ -0,0 +1,270 @@
+"""
+Speculative Refinement - Parallel Candidate Generation per Round
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Cuts wall-clock time of refinement loops whose refinement functions are
+    slow and stochastic (LLM calls). Each round generates N candidate
+    refinements concurrently, verifies every candidate as soon as it is
+    written, and promotes the best candidate by quality_score to the artifact.
+
+Constitutional Compliance:
+    - Principle I: Library-First - SpeculativeRefiner is standalone library
+    - Principle IV: Idempotent Operations - Candidates written to their own files;
+      the artifact is replaced atomically with the winner
+    - Principle VII: Observability - Every candidate recorded in IterationRecord
+
+Candidate Function:
+    candidate_fn(state, candidate_path, index) -> Optional[float]
+        state: RefinementState (accumulated feedback, iteration history)
+        candidate_path: Copy of the current artifact to rewrite in place
+        index: Candidate number within the round (0-based)
+        returns: Cost of producing the candidate (None counts as 1.0)
+
+Budgets (per round):
+    - max_concurrency: candidates generated/verified at once
+    - cost_budget: a candidate starts only if the cost spent plus the cost
+      reserved for running candidates plus its own estimate fits the budget.
+      The estimate is cost_estimate if given, else the highest cost reported
+      so far this round; until a cost is known, candidates start one at a time.
+
+Usage:
+    from sdd.refinement.engine import RefinementEngine
+    from sdd.refinement.speculative import SpeculativeRefiner
+
+    def rewrite_plan(state, candidate_path, index):
+        text = call_llm(Path(candidate_path).read_text(), state.cumulative_feedback)
+        Path(candidate_path).write_text(text)
+        return 0.02  # dollars
+
+    engine = RefinementEngine(
+        speculative=SpeculativeRefiner(rewrite_plan, num_candidates=4, cost_budget=0.10)
+    )
+"""
+
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sdd.agents.quality.models import VerificationDecision
+from sdd.refinement.models import RefinementState
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# (candidate_path) -> (decision, cache_hit)
+VerifyFn = Callable[[str], Tuple[VerificationDecision, bool]]
+
+
+class CandidateResult:
+    """
+    One speculative candidate.
+
+    Attributes:
+        index: Candidate number within the round
+        path: Candidate file
+        cost: Cost reported by candidate_fn
+        decision: Verification decision (None if generation failed)
+        cache_hit: Decision reused from verification cache
+        duration_seconds: Generation plus verification time
+        error: Failure message (None on success)
+    """
+
+    def __init__(self, index: int, path: str):
+        self.index = index
+        self.path = path
+        self.cost = 0.0
+        self.decision: Optional[VerificationDecision] = None
+        self.cache_hit = False
+        self.duration_seconds = 0.0
+        self.error: Optional[str] = None
+
+    def to_dict(self, selected: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary for IterationRecord.candidates."""
+        return {
+            'index': self.index,
+            'quality_score': self.decision.quality_score if self.decision else None,
+            'decision': self.decision.decision.value if self.decision else None,
+            'cache_hit': self.cache_hit,
+            'cost': self.cost,
+            'duration_seconds': self.duration_seconds,
+            'error': self.error,
+            'selected': selected
+        }
+
+
+class SpeculativeRefiner:
+    """
+    Generates, verifies and selects candidate refinements for one round.
+
+    Attributes:
+        candidate_fn: Function producing one candidate (see module docstring)
+        num_candidates: Candidates per round
+        max_concurrency: Candidates in flight at once
+        cost_budget: Maximum cost per round (None = unlimited)
+        cost_estimate: Cost reserved per started candidate (None = learn per round)
+        keep_candidates: Keep losing candidate files for inspection
+    """
+
+    def __init__(
+        self,
+        candidate_fn: Callable[[RefinementState, str, int], Optional[float]],
+        num_candidates: int = 3,
+        max_concurrency: Optional[int] = None,
+        cost_budget: Optional[float] = None,
+        cost_estimate: Optional[float] = None,
+        keep_candidates: bool = False
+    ):
+        """
+        Initialize Speculative Refiner.
+
+        Args:
+            candidate_fn: Function producing one candidate
+            num_candidates: Candidates per round (>= 1)
+            max_concurrency: Candidates in flight at once (default: num_candidates)
+            cost_budget: Maximum cost per round (None = unlimited)
+            cost_estimate: Cost reserved for each candidate before it starts
+                          (None = highest cost reported so far this round)
+            keep_candidates: Keep losing candidate files
+
+        Raises:
+            ValueError: If num_candidates or max_concurrency < 1
+        """
+        max_concurrency = max_concurrency or num_candidates
+        if num_candidates < 1 or max_concurrency < 1:
+            raise ValueError(
+                f"num_candidates and max_concurrency must be >= 1, "
+                f"got: {num_candidates}, {max_concurrency}"
+            )
+        self.candidate_fn = candidate_fn
+        self.num_candidates = num_candidates
+        self.max_concurrency = max_concurrency
+        self.cost_budget = cost_budget
+        self.cost_estimate = cost_estimate
+        self.keep_candidates = keep_candidates
+
+    def run_round(
+        self,
+        state: RefinementState,
+        artifact_path: str,
+        candidate_dir: Path,
+        verify_fn: VerifyFn
+    ) -> Optional[Tuple[CandidateResult, List[CandidateResult]]]:
+        """
+        Generate and verify candidates, then promote the best to artifact_path.
+
+        Args:
+            state: Current refinement state
+            artifact_path: Artifact being refined (replaced by the winner)
+            candidate_dir: Directory for candidate files
+            verify_fn: Verifies a candidate file
+
+        Returns:
+            (best, all candidates in index order), or None if every candidate failed
+        """
+        candidate_dir.mkdir(parents=True, exist_ok=True)
+        artifact = Path(artifact_path)
+        round_number = state.current_round + 1
+
+        results: List[CandidateResult] = []
+        # future -> (candidate, cost reserved for it)
+        running: Dict[Future, Tuple[CandidateResult, float]] = {}
+        spent = 0.0
+        estimate = self.cost_estimate
+
+        # Performance: candidates are generated and verified concurrently
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="candidate"
+        ) as executor:
+            while True:
+                while (
+                    len(running) < self.max_concurrency
+                    and len(results) < self.num_candidates
+                    and self._within_budget(spent, running, estimate)
+                ):
+                    index = len(results)
+                    path = candidate_dir / f"r{round_number:02d}_c{index}{artifact.suffix}"
+                    shutil.copyfile(artifact, path)
+                    candidate = CandidateResult(index, str(path))
+                    results.append(candidate)
+                    future = executor.submit(self._run_candidate, state, candidate, verify_fn)
+                    running[future] = (candidate, estimate or 0.0)
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    candidate, _reserved = running.pop(future)
+                    spent += candidate.cost
+                    if self.cost_estimate is None:
+                        estimate = max(estimate or 0.0, candidate.cost)
+
+        if len(results) < self.num_candidates:
+            logger.info(
+                f"Cost budget reached: {len(results)}/{self.num_candidates} candidates "
+                f"started (spent={spent:.3f}, budget={self.cost_budget})"
+            )
+
+        verified = [c for c in results if c.decision is not None]
+        best = max(verified, key=lambda c: c.decision.quality_score, default=None)
+
+        if best is not None:
+            tmp_file = artifact.with_name(f".{artifact.name}.{os.getpid()}.tmp")
+            shutil.copyfile(best.path, tmp_file)
+            os.replace(tmp_file, artifact)
+            logger.info(
+                f"Round {round_number}: candidate {best.index} selected "
+                f"(quality={best.decision.quality_score:.3f}) from {len(verified)} verified"
+            )
+
+        if not self.keep_candidates:
+            for candidate in results:
+                Path(candidate.path).unlink(missing_ok=True)
+
+        if best is None:
+            return None
+        return best, results
+
+    def _within_budget(
+        self,
+        spent: float,
+        running: Dict[Future, Tuple[CandidateResult, float]],
+        estimate: Optional[float]
+    ) -> bool:
+        """Check whether one more candidate fits the cost budget."""
+        if self.cost_budget is None:
+            return True
+        if estimate is None:
+            # No cost known yet: one candidate at a time
+            return not running and spent < self.cost_budget
+        reserved = sum(cost for _candidate, cost in running.values())
+        return spent + reserved + estimate <= self.cost_budget
+
+    def _run_candidate(
+        self,
+        state: RefinementState,
+        candidate: CandidateResult,
+        verify_fn: VerifyFn
+    ) -> None:
+        """Generate one candidate and verify it (runs in a worker thread)."""
+        start = time.perf_counter()
+        cost = None
+        try:
+            cost = self.candidate_fn(state, candidate.path, candidate.index)
+            candidate.decision, candidate.cache_hit = verify_fn(candidate.path)
+        except Exception as e:
+            candidate.error = f"{type(e).__name__}: {e}"
+            logger.warning(f"Candidate {candidate.index} failed: {candidate.error}")
+        finally:
+            candidate.cost = 1.0 if cost is None else float(cost)
+            candidate.duration_seconds = time.perf_counter() - start
@@ -0,0 +1,444 @@
+"""
+Refinement State Index - Bulk Queries over Refinement Tasks
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Keeps one SQLite row per refinement task (phase, round, EMA quality,
+    status, timestamps) so operational questions ("tasks stuck > 10 rounds
+    below 0.7 EMA", "phases with the most escalations") are answered without
+    loading every refinement-state/*.json file. RefinementEngine (with
+    use_state_index=True) updates the index on every save and escalation.
+
+Constitutional Compliance:
+    - Principle I: Library-First - StateIndex is standalone library
+    - Principle IV: Idempotent Operations - update() upserts; rebuild() is repeatable
+    - Principle VII: Observability - Query API and CLI over all tasks
+
+Status Values:
+    in_progress  Loop can continue
+    succeeded    EMA quality >= phase threshold
+    max_rounds   Round limit reached below threshold
+    escalated    Escalated to human (sticky until the task is reset)
+
+Storage:
+    Index stored at: .docs/agents/shared/refinement-state/index.db
+
+Usage:
+    from sdd.refinement.state_index import StateIndex
+
+    index = StateIndex(state_dir=".docs/agents/shared/refinement-state")
+    stuck = index.query(min_round=11, max_ema=0.7, status="in_progress")
+    by_phase = index.count_by("phase", status="escalated")
+
+CLI:
+    python -m sdd.refinement.state_index --state-dir DIR query --min-round 11 --max-ema 0.7
+    python -m sdd.refinement.state_index --state-dir DIR count-by phase --status escalated
+    python -m sdd.refinement.state_index --state-dir DIR rebuild
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sdd.refinement.models import RefinementState
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+INDEX_FILENAME = "index.db"
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_MAX_ROUNDS = "max_rounds"
+STATUS_ESCALATED = "escalated"
+
+# Columns usable in query ordering and count_by grouping
+INDEX_COLUMNS = (
+    "task_id", "phase", "current_round", "max_rounds", "ema_quality",
+    "quality_threshold", "status", "started_at", "updated_at"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    phase TEXT NOT NULL,
+    current_round INTEGER NOT NULL,
+    max_rounds INTEGER NOT NULL,
+    ema_quality REAL NOT NULL,
+    quality_threshold REAL NOT NULL,
+    status TEXT NOT NULL,
+    escalation_reason TEXT,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, phase);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks (updated_at);
+"""
+
+
+def derive_status(state: RefinementState) -> str:
+    """
+    Derive index status from a refinement state (escalation is recorded separately).
+
+    Args:
+        state: Refinement state
+
+    Returns:
+        Status value
+    """
+    if state.ema_quality >= state.quality_threshold:
+        return STATUS_SUCCEEDED
+    if state.current_round >= state.max_rounds:
+        return STATUS_MAX_ROUNDS
+    return STATUS_IN_PROGRESS
+
+
+# ===================================================================
+# StateIndex
+# ===================================================================
+
+class StateIndex:
+    """
+    SQLite index of refinement task summaries.
+
+    Attributes:
+        state_dir: Refinement state directory
+        db_path: Index database path
+    """
+
+    def __init__(
+        self,
+        state_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/refinement-state",
+        db_path: Optional[str] = None
+    ):
+        """
+        Open (or create) the state index.
+
+        Args:
+            state_dir: Refinement state directory (used by rebuild)
+            db_path: Index database path (default: state_dir/index.db)
+        """
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path) if db_path else self.state_dir / INDEX_FILENAME
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ---------------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------------
+
+    def update(self, state: RefinementState) -> None:
+        """
+        Upsert a task summary (escalated status is preserved).
+
+        Args:
+            state: Refinement state just saved
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO tasks (task_id, phase, current_round, max_rounds, ema_quality, "
+                "quality_threshold, status, started_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(task_id) DO UPDATE SET "
+                "phase = excluded.phase, current_round = excluded.current_round, "
+                "max_rounds = excluded.max_rounds, ema_quality = excluded.ema_quality, "
+                "quality_threshold = excluded.quality_threshold, "
+                "status = CASE WHEN tasks.status = ? THEN tasks.status ELSE excluded.status END, "
+                "started_at = excluded.started_at, updated_at = excluded.updated_at",
+                (
+                    state.task_id,
+                    state.phase,
+                    state.current_round,
+                    state.max_rounds,
+                    state.ema_quality,
+                    state.quality_threshold,
+                    derive_status(state),
+                    state.started_at.isoformat(),
+                    state.updated_at.isoformat(),
+                    STATUS_ESCALATED,
+                )
+            )
+
+    def mark_escalated(self, task_id: str, reason: Optional[str] = None) -> None:
+        """
+        Record that a task was escalated to human.
+
+        Args:
+            task_id: Task identifier
+            reason: Stop reason (optional)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE tasks SET status = ?, escalation_reason = ? WHERE task_id = ?",
+                (STATUS_ESCALATED, reason, task_id)
+            )
+
+    def remove(self, task_id: str) -> None:
+        """
+        Remove a task from the index.
+
+        Args:
+            task_id: Task identifier
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the index from the state files in state_dir.
+
+        Escalation (and its stop reason) is detected from
+        {task_id}_escalation.txt reports.
+
+        Returns:
+            Number of tasks indexed
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks")
+
+        count = 0
+        for state_file in sorted(self.state_dir.glob("*.json")):
+            try:
+                state = RefinementState.load_from_file(state_file.stem, str(self.state_dir))
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable state file {state_file}: {e}")
+                continue
+            self.update(state)
+            escalation_file = self.state_dir / f"{state.task_id}_escalation.txt"
+            if escalation_file.exists():
+                reason = None
+                for line in escalation_file.read_text().splitlines():
+                    if line.startswith("Stop Reason: "):
+                        reason = line[len("Stop Reason: "):]
+                        break
+                self.mark_escalated(state.task_id, reason)
+            count += 1
+
+        logger.info(f"State index rebuilt: {count} tasks from {self.state_dir}")
+        return count
+
+    # ---------------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------------
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one task summary.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task summary dict, or None if not indexed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def query(
+        self,
+        phase: Optional[str] = None,
+        status: Optional[str] = None,
+        min_round: Optional[int] = None,
+        max_round: Optional[int] = None,
+        min_ema: Optional[float] = None,
+        max_ema: Optional[float] = None,
+        updated_before: Optional[str] = None,
+        updated_after: Optional[str] = None,
+        order_by: str = "updated_at",
+        descending: bool = True,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query task summaries (all filters are combined with AND).
+
+        Args:
+            phase: Workflow phase
+            status: Status value
+            min_round: Minimum current_round (inclusive)
+            max_round: Maximum current_round (inclusive)
+            min_ema: Minimum EMA quality (inclusive)
+            max_ema: Maximum EMA quality (exclusive, "below")
+            updated_before: ISO timestamp upper bound (exclusive)
+            updated_after: ISO timestamp lower bound (inclusive)
+            order_by: Column to sort by
+            descending: Sort descending
+            limit: Maximum rows
+
+        Returns:
+            List of task summary dicts
+
+        Raises:
+            ValueError: If order_by is not an index column
+
+        Example:
+            >>> index.query(min_round=11, max_ema=0.7, status="in_progress")
+        """
+        if order_by not in INDEX_COLUMNS:
+            raise ValueError(f"order_by must be one of {INDEX_COLUMNS}, got: {order_by}")
+
+        clauses = []
+        params: List[Any] = []
+        for clause, value in (
+            ("phase = ?", phase),
+            ("status = ?", status),
+            ("current_round >= ?", min_round),
+            ("current_round <= ?", max_round),
+            ("ema_quality >= ?", min_ema),
+            ("ema_quality < ?", max_ema),
+            ("updated_at < ?", updated_before),
+            ("updated_at >= ?", updated_after),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = "SELECT * FROM tasks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_by(self, column: str, status: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count tasks grouped by a column (largest groups first).
+
+        Args:
+            column: Column to group by (e.g., "phase", "status")
+            status: Only count tasks with this status
+
+        Returns:
+            {value: count}
+
+        Raises:
+            ValueError: If column is not an index column
+
+        Example:
+            >>> index.count_by("phase", status="escalated")
+            {'planning': 7, 'specification': 2}
+        """
+        if column not in INDEX_COLUMNS:
+            raise ValueError(f"column must be one of {INDEX_COLUMNS}, got: {column}")
+
+        sql = f"SELECT {column} AS value, COUNT(*) AS n FROM tasks"
+        params: List[Any] = []
+        if status is not None:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += f" GROUP BY {column} ORDER BY n DESC"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return {row["value"]: row["n"] for row in rows}
+
+    def close(self) -> None:
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
+
+
+# ===================================================================
+# CLI
+# ===================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sdd.refinement.state_index",
+        description="Query the refinement state index"
+    )
+    parser.add_argument(
+        "--state-dir",
+        default="/workspaces/sdd-agentic-framework/.docs/agents/shared/refinement-state",
+        help="Refinement state directory"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="List tasks matching filters")
+    query_parser.add_argument("--phase")
+    query_parser.add_argument("--status")
+    query_parser.add_argument("--min-round", type=int)
+    query_parser.add_argument("--max-round", type=int)
+    query_parser.add_argument("--min-ema", type=float)
+    query_parser.add_argument("--max-ema", type=float)
+    query_parser.add_argument("--updated-before")
+    query_parser.add_argument("--updated-after")
+    query_parser.add_argument("--order-by", default="updated_at", choices=INDEX_COLUMNS)
+    query_parser.add_argument("--ascending", action="store_true")
+    query_parser.add_argument("--limit", type=int)
+
+    count_parser = subparsers.add_parser("count-by", help="Count tasks grouped by a column")
+    count_parser.add_argument("column", choices=INDEX_COLUMNS)
+    count_parser.add_argument("--status")
+
+    get_parser = subparsers.add_parser("get", help="Show one task")
+    get_parser.add_argument("task_id")
+
+    subparsers.add_parser("rebuild", help="Rebuild index from state files")
+
+    args = parser.parse_args(argv)
+    index = StateIndex(state_dir=args.state_dir)
+    try:
+        if args.command == "query":
+            result: Any = index.query(
+                phase=args.phase,
+                status=args.status,
+                min_round=args.min_round,
+                max_round=args.max_round,
+                min_ema=args.min_ema,
+                max_ema=args.max_ema,
+                updated_before=args.updated_before,
+                updated_after=args.updated_after,
+                order_by=args.order_by,
+                descending=not args.ascending,
+                limit=args.limit
+            )
+        elif args.command == "count-by":
+            result = index.count_by(args.column, status=args.status)
+        elif args.command == "get":
+            result = index.get(args.task_id)
+            if result is None:
+                print(f"Task not indexed: {args.task_id}", file=sys.stderr)
+                return 1
+        else:
+            result = {"indexed": index.rebuild()}
+    finally:
+        index.close()
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+Stopping Policies - Convergence Prediction for the Refinement Loop
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Lets RefinementEngine stop a refinement loop early (with human escalation)
+    when the quality trajectory shows the phase threshold cannot be reached in
+    the remaining rounds, instead of burning all MAX_REFINEMENT_ROUNDS on a
+    plateau. Policies are pluggable and keep statistics on rounds saved versus
+    outcomes changed.
+
+Constitutional Compliance:
+    - Principle I: Library-First - Policies are standalone library
+    - Principle IV: Idempotent Operations - Decisions depend only on state
+    - Principle VII: Observability - Per-policy stop statistics
+
+Shadow Mode:
+    A policy with shadow=True is evaluated every round but never stops the
+    loop. When the loop ends, the engine records whether the task still
+    reached its threshold after the round the policy would have stopped at.
+    Those cases count as outcomes changed, so a policy can be measured
+    before it is enforced.
+
+Usage:
+    from sdd.refinement.engine import RefinementEngine
+    from sdd.refinement.stopping import TrendProjectionPolicy
+
+    policy = TrendProjectionPolicy(min_rounds=3, window=5)
+    engine = RefinementEngine(stopping_policies=[policy])
+    ...
+    print(policy.stats.to_dict())
+    # {'policy': 'trend_projection', 'tasks': 12, 'early_stops': 4,
+    #  'rounds_saved': 51, 'outcomes_changed': 0, ...}
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from sdd.refinement.models import EMA_ALPHA, RefinementState
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# ===================================================================
+# Decisions and Statistics
+# ===================================================================
+
+class StopDecision:
+    """
+    Result of evaluating a stopping policy.
+
+    Attributes:
+        stop: True if the loop should stop now
+        reason: Human-readable explanation (included in escalation report)
+        projected_quality: Best EMA quality projected within remaining rounds
+    """
+
+    def __init__(
+        self,
+        stop: bool,
+        reason: str = "",
+        projected_quality: Optional[float] = None
+    ):
+        self.stop = stop
+        self.reason = reason
+        self.projected_quality = projected_quality
+
+
+class StoppingPolicyStats:
+    """
+    Aggregate outcomes of a stopping policy.
+
+    Attributes:
+        policy: Policy name
+        tasks: Loops the policy was evaluated on
+        early_stops: Loops stopped (or, in shadow mode, that would have stopped)
+        rounds_saved: Rounds not run because of early stops
+        outcomes_changed: Shadow stops where the task went on to reach its
+            threshold (the early stop would have changed the outcome)
+    """
+
+    def __init__(self, policy: str):
+        self.policy = policy
+        self.tasks = 0
+        self.early_stops = 0
+        self.rounds_saved = 0
+        self.outcomes_changed = 0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        stop_round: Optional[int],
+        final_round: int,
+        max_rounds: int,
+        succeeded: bool,
+        shadow: bool
+    ) -> None:
+        """
+        Record the outcome of one loop.
+
+        Args:
+            stop_round: Round the policy stopped (or would have), None if never
+            final_round: Round the loop actually ended at
+            max_rounds: Round limit of the loop
+            succeeded: Whether the loop reached its quality threshold
+            shadow: Whether the policy ran in shadow mode
+        """
+        with self._lock:
+            self.tasks += 1
+            if stop_round is None:
+                return
+            self.early_stops += 1
+            if shadow:
+                # Rounds the policy would have saved against the actual run
+                self.rounds_saved += final_round - stop_round
+                if succeeded:
+                    self.outcomes_changed += 1
+            else:
+                self.rounds_saved += max_rounds - stop_round
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'policy': self.policy,
+            'tasks': self.tasks,
+            'early_stops': self.early_stops,
+            'rounds_saved': self.rounds_saved,
+            'outcomes_changed': self.outcomes_changed,
+            'avg_rounds_saved': self.rounds_saved / self.tasks if self.tasks else 0.0
+        }
+
+
+# ===================================================================
+# Policies
+# ===================================================================
+
+class StoppingPolicy(ABC):
+    """
+    Base class for convergence-based stopping policies.
+
+    Attributes:
+        name: Policy name (used in logs and statistics)
+        shadow: Evaluate and record statistics without stopping the loop
+        stats: Aggregate statistics
+    """
+
+    name = "policy"
+
+    def __init__(self, shadow: bool = False):
+        self.shadow = shadow
+        self.stats = StoppingPolicyStats(self.name)
+
+    @abstractmethod
+    def evaluate(self, state: RefinementState) -> StopDecision:
+        """
+        Decide whether the loop should stop after the latest iteration.
+
+        Called only when the loop would otherwise continue (threshold not met,
+        rounds remaining).
+
+        Args:
+            state: Refinement state including the latest iteration
+
+        Returns:
+            StopDecision
+        """
+
+
+class NeverStopPolicy(StoppingPolicy):
+    """Baseline policy: always runs to MAX_REFINEMENT_ROUNDS."""
+
+    name = "never"
+
+    def evaluate(self, state: RefinementState) -> StopDecision:
+        return StopDecision(stop=False)
+
+
+class TrendProjectionPolicy(StoppingPolicy):
+    """
+    Stop when the fitted quality trend cannot lift the EMA to the threshold.
+
+    Fits a least-squares line to the last `window` quality scores, projects
+    scores (clamped to [0, 1]) over the remaining rounds, and replays the
+    EMA update used by RefinementState. Stops if the best projected EMA stays
+    below `quality_threshold - margin`.
+
+    Attributes:
+        min_rounds: Iterations required before the policy may stop
+        window: Recent iterations used for the fit
+        slope_allowance: Added to the fitted slope (optimism, per round)
+        margin: Projected shortfall tolerated before stopping
+    """
+
+    name = "trend_projection"
+
+    def __init__(
+        self,
+        min_rounds: int = 3,
+        window: int = 5,
+        slope_allowance: float = 0.01,
+        margin: float = 0.0,
+        shadow: bool = False
+    ):
+        """
+        Initialize Trend Projection Policy.
+
+        Args:
+            min_rounds: Iterations required before the policy may stop (>= 2)
+            window: Recent iterations used for the fit (>= 2)
+            slope_allowance: Optimism added to the fitted slope per round
+            margin: Projected shortfall tolerated before stopping
+            shadow: Evaluate without stopping (statistics only)
+        """
+        if min_rounds < 2 or window < 2:
+            raise ValueError(f"min_rounds and window must be >= 2, got: {min_rounds}, {window}")
+        super().__init__(shadow=shadow)
+        self.min_rounds = min_rounds
+        self.window = window
+        self.slope_allowance = slope_allowance
+        self.margin = margin
+
+    def evaluate(self, state: RefinementState) -> StopDecision:
+        scores = [iteration.quality_score for iteration in state.iterations]
+        if len(scores) < self.min_rounds:
+            return StopDecision(stop=False)
+
+        remaining = state.max_rounds - state.current_round
+        recent = scores[-self.window:]
+        slope, intercept = self._fit_line(recent)
+        slope += self.slope_allowance
+
+        # Replay EMA over projected scores; the loop stops as soon as it passes
+        ema = state.ema_quality
+        best = ema
+        for step in range(1, remaining + 1):
+            projected = min(1.0, max(0.0, intercept + slope * (len(recent) - 1 + step)))
+            ema = EMA_ALPHA * projected + (1 - EMA_ALPHA) * ema
+            best = max(best, ema)
+
+        if best < state.quality_threshold - self.margin:
+            return StopDecision(
+                stop=True,
+                reason=(
+                    f"Projected EMA quality {best:.3f} cannot reach threshold "
+                    f"{state.quality_threshold} within {remaining} remaining rounds "
+                    f"(trend {slope - self.slope_allowance:+.4f}/round over last {len(recent)})"
+                ),
+                projected_quality=best
+            )
+        return StopDecision(stop=False, projected_quality=best)
+
+    @staticmethod
+    def _fit_line(values: List[float]) -> Tuple[float, float]:
+        """Least-squares fit of values against 0..n-1; returns (slope, intercept)."""
+        n = len(values)
+        mean_x = (n - 1) / 2
+        mean_y = sum(values) / n
+        var_x = sum((x - mean_x) ** 2 for x in range(n))
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+        slope = cov / var_x if var_x else 0.0
+        return slope, mean_y - slope * mean_x
@@ -0,0 +1,226 @@
+"""
+Verification Cache - Reuse Verification Decisions for Unchanged Artifacts
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Lets RefinementEngine skip VerificationAgent.verify when the artifact has
+    not changed since it was last verified (no-op refinements, or a loop
+    resumed after a crash). Decisions are keyed by everything that determines
+    them: artifact content, phase, quality thresholds and spec content.
+
+Constitutional Compliance:
+    - Principle I: Library-First - VerificationCache is standalone library
+    - Principle IV: Idempotent Operations - Same inputs always map to same entry
+    - Principle VII: Observability - Hits/misses counted; hits recorded per
+      iteration (IterationRecord.cache_hit)
+
+Cache Key:
+    SHA-256 over artifact content hash, phase, canonical thresholds JSON,
+    spec content hash (empty if no spec), verifier agent ID and verifier
+    scoring version.
+
+Storage:
+    Decisions stored at: .docs/agents/shared/refinement-state/verification-cache/{key}.json
+    (persisted so a resumed loop still hits)
+
+Usage:
+    from sdd.refinement.verification_cache import VerificationCache
+
+    cache = VerificationCache(cache_dir="/tmp/verification-cache")
+    key = cache.make_key(artifact_path, "planning", thresholds, spec_path)
+
+    decision = cache.get(key)
+    if decision is None:
+        decision = run_verifier(...)
+        cache.put(key, decision)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from sdd.agents.quality.models import VerificationDecision
+from sdd.agents.quality.verifier import SCORING_VERSION
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class VerificationCache:
+    """
+    Content-keyed cache of VerificationDecisions.
+
+    Attributes:
+        cache_dir: Directory for persisted decisions (None = memory only)
+        max_entries: Maximum decisions kept in memory (LRU)
+        hits: Cache hits since creation
+        misses: Cache misses since creation
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize Verification Cache.
+
+        Args:
+            cache_dir: Directory for persisted decisions (None = memory only)
+            max_entries: Maximum decisions kept in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, VerificationDecision]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        logger.info(f"VerificationCache initialized: cache_dir={self.cache_dir}")
+
+    @staticmethod
+    def hash_file(path: Optional[str]) -> str:
+        """
+        Hash file content.
+
+        Args:
+            path: File path (None or missing file hashes to "")
+
+        Returns:
+            Hex SHA-256 digest, or "" if there is no file
+        """
+        if not path or not Path(path).is_file():
+            return ""
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+    def make_key(
+        self,
+        artifact_path: str,
+        phase: str,
+        thresholds: Dict[str, float],
+        spec_path: Optional[str] = None,
+        agent_id: str = "quality.verifier",
+        scoring_version: int = SCORING_VERSION
+    ) -> str:
+        """
+        Build cache key for a verification.
+
+        Args:
+            artifact_path: Artifact being verified (content is hashed, not path)
+            phase: Workflow phase
+            thresholds: Quality thresholds passed to the verifier
+            spec_path: Specification the artifact is aligned against (optional)
+            agent_id: Verifier agent ID
+            scoring_version: Verifier spec alignment scoring version
+
+        Returns:
+            Hex cache key
+        """
+        parts = {
+            'artifact': self.hash_file(artifact_path),
+            'phase': phase.lower(),
+            'thresholds': thresholds,
+            'spec': self.hash_file(spec_path),
+            'agent_id': agent_id,
+            'scoring': scoring_version
+        }
+        canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[VerificationDecision]:
+        """
+        Look up a decision.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached VerificationDecision, or None on miss
+        """
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return decision
+
+        decision = self._load(key)
+        with self._lock:
+            if decision is None:
+                self.misses += 1
+                return None
+            self._remember(key, decision)
+            self.hits += 1
+        return decision
+
+    def put(self, key: str, decision: VerificationDecision) -> None:
+        """
+        Store a decision.
+
+        Args:
+            key: Key from make_key()
+            decision: Decision to cache
+        """
+        with self._lock:
+            self._remember(key, decision)
+
+        if self.cache_dir is not None:
+            entry_file = self.cache_dir / f"{key}.json"
+            tmp_file = entry_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(decision.model_dump_json())
+            os.replace(tmp_file, entry_file)
+
+    def clear(self) -> None:
+        """Drop all cached decisions (memory and disk)."""
+        with self._lock:
+            self._entries.clear()
+        if self.cache_dir is not None:
+            for entry_file in self.cache_dir.glob("*.json"):
+                entry_file.unlink()
+        logger.info("VerificationCache cleared")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get hit/miss counts.
+
+        Returns:
+            Dictionary with hits, misses and hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def _load(self, key: str) -> Optional[VerificationDecision]:
+        """Load persisted decision (None if absent or unreadable)."""
+        if self.cache_dir is None:
+            return None
+        entry_file = self.cache_dir / f"{key}.json"
+        if not entry_file.exists():
+            return None
+        try:
+            return VerificationDecision.model_validate_json(entry_file.read_text())
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable verification cache entry {entry_file}: {e}")
+            return None
+
+    def _remember(self, key: str, decision: VerificationDecision) -> None:
+        """Insert into in-memory LRU (caller holds lock)."""
+        self._entries[key] = decision
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
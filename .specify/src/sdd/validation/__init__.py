@@ -5,9 +5,18 @@ DS-STAR Multi-Agent Enhancement - Feature 001
 Provides constitutional validation for artifacts and workflows.
 """
 
+from sdd.validation.cache import ValidationCache
 from sdd.validation.constitutional import ConstitutionalValidator, Violation
+from sdd.validation.history import ComplianceHistory
+from sdd.validation.python_analysis import PythonAnalyzer, PythonFacts
+from sdd.validation.rules import RuleRegistry
 
 __all__ = [
+    'ComplianceHistory',
     'ConstitutionalValidator',
+    'PythonAnalyzer',
+    'PythonFacts',
+    'RuleRegistry',
+    'ValidationCache',
     'Violation'
 ]
@@ -0,0 +1,69 @@
+"""
+Compliance History Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for ComplianceHistory path normalization.
+"""
+
+from sdd.validation.history import ComplianceHistory
+
+CHECKED_AT = "2026-10-19T10:00:00"
+
+
+def _violation(**fields):
+    return {
+        'principle': "Principle VII (Observability)",
+        'description': "No logging",
+        'severity': "high",
+        'remediation': "Add a logger",
+        **fields
+    }
+
+
+def test_one_file_reported_three_ways_is_one_row(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    monkeypatch.chdir(repo)
+    history = ComplianceHistory(report_dir=str(tmp_path / "reports"), repo_root=str(repo))
+
+    # Artifact run with a cwd-relative path
+    history.record({
+        'violations': [_violation(location=None)],
+        'artifact_path': "src/a.py",
+        'checked_at': CHECKED_AT
+    })
+    # Batch run with an absolute location
+    history.record({
+        'violations': [_violation(location=str(repo / "src" / "a.py"))],
+        'files_checked': 1,
+        'checked_at': CHECKED_AT
+    })
+    # Diff run with a repo-relative path
+    history.record({
+        'violations': [_violation(path="src/a.py", location="src/a.py:3", lines=[3])],
+        'files': [],
+        'base_ref': "HEAD",
+        'repo_root': str(repo),
+        'checked_at': CHECKED_AT
+    })
+
+    [row] = history.recurring_files(severity="high", min_runs=1)
+    assert row['path'] == "src/a.py"
+    assert row['runs'] == 3
+    history.close()
+
+
+def test_paths_outside_repo_root_are_absolute(tmp_path):
+    outside = tmp_path / "elsewhere" / "b.py"
+    history = ComplianceHistory(
+        report_dir=str(tmp_path / "reports"), repo_root=str(tmp_path / "repo")
+    )
+    history.record({
+        'violations': [_violation(location=str(outside))],
+        'artifact_path': str(outside),
+        'checked_at': CHECKED_AT
+    })
+
+    [row] = history.recurring_files(severity="high", min_runs=1)
+    assert row['path'] == outside.resolve().as_posix()
+    history.close()
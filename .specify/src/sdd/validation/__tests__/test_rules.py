@@ -0,0 +1,42 @@
+"""
+Rule Registry Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Tests for loading constitution_rules.json (packaged default and per-project
+override).
+"""
+
+import json
+
+from sdd.validation.rules import RULES_FILENAME, RuleRegistry
+
+
+def test_packaged_rules_load():
+    registry = RuleRegistry.default()
+    ids = [rule.id for rule in registry.rules]
+    assert "principle-i-library-structure" in ids
+    assert len(ids) == len(set(ids))
+
+
+def test_constitution_without_rules_file_uses_packaged_rules(tmp_path):
+    constitution = tmp_path / "constitution.md"
+    constitution.write_text("# Constitution\n")
+
+    registry = RuleRegistry.for_constitution(str(constitution))
+    assert [r.id for r in registry.rules] == [r.id for r in RuleRegistry.default().rules]
+
+
+def test_rules_file_next_to_constitution_overrides(tmp_path):
+    constitution = tmp_path / "constitution.md"
+    constitution.write_text("# Constitution\n")
+    (tmp_path / RULES_FILENAME).write_text(json.dumps({"rules": [{
+        "id": "custom-rule",
+        "principle": "Principle I",
+        "violation_if": {"contains": "TODO"},
+        "severity": "low",
+        "description": "TODO left in artifact",
+        "remediation": "Resolve the TODO"
+    }]}))
+
+    registry = RuleRegistry.for_constitution(str(constitution))
+    assert [r.id for r in registry.rules] == ["custom-rule"]
@@ -0,0 +1,81 @@
+"""
+Diff-Scoped Validation Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for ConstitutionalValidator.validate_diff and the
+sdd-validate-diff pre-commit CLI.
+"""
+
+import io
+from pathlib import Path
+
+from sdd.validation import precommit
+from sdd.validation.constitutional import ConstitutionalValidator
+
+SOURCE = (
+    'import logging\n'
+    'logger = logging.getLogger(__name__)\n'
+    '\n'
+    'def f(x: int) -> int:\n'
+    '    """Doc."""\n'
+    '    return x\n'
+)
+
+NEW_FILE_DIFF = (
+    "diff --git a/src/pkg/b.py b/src/pkg/b.py\n"
+    "new file mode 100644\n"
+    "--- /dev/null\n"
+    "+++ b/src/pkg/b.py\n"
+    "@@ -0,0 +1,6 @@\n"
+    + "".join(f"+{line}\n" for line in SOURCE.splitlines())
+)
+
+
+def _repo(tmp_path: Path) -> Path:
+    """Repository with one new file under src/."""
+    repo = tmp_path / "repo"
+    (repo / "src" / "pkg").mkdir(parents=True)
+    (repo / "src" / "pkg" / "b.py").write_text(SOURCE)
+    return repo
+
+
+def _validator(tmp_path: Path) -> ConstitutionalValidator:
+    return ConstitutionalValidator(
+        constitution_path=str(tmp_path / "constitution.md"),
+        report_dir=str(tmp_path / "reports"),
+        use_validation_cache=False,
+        use_history=False
+    )
+
+
+def _principles(report: dict) -> set:
+    return {v['principle'] for v in report['violations']}
+
+
+def test_relative_repo_root_matches_absolute(tmp_path, monkeypatch):
+    """A relative repo root must not cause a false Principle I violation under src/."""
+    repo = _repo(tmp_path)
+    validator = _validator(tmp_path)
+
+    absolute = validator.validate_diff(diff_text=NEW_FILE_DIFF, repo_root=str(repo))
+    monkeypatch.chdir(repo)
+    relative = validator.validate_diff(diff_text=NEW_FILE_DIFF, repo_root=".")
+
+    assert not any(p.startswith("Principle I ") for p in _principles(relative))
+    assert _principles(relative) == _principles(absolute)
+    assert [v['location'] for v in relative['violations']] == [
+        v['location'] for v in absolute['violations']
+    ]
+
+
+def test_precommit_writes_nothing_into_repo(tmp_path, monkeypatch, capsys):
+    """The pre-commit CLI must not create cache or history files in the checked repo."""
+    repo = _repo(tmp_path)
+    before = sorted(p.relative_to(repo) for p in repo.rglob("*"))
+    monkeypatch.setattr("sys.stdin", io.StringIO(NEW_FILE_DIFF))
+
+    exit_code = precommit.main(["--repo", str(repo), "--constitution", str(tmp_path / "c.md")])
+
+    assert exit_code in (0, 1)
+    assert "src/pkg/b.py" in capsys.readouterr().out
+    assert sorted(p.relative_to(repo) for p in repo.rglob("*")) == before
@@ -0,0 +1,73 @@
+"""
+Validator Storage Tests
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Regression tests for the on-disk state of ConstitutionalValidator: the
+validation cache and compliance history are opened on first use.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from sdd.validation.cache import ValidationCache
+from sdd.validation.constitutional import ConstitutionalValidator
+
+
+def _validator(tmp_path: Path) -> ConstitutionalValidator:
+    return ConstitutionalValidator(
+        constitution_path=str(tmp_path / "constitution.md"),
+        report_dir=str(tmp_path / "reports")
+    )
+
+
+def test_construction_writes_nothing(tmp_path):
+    _validator(tmp_path)
+
+    assert not (tmp_path / "reports").exists()
+
+
+def test_cache_and_history_open_on_first_use(tmp_path):
+    artifact = tmp_path / "plan.md"
+    artifact.write_text("# Plan\n")
+    validator = _validator(tmp_path)
+
+    report = validator.validate_all_principles(str(artifact), "plan")
+    assert (tmp_path / "reports" / "validation-cache").is_dir()
+    assert not (tmp_path / "reports" / "compliance-history.db").exists()
+
+    validator.save_report(report)
+    assert (tmp_path / "reports" / "compliance-history.db").exists()
+    assert len(validator.history.runs()) == 1
+
+    validator.close()
+    reopened = _validator(tmp_path)
+    assert len(reopened.history.runs()) == 1
+    reopened.close()
+
+
+def test_cache_prunes_least_recently_used_entries(tmp_path):
+    cache = ValidationCache(cache_dir=str(tmp_path), ruleset_hash="r1")
+    now = time.time()
+    for i, key in enumerate(["a", "b", "c", "d"]):
+        cache.put(key, [], [f"check-{key}"])
+        os.utime(tmp_path / f"{key}.json", (now - 100 + i, now - 100 + i))
+    cache.get("a")  # refreshes "a"
+
+    reopened = ValidationCache(cache_dir=str(tmp_path), ruleset_hash="r1", max_entries=3)
+    assert reopened.get("b") is None
+    assert all(reopened.get(key) is not None for key in ["a", "c", "d"])
+
+
+def test_cache_drops_entries_older_than_max_age(tmp_path):
+    cache = ValidationCache(cache_dir=str(tmp_path), ruleset_hash="r1")
+    cache.put("old", [], [])
+    cache.put("new", [], [])
+    old = time.time() - 2 * 86400
+    os.utime(tmp_path / "old.json", (old, old))
+
+    assert cache.prune() == 0
+    cache.max_age_days = 1
+    assert cache.prune() == 1
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
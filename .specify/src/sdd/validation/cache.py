@@ -0,0 +1,260 @@
+"""
+Validation Cache - Reuse Constitutional Check Results for Unchanged Files
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Lets ConstitutionalValidator skip the principle checks for artifacts that
+    have not changed since they were last validated (pre-commit runs where only
+    a handful of files changed). Results are keyed by everything that
+    determines them, so a cached report is identical to a fresh one.
+
+Constitutional Compliance:
+    - Principle I: Library-First - ValidationCache is standalone library
+    - Principle IV: Idempotent Operations - Same inputs always map to same entry
+    - Principle VII: Observability - Hits/misses counted
+
+Cache Key:
+    SHA-256 over the artifact path (as passed), artifact content hash,
+    artifact type, rule-set hash and the filesystem facts the applicable
+    rules read (e.g., test files and contracts/ directory present).
+
+Rule-Set Invalidation:
+    The cache directory records the rule-set hash it was filled with. A
+    validator with a different rule-set hash (RULES_VERSION bump, changed
+    principle list, rule definitions or checker source) clears every entry
+    on open.
+
+Eviction:
+    Hits refresh an entry's mtime, so mtime orders entries by last use. On
+    open, and after every max_entries // 10 stores, entries older than
+    max_age_days are dropped and then the least recently used ones until at
+    most max_entries remain.
+
+Storage:
+    Results stored at: .docs/agents/shared/compliance-reports/validation-cache/{key}.json
+
+Usage:
+    from sdd.validation.cache import ValidationCache
+
+    cache = ValidationCache(cache_dir="/tmp/validation-cache", ruleset_hash=ruleset)
+    key = cache.make_key(artifact_path, content_hash, "code", facts)
+
+    cached = cache.get(key)
+    if cached is None:
+        violations, passed_checks = run_checks(...)
+        cache.put(key, violations, passed_checks)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+RULESET_MARKER = "RULESET"
+
+DEFAULT_MAX_ENTRIES = 20_000
+DEFAULT_MAX_AGE_DAYS = 30.0
+
+
+class ValidationCache:
+    """
+    Content-keyed cache of principle check results.
+
+    Attributes:
+        cache_dir: Directory for persisted results
+        ruleset_hash: Hash of the validator's rule set
+        max_entries: Entries kept after pruning (least recently used dropped)
+        max_age_days: Entries unused for longer are dropped (None = no limit)
+        hits: Cache hits since creation
+        misses: Cache misses since creation
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ruleset_hash: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_days: Optional[float] = DEFAULT_MAX_AGE_DAYS
+    ):
+        """
+        Initialize Validation Cache (clears entries of another rule set,
+        prunes stale and least recently used entries).
+
+        Args:
+            cache_dir: Directory for persisted results
+            ruleset_hash: Hash of the validator's rule set
+            max_entries: Maximum entries kept (>= 1)
+            max_age_days: Maximum days since an entry was last used (None = no limit)
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ruleset_hash = ruleset_hash
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+
+        marker = self.cache_dir / RULESET_MARKER
+        previous = marker.read_text().strip() if marker.exists() else None
+        if previous != ruleset_hash:
+            if previous is not None:
+                logger.info(
+                    f"Validation rule set changed ({previous[:12]} -> {ruleset_hash[:12]}); "
+                    f"invalidating cache"
+                )
+            self.clear()
+            self._write_atomic(marker, ruleset_hash)
+        else:
+            self.prune()
+
+        logger.info(f"ValidationCache initialized: cache_dir={self.cache_dir}")
+
+    def make_key(
+        self,
+        artifact_path: str,
+        content_hash: str,
+        artifact_type: str,
+        facts: List[bool]
+    ) -> str:
+        """
+        Build cache key for a validation.
+
+        Args:
+            artifact_path: Artifact path as passed to the validator
+            content_hash: Hex SHA-256 of the artifact content
+            artifact_type: Type of artifact
+            facts: Filesystem facts read by path-based checks
+
+        Returns:
+            Hex cache key
+        """
+        parts = {
+            'path': artifact_path,
+            'content': content_hash,
+            'artifact_type': artifact_type,
+            'ruleset': self.ruleset_hash,
+            'facts': facts
+        }
+        canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+        """
+        Look up check results.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            (violation dicts, passed checks), or None on miss
+        """
+        entry_file = self.cache_dir / f"{key}.json"
+        entry = None
+        if entry_file.exists():
+            try:
+                data = json.loads(entry_file.read_text())
+                # Refresh mtime: pruning drops least recently used entries first
+                os.utime(entry_file)
+                entry = (data['violations'], data['passed_checks'])
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable validation cache entry {entry_file}: {e}")
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, key: str, violations: List[Dict[str, Any]], passed_checks: List[str]) -> None:
+        """
+        Store check results.
+
+        Args:
+            key: Key from make_key()
+            violations: Violation dicts in report order
+            passed_checks: Passed check names in report order
+        """
+        self._write_atomic(
+            self.cache_dir / f"{key}.json",
+            json.dumps({'violations': violations, 'passed_checks': passed_checks})
+        )
+
+        with self._lock:
+            self._puts_since_prune += 1
+            due = self._puts_since_prune >= max(1, self.max_entries // 10)
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Drop entries unused for max_age_days, then the least recently used
+        ones beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._puts_since_prune = 0
+
+        entries: List[Tuple[float, Path]] = []
+        for entry_file in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((entry_file.stat().st_mtime, entry_file))
+            except OSError:
+                continue  # Removed by a concurrent prune
+        entries.sort(reverse=True)
+
+        stale = entries[self.max_entries:]
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400
+            stale = [e for e in entries[:self.max_entries] if e[0] < cutoff] + stale
+
+        for _, entry_file in stale:
+            entry_file.unlink(missing_ok=True)
+        if stale:
+            logger.info(f"ValidationCache pruned {len(stale)} entries")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        for entry_file in self.cache_dir.glob("*.json"):
+            entry_file.unlink(missing_ok=True)
+        logger.info("ValidationCache cleared")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get hit/miss counts.
+
+        Returns:
+            Dictionary with hits, misses and hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        """Write via temp file + rename (safe with concurrent writers)."""
+        tmp_file = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_text(text)
+        os.replace(tmp_file, path)
@@ -46,14 +46,61 @@ Usage:
         for v in report['violations']:
             print(f"- {v['principle']}: {v['description']}")
             print(f"  Remediation: {v['remediation']}")
+
+    # Rules come from constitution_rules.json next to constitution.md
+    # (the copy packaged with sdd.validation if absent); find expensive rules:
+    for stats in validator.rule_stats()[:3]:
+        print(stats['rule_id'], stats['mean_seconds'])
+
+    # Unchanged files are served from the validation cache
+    # (report_dir/validation-cache; use_validation_cache=False disables it)
+
+    # Validate a source tree across a process pool
+    batch = validator.validate_directory(
+        "/path/to/src",
+        extensions=[".py"],
+        exclude=["tests", "*_pb2.py"]
+    )
+    print(batch['principle_counts'])
+
+    # Pre-commit: validate only what a change set can affect
+    # (also: git diff | python -m sdd.validation.precommit)
+    diff_report = validator.validate_diff(base_ref="HEAD", repo_root=".")
+    for v in diff_report['violations']:
+        print(f"{v['location']}: {v['principle']}: {v['description']}")
+
+    # Saved reports are recorded in report_dir/compliance-history.db
+    validator.save_report(report)
+    validator.history.violations_per_week(principle="Principle VI")
+    validator.history.recurring_files(severity="high", min_runs=3)
+    validator.close()
 """
 
+import fnmatch
+import hashlib
 import json
 import logging
-import re
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from sdd.validation import python_analysis, rules as rules_module
+from sdd.validation.cache import ValidationCache
+from sdd.validation.diff import (
+    STATUS_ADDED,
+    STATUS_DELETED,
+    STATUS_MODIFIED,
+    STATUS_RENAMED,
+    FileDiff,
+    git_diff,
+    parse_unified_diff,
+)
+from sdd.validation.history import ComplianceHistory
+from sdd.validation.python_analysis import PythonAnalyzer, get_default_analyzer
+from sdd.validation.rules import TARGET_DIRECTORY, TARGET_FILE, ArtifactContext, RuleRegistry
 
 # Configure structured logging (Principle VII)
 logging.basicConfig(
@@ -63,6 +110,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Bump when check logic changes to invalidate every cached validation result
+RULES_VERSION = "1"
+
+# Checker, rule-evaluator and Python-analysis source are part of the rule-set
+# hash, so edits also invalidate caches
+_CHECKER_SOURCE_HASH = hashlib.sha256(b"".join(
+    Path(module_file).read_bytes()
+    for module_file in (__file__, rules_module.__file__, python_analysis.__file__)
+)).hexdigest()
+
+# Batch mode defaults
+DEFAULT_EXTENSIONS = (".py", ".md", ".ts", ".tsx", ".js", ".jsx")
+DEFAULT_EXCLUDE = (
+    ".git", "__pycache__", "node_modules", ".venv", "venv",
+    "build", "dist", "*.egg-info", ".mypy_cache", ".pytest_cache"
+)
+DEFAULT_BATCH_CHUNK_SIZE = 32
+
+
 # ===================================================================
 # Violation Model
 # ===================================================================
@@ -119,12 +185,25 @@ class ConstitutionalValidator:
         constitution_path: Path to constitution.md
         report_dir: Directory for compliance reports
         principles: List of all 14 principles
+        rule_registry: Declarative principle rules (constitution_rules.json)
+        python_analyzer: AST fact sheets for .py artifacts (shared per process)
+        history: Compliance history every saved report is recorded in
+            (opened on first use; None = disabled)
+        ruleset_hash: Hash of RULES_VERSION, principles, rules and checker source
+        validation_cache: Cache of per-file check results
+            (opened on first use; None = disabled)
     """
 
     def __init__(
         self,
         constitution_path: str = "/workspaces/sdd-agentic-framework/.specify/memory/constitution.md",
-        report_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/compliance-reports"
+        report_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/compliance-reports",
+        validation_cache: Optional[ValidationCache] = None,
+        use_validation_cache: bool = True,
+        rule_registry: Optional[RuleRegistry] = None,
+        python_analyzer: Optional[PythonAnalyzer] = None,
+        history: Optional[ComplianceHistory] = None,
+        use_history: bool = True
     ):
         """
         Initialize Constitutional Validator.
@@ -132,10 +211,23 @@ class ConstitutionalValidator:
         Args:
             constitution_path: Path to constitution.md
             report_dir: Directory for compliance reports
+            validation_cache: Optional ValidationCache instance.
+                             If None, uses report_dir/validation-cache
+                             (created on first lookup).
+            use_validation_cache: Set False to always run every check.
+            rule_registry: Optional RuleRegistry instance.
+                          If None, loads constitution_rules.json next to
+                          constitution_path (packaged rules if absent).
+            python_analyzer: Optional PythonAnalyzer instance.
+                            If None, uses the process-wide default analyzer.
+            history: Optional ComplianceHistory instance.
+                    If None, uses report_dir/compliance-history.db
+                    (created on first use, e.g. save_report).
+            use_history: Set False to skip recording saved reports.
         """
         self.constitution_path = Path(constitution_path)
+        # Created on first save, cache lookup or history use; construction writes nothing
         self.report_dir = Path(report_dir)
-        self.report_dir.mkdir(parents=True, exist_ok=True)
 
         # All 14 principles
         self.principles = [
@@ -155,8 +247,69 @@ class ConstitutionalValidator:
             "Principle XIV: AI Model Selection Protocol"
         ]
 
+        self.rule_registry = (
+            rule_registry or RuleRegistry.for_constitution(str(self.constitution_path))
+        )
+        self.python_analyzer = python_analyzer or get_default_analyzer()
+        self.ruleset_hash = self._compute_ruleset_hash()
+
+        self._use_validation_cache = use_validation_cache
+        self._validation_cache = validation_cache if use_validation_cache else None
+        self._use_history = use_history
+        self._history = history if use_history else None
+        self._open_lock = threading.Lock()
+
         logger.info(f"ConstitutionalValidator initialized: {len(self.principles)} principles")
 
+    @property
+    def validation_cache(self) -> Optional[ValidationCache]:
+        """Validation cache (report_dir/validation-cache opened on first use)."""
+        if self._validation_cache is None and self._use_validation_cache:
+            with self._open_lock:
+                if self._validation_cache is None:
+                    self._validation_cache = ValidationCache(
+                        cache_dir=str(self.report_dir / "validation-cache"),
+                        ruleset_hash=self.ruleset_hash
+                    )
+        return self._validation_cache
+
+    @validation_cache.setter
+    def validation_cache(self, cache: Optional[ValidationCache]) -> None:
+        self._validation_cache = cache
+        self._use_validation_cache = cache is not None
+
+    @property
+    def history(self) -> Optional[ComplianceHistory]:
+        """Compliance history (report_dir/compliance-history.db opened on first use)."""
+        if self._history is None and self._use_history:
+            with self._open_lock:
+                if self._history is None:
+                    self._history = ComplianceHistory(report_dir=str(self.report_dir))
+        return self._history
+
+    @history.setter
+    def history(self, history: Optional[ComplianceHistory]) -> None:
+        self._history = history
+        self._use_history = history is not None
+
+    def close(self) -> None:
+        """Close the compliance history connection if it was opened."""
+        with self._open_lock:
+            if self._history is not None:
+                self._history.close()
+                self._history = None
+
+    def _compute_ruleset_hash(self) -> str:
+        """Hash everything that determines check results besides the artifact."""
+        parts = {
+            'version': RULES_VERSION,
+            'principles': self.principles,
+            'rules': self.rule_registry.fingerprint,
+            'checker_source': _CHECKER_SOURCE_HASH
+        }
+        canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
     def validate_all_principles(
         self,
         artifact_path: str,
@@ -208,345 +361,476 @@ class ConstitutionalValidator:
 
         content = artifact.read_text() if artifact.is_file() else ""
 
-        # Run principle checks
-        violations.extend(self._check_principle_i(artifact, artifact_type, passed_checks))
-        violations.extend(self._check_principle_ii(artifact, content, artifact_type, passed_checks))
-        violations.extend(self._check_principle_iii(artifact, content, artifact_type, passed_checks))
-        violations.extend(self._check_principle_iv(content, passed_checks))
-        violations.extend(self._check_principle_v(content, passed_checks))
-        violations.extend(self._check_principle_vi(content, passed_checks))
-        violations.extend(self._check_principle_vii(content, passed_checks))
-        violations.extend(self._check_principle_viii(artifact, passed_checks))
-        violations.extend(self._check_principle_ix(artifact, passed_checks))
-        violations.extend(self._check_principle_x(content, passed_checks))
-        violations.extend(self._check_principle_xi(content, passed_checks))
-        violations.extend(self._check_principle_xii(content, artifact_type, passed_checks))
-        violations.extend(self._check_principle_xiii(content, artifact_type, passed_checks))
-        violations.extend(self._check_principle_xiv(content, passed_checks))
+        # Unchanged file, same rule set and path facts: reuse stored results
+        cache_key = None
+        if self.validation_cache is not None and artifact.is_file():
+            cache_key = self.validation_cache.make_key(
+                artifact_path=str(artifact),
+                content_hash=hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest(),
+                artifact_type=artifact_type,
+                facts=self._path_facts(artifact, artifact_type)
+            )
+            cached = self.validation_cache.get(cache_key)
+            if cached is not None:
+                cached_violations, passed_checks = cached
+                return self._build_report(
+                    [Violation(**v) for v in cached_violations],
+                    passed_checks,
+                    artifact_path,
+                    artifact_type
+                )
+
+        # Run the principle rules that apply to this artifact type and target
+        rule_violations, passed_checks = self.rule_registry.evaluate(
+            ArtifactContext(artifact, artifact_type, content, self.python_analyzer)
+        )
+        violations.extend(Violation(**v) for v in rule_violations)
+
+        if cache_key is not None:
+            self.validation_cache.put(cache_key, [v.to_dict() for v in violations], passed_checks)
 
         return self._build_report(violations, passed_checks, artifact_path, artifact_type)
 
-    def _check_principle_i(
-        self,
-        artifact: Path,
-        artifact_type: str,
-        passed_checks: List[str]
-    ) -> List[Violation]:
-        """Check Principle I: Library-First Architecture."""
-        violations = []
-
-        # For code artifacts, check if they're in src/ directory (library structure)
-        if artifact_type == "code" and artifact.is_file():
-            if "/src/" not in str(artifact):
-                violations.append(Violation(
-                    principle="Principle I",
-                    description="Code not in library structure (src/ directory)",
-                    severity="high",
-                    remediation="Move code to src/{package}/ directory as standalone library",
-                    location=str(artifact)
-                ))
-            else:
-                passed_checks.append("Principle I: Code in library structure")
-
-        return violations
-
-    def _check_principle_ii(
+    def _path_facts(self, artifact: Path, artifact_type: str) -> List[bool]:
+        """
+        Filesystem facts the applicable rules read (part of the cache key).
+
+        Args:
+            artifact: Artifact file
+            artifact_type: Type of artifact
+
+        Returns:
+            Values of the rule facts (e.g., Principle II test files present)
+        """
+        ctx = ArtifactContext(artifact, artifact_type, "")
+        return [ctx.fact(name) for name in self.rule_registry.facts_for(artifact_type, ctx.target)]
+
+    def rule_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-rule evaluation statistics, most expensive first.
+
+        Returns:
+            List of dicts with rule_id, principle, evaluations, violations,
+            total_seconds, mean_seconds and max_seconds (evaluations in
+            batch worker processes are not included)
+        """
+        return self.rule_registry.stats()
+
+    # ---------------------------------------------------------------
+    # Batch Mode
+    # ---------------------------------------------------------------
+
+    def iter_validate_directory(
         self,
-        artifact: Path,
-        content: str,
-        artifact_type: str,
-        passed_checks: List[str]
-    ) -> List[Violation]:
-        """Check Principle II: Test-First Development."""
-        violations = []
-
-        # For code artifacts, check for corresponding tests
-        if artifact_type == "code" and artifact.is_file() and artifact.suffix == ".py":
-            # Check if tests exist
-            test_patterns = [
-                artifact.parent.parent / "tests" / f"test_{artifact.name}",
-                artifact.parent / "tests" / f"test_{artifact.name}",
-                Path(str(artifact).replace("/src/", "/tests/").replace(".py", "_test.py"))
-            ]
+        root: str,
+        artifact_type: str = "code",
+        extensions: Optional[Iterable[str]] = DEFAULT_EXTENSIONS,
+        exclude: Iterable[str] = DEFAULT_EXCLUDE,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Validate every matching file under root, yielding reports as they finish.
 
-            has_tests = any(p.exists() for p in test_patterns)
+        Files are validated with validate_all_principles() in chunks across a
+        process pool; package directories (containing __init__.py) get the
+        directory-only rules (Principle VIII README check). Reports arrive in
+        completion order.
 
-            if not has_tests:
-                violations.append(Violation(
-                    principle="Principle II",
-                    description=f"No tests found for {artifact.name}",
-                    severity="high",
-                    remediation=f"Create test file at tests/test_{artifact.name}",
-                    location=str(artifact)
-                ))
-            else:
-                passed_checks.append("Principle II: Tests exist for code")
+        Args:
+            root: Directory to walk (a single file is validated on its own)
+            artifact_type: Artifact type applied to every file
+            extensions: File suffixes to include (None = all files)
+            exclude: fnmatch patterns matched against names and root-relative
+                paths; matching directories are not descended into
+            max_workers: Worker processes (None = CPU count, 1 = in-process)
+            chunk_size: Files per pool task
+
+        Yields:
+            Per-file (or per-package) compliance report
+        """
+        files, packages = self._collect_batch_targets(Path(root), extensions, list(exclude))
 
-        return violations
+        directory_rules = {
+            rule.id for rule in self.rule_registry.rules if rule.targets == {TARGET_DIRECTORY}
+        }
+        for package in packages:
+            violations, passed_checks = self.rule_registry.evaluate(
+                ArtifactContext(package, "library", ""), rule_ids=directory_rules
+            )
+            yield self._build_report(
+                [Violation(**v) for v in violations], passed_checks, str(package), "library"
+            )
+
+        chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+        if max_workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                yield from _validate_batch_chunk(chunk, artifact_type, self)
+            return
+
+        # Performance: principle checks are CPU-bound; processes sidestep the GIL
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(
+                str(self.constitution_path),
+                str(self.report_dir),
+                str(self.validation_cache.cache_dir) if self.validation_cache else None,
+                [rule.spec for rule in self.rule_registry.rules]
+            )
+        ) as executor:
+            futures = [
+                executor.submit(_validate_batch_chunk, chunk, artifact_type)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
 
-    def _check_principle_iii(
+    def validate_directory(
         self,
-        artifact: Path,
-        content: str,
-        artifact_type: str,
-        passed_checks: List[str]
-    ) -> List[Violation]:
-        """Check Principle III: Contract-First Design."""
-        violations = []
-
-        # For plans, check if contracts/ directory exists
-        if artifact_type == "plan" and artifact.is_file():
-            contracts_dir = artifact.parent / "contracts"
-            if not contracts_dir.exists():
-                violations.append(Violation(
-                    principle="Principle III",
-                    description="No contracts/ directory found for plan",
-                    severity="medium",
-                    remediation="Create contracts/ directory with API contract definitions",
-                    location=str(artifact)
-                ))
-            else:
-                passed_checks.append("Principle III: Contracts directory exists")
-
-        # For code, check for Pydantic models or type hints
-        if artifact_type == "code" and "def " in content:
-            if "-> " not in content and "BaseModel" not in content:
-                violations.append(Violation(
-                    principle="Principle III",
-                    description="Functions lack type hints or contracts",
-                    severity="low",
-                    remediation="Add type hints to function signatures",
-                    location=str(artifact)
-                ))
-            else:
-                passed_checks.append("Principle III: Code has type contracts")
-
-        return violations
-
-    def _check_principle_iv(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle IV: Idempotent Operations."""
-        violations = []
-
-        # Check for common non-idempotent patterns
-        non_idempotent_patterns = [
-            (r'\bappend\(', "Use idempotent operations instead of append"),
-            (r'\.mkdir\([^)]*exist_ok=False', "Use mkdir(exist_ok=True) for idempotency")
-        ]
+        root: str,
+        artifact_type: str = "code",
+        extensions: Optional[Iterable[str]] = DEFAULT_EXTENSIONS,
+        exclude: Iterable[str] = DEFAULT_EXCLUDE,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Validate a directory tree and aggregate all file reports into one.
 
-        for pattern, remediation in non_idempotent_patterns:
-            if re.search(pattern, content):
-                violations.append(Violation(
-                    principle="Principle IV",
-                    description=f"Non-idempotent operation detected: {pattern}",
-                    severity="low",
-                    remediation=remediation
-                ))
+        Args:
+            root: Directory to walk
+            artifact_type: Artifact type applied to every file
+            extensions: File suffixes to include (None = all files)
+            exclude: fnmatch patterns for names / root-relative paths to skip
+            max_workers: Worker processes (None = CPU count, 1 = in-process)
+            chunk_size: Files per pool task
+
+        Returns:
+            Aggregated compliance report:
+            {
+                'compliant': bool,
+                'violations': List[Dict],  (location defaults to the file)
+                'principle_counts': Dict[str, int],
+                'severity_counts': Dict[str, int],
+                'files_checked': int,
+                'files_with_violations': int,
+                'checks_passed': int,
+                'violations_found': int,
+                'artifact_path': str,
+                'artifact_type': str,
+                'checked_at': str
+            }
+
+        Example:
+            >>> validator = ConstitutionalValidator()
+            >>> report = validator.validate_directory("/path/to/src", extensions=[".py"])
+            >>> report['principle_counts'].get("Principle VII", 0)
+            3
+        """
+        logger.info(f"Batch validating {root} against all 14 principles")
+
+        violations: List[Dict[str, Any]] = []
+        principle_counts: Dict[str, int] = {}
+        severity_counts: Dict[str, int] = {}
+        files_checked = 0
+        files_with_violations = 0
+        checks_passed = 0
+
+        for report in self.iter_validate_directory(
+            root, artifact_type, extensions, exclude, max_workers, chunk_size
+        ):
+            files_checked += 1
+            checks_passed += report['checks_passed']
+            if report['violations']:
+                files_with_violations += 1
+            for violation in report['violations']:
+                if violation['location'] is None:
+                    violation['location'] = report['artifact_path']
+                violations.append(violation)
+                principle_counts[violation['principle']] = (
+                    principle_counts.get(violation['principle'], 0) + 1
+                )
+                severity_counts[violation['severity']] = (
+                    severity_counts.get(violation['severity'], 0) + 1
+                )
+
+        # Completion order varies with scheduling; keep the report stable
+        violations.sort(key=lambda v: (v['location'] or "", v['principle']))
+
+        report = {
+            'compliant': len(violations) == 0,
+            'violations': violations,
+            'principle_counts': dict(sorted(principle_counts.items())),
+            'severity_counts': dict(sorted(severity_counts.items())),
+            'files_checked': files_checked,
+            'files_with_violations': files_with_violations,
+            'artifact_path': root,
+            'artifact_type': artifact_type,
+            'checked_at': datetime.now().isoformat(),
+            'principle_count': len(self.principles),
+            'checks_passed': checks_passed,
+            'violations_found': len(violations)
+        }
 
-        if not violations:
-            passed_checks.append("Principle IV: No obvious non-idempotent operations")
+        logger.info(
+            f"Batch validation complete: files={files_checked}, "
+            f"violations={len(violations)}, files_with_violations={files_with_violations}"
+        )
 
-        return violations
+        return report
 
-    def _check_principle_v(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle V: Progressive Enhancement."""
-        violations = []
+    @staticmethod
+    def _collect_batch_targets(
+        root: Path,
+        extensions: Optional[Iterable[str]],
+        exclude: List[str]
+    ) -> Tuple[List[Path], List[Path]]:
+        """
+        Walk root for files to validate and package directories.
 
-        # Check for premature optimization patterns
-        if "threading" in content or "multiprocessing" in content:
-            if "# Optimization:" not in content and "# Performance:" not in content:
-                violations.append(Violation(
-                    principle="Principle V",
-                    description="Concurrency added without justification",
-                    severity="medium",
-                    remediation="Document why concurrency is needed with performance measurements"
-                ))
+        Returns:
+            (files, package directories), both sorted
+        """
+        if root.is_file():
+            return [root], []
+
+        suffixes = tuple(extensions) if extensions is not None else None
+
+        def excluded(path: Path) -> bool:
+            relative = path.relative_to(root).as_posix()
+            return any(
+                fnmatch.fnmatch(path.name, pattern) or fnmatch.fnmatch(relative, pattern)
+                for pattern in exclude
+            )
+
+        files: List[Path] = []
+        packages: List[Path] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            directory = Path(dirpath)
+            dirnames[:] = sorted(d for d in dirnames if not excluded(directory / d))
+            if "__init__.py" in filenames:
+                packages.append(directory)
+            for name in sorted(filenames):
+                path = directory / name
+                if suffixes is not None and not name.endswith(suffixes):
+                    continue
+                if not excluded(path):
+                    files.append(path)
+        return files, packages
+
+    # ---------------------------------------------------------------
+    # Diff-Scoped Mode
+    # ---------------------------------------------------------------
+
+    def validate_diff(
+        self,
+        diff_text: Optional[str] = None,
+        base_ref: Optional[str] = None,
+        repo_root: str = ".",
+        artifact_type: str = "code",
+        extensions: Optional[Iterable[str]] = DEFAULT_EXTENSIONS,
+        paths: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate only what a change set can affect.
 
-        if not violations:
-            passed_checks.append("Principle V: No premature optimization detected")
+        Each changed file is checked with the rules whose signals occur in
+        its added or removed lines (path-based rules for new or renamed
+        files; filesystem-fact rules when the diff adds, deletes or renames
+        files). Violations are mapped to the changed lines that triggered
+        them (`lines`, new-file line numbers; location "path:line").
 
-        return violations
+        Args:
+            diff_text: Unified diff (e.g., read from stdin)
+            base_ref: Git ref to diff the working tree against (if no diff_text)
+            repo_root: Repository root the diff paths are relative to
+            artifact_type: Artifact type applied to every changed file
+            extensions: File suffixes to include (None = all files)
+            paths: Only validate these paths (repo-relative or absolute; optional)
 
-    def _check_principle_vi(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle VI: Git Operation Approval (CRITICAL)."""
-        violations = []
+        Returns:
+            Diff compliance report:
+            {
+                'compliant': bool,
+                'violations': List[Dict],  (with 'path' and 'lines')
+                'files': List[Dict],       (per file: path, status, rules_run,
+                                            violations, passed_checks)
+                'principle_counts': Dict[str, int],
+                'severity_counts': Dict[str, int],
+                'files_changed': int,
+                'files_checked': int,
+                'rules_evaluated': int,
+                'rules_skipped': int,
+                'base_ref': Optional[str],
+                'repo_root': str,          (resolved; 'path' is relative to it)
+                'artifact_type': str,
+                'checked_at': str
+            }
 
-        # Check for git commands without approval
-        git_commands = ["git checkout", "git commit", "git push", "git pull", "git merge"]
+        Raises:
+            ValueError: If neither diff_text nor base_ref is given
+            RuntimeError: If git diff fails
+        """
+        if diff_text is None:
+            if base_ref is None:
+                raise ValueError("validate_diff requires diff_text or base_ref")
+            diff_text = git_diff(base_ref, repo_root, list(paths) if paths else None)
+
+        # Absolute, so path rules (e.g., Principle I "/src/") see the full path
+        root = Path(repo_root).resolve()
+        suffixes = tuple(extensions) if extensions is not None else None
+        only_paths = {self._repo_relative(p, root) for p in paths} if paths else None
+        file_diffs = parse_unified_diff(diff_text)
+        tree_changed = any(fd.status != STATUS_MODIFIED for fd in file_diffs)
+
+        file_reports: List[Dict[str, Any]] = []
+        rules_evaluated = 0
+        rules_skipped = 0
+
+        for fd in file_diffs:
+            if fd.status == STATUS_DELETED:
+                continue
+            if only_paths is not None and fd.path not in only_paths:
+                continue
+            if suffixes is not None and not fd.path.endswith(suffixes):
+                continue
+            artifact = root / fd.path
+            if not artifact.is_file():
+                continue
+
+            content = artifact.read_text(encoding='utf-8', errors='replace')
+            changed_text = fd.changed_text.lower()
+            file_added = fd.status in (STATUS_ADDED, STATUS_RENAMED)
+            applicable = self.rule_registry.rules_for(artifact_type, TARGET_FILE)
+            affected = {
+                rule.id for rule in applicable
+                if rule.affected_by_change(changed_text, file_added, tree_changed)
+            }
+            rules_evaluated += len(affected)
+            rules_skipped += len(applicable) - len(affected)
+
+            evidence: List[Tuple[FrozenSet[str], FrozenSet[str]]] = []
+            violations, passed_checks = self.rule_registry.evaluate(
+                ArtifactContext(artifact, artifact_type, content, self.python_analyzer),
+                rule_ids=affected,
+                evidence=evidence
+            )
+            for violation, (evidence_terms, rule_terms) in zip(violations, evidence):
+                lines = self._diff_lines(fd, evidence_terms, rule_terms)
+                violation['path'] = fd.path
+                violation['lines'] = lines
+                violation['location'] = f"{fd.path}:{lines[0]}" if lines else fd.path
+
+            file_reports.append({
+                'path': fd.path,
+                'status': fd.status,
+                'rules_run': [rule.id for rule in applicable if rule.id in affected],
+                'violations': violations,
+                'passed_checks': passed_checks
+            })
+
+        # Package directories whose __init__.py or README.md changed
+        directory_rules = {
+            rule.id for rule in self.rule_registry.rules if rule.targets == {TARGET_DIRECTORY}
+        }
+        package_dirs = sorted({
+            Path(fd.path).parent.as_posix() for fd in file_diffs
+            if fd.status != STATUS_MODIFIED and Path(fd.path).name in ("__init__.py", "README.md")
+        })
+        for package in package_dirs:
+            if not (root / package).is_dir():
+                continue
+            violations, passed_checks = self.rule_registry.evaluate(
+                ArtifactContext(root / package, "library", ""), rule_ids=directory_rules
+            )
+            for violation in violations:
+                violation['path'] = package
+                violation['lines'] = []
+                violation['location'] = package
+            file_reports.append({
+                'path': package,
+                'status': "package",
+                'rules_run': sorted(directory_rules),
+                'violations': violations,
+                'passed_checks': passed_checks
+            })
+
+        violations = [v for file_report in file_reports for v in file_report['violations']]
+        principle_counts: Dict[str, int] = {}
+        severity_counts: Dict[str, int] = {}
+        for violation in violations:
+            principle_counts[violation['principle']] = (
+                principle_counts.get(violation['principle'], 0) + 1
+            )
+            severity_counts[violation['severity']] = (
+                severity_counts.get(violation['severity'], 0) + 1
+            )
 
-        for cmd in git_commands:
-            if cmd in content and "request_git_approval" not in content:
-                violations.append(Violation(
-                    principle="Principle VI (CRITICAL)",
-                    description=f"Git command '{cmd}' without user approval",
-                    severity="high",
-                    remediation="Add request_git_approval() before git command"
-                ))
+        report = {
+            'compliant': len(violations) == 0,
+            'violations': violations,
+            'files': file_reports,
+            'principle_counts': dict(sorted(principle_counts.items())),
+            'severity_counts': dict(sorted(severity_counts.items())),
+            'files_changed': len(file_diffs),
+            'files_checked': len(file_reports),
+            'rules_evaluated': rules_evaluated,
+            'rules_skipped': rules_skipped,
+            'base_ref': base_ref,
+            'repo_root': str(root),
+            'artifact_type': artifact_type,
+            'checked_at': datetime.now().isoformat()
+        }
 
-        if not violations:
-            passed_checks.append("Principle VI: No unapproved git operations")
+        logger.info(
+            f"Diff validation complete: files={len(file_reports)}, "
+            f"rules_evaluated={rules_evaluated}, rules_skipped={rules_skipped}, "
+            f"violations={len(violations)}"
+        )
 
-        return violations
+        return report
 
-    def _check_principle_vii(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle VII: Observability and Structured Logging."""
-        violations = []
+    @staticmethod
+    def _repo_relative(path: str, root: Path) -> str:
+        """Path relative to the repository root (as in diff headers)."""
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                return candidate.resolve().relative_to(root.resolve()).as_posix()
+            except ValueError:
+                return candidate.as_posix()
+        return candidate.as_posix()
+
+    @staticmethod
+    def _diff_lines(
+        file_diff: FileDiff,
+        evidence_terms: FrozenSet[str],
+        rule_terms: FrozenSet[str]
+    ) -> List[int]:
+        """
+        Changed lines a violation maps to.
 
-        # Check for logging in code
-        if "def " in content and "import logging" not in content and "logger" not in content:
-            violations.append(Violation(
-                principle="Principle VII",
-                description="Code lacks logging infrastructure",
-                severity="low",
-                remediation="Add structured logging with Python logging module"
-            ))
-        else:
-            passed_checks.append("Principle VII: Logging infrastructure present")
-
-        return violations
-
-    def _check_principle_viii(self, artifact: Path, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle VIII: Documentation Synchronization."""
-        violations = []
-
-        # Check if README exists for library
-        if artifact.is_dir() and (artifact / "__init__.py").exists():
-            if not (artifact / "README.md").exists():
-                violations.append(Violation(
-                    principle="Principle VIII",
-                    description=f"Library {artifact.name} lacks README.md",
-                    severity="medium",
-                    remediation="Create README.md with usage examples",
-                    location=str(artifact)
-                ))
-            else:
-                passed_checks.append("Principle VIII: README exists")
-
-        return violations
-
-    def _check_principle_ix(self, artifact: Path, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle IX: Dependency Management."""
-        violations = []
-
-        # Check for version pinning in imports
-        if artifact.is_file() and artifact.name in ["requirements.txt", "pyproject.toml"]:
-            content = artifact.read_text()
-            if "==" not in content and ">=" in content:
-                violations.append(Violation(
-                    principle="Principle IX",
-                    description="Dependencies not version-pinned (use == not >=)",
-                    severity="medium",
-                    remediation="Pin exact versions with == instead of >= ranges",
-                    location=str(artifact)
-                ))
-            else:
-                passed_checks.append("Principle IX: Dependencies version-pinned")
-
-        return violations
-
-    def _check_principle_x(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle X: Agent Delegation Protocol (CRITICAL)."""
-        violations = []
-
-        # Check for agent delegation patterns
-        delegation_keywords = ["frontend", "backend", "database", "security", "testing"]
-        has_delegation = any(keyword in content.lower() for keyword in delegation_keywords)
-
-        if has_delegation and "delegate" not in content.lower() and "agent" not in content.lower():
-            violations.append(Violation(
-                principle="Principle X (CRITICAL)",
-                description="Domain-specific work without agent delegation",
-                severity="high",
-                remediation="Delegate specialized work to appropriate domain agents"
-            ))
-        else:
-            passed_checks.append("Principle X: Agent delegation considered")
-
-        return violations
-
-    def _check_principle_xi(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle XI: Input Validation and Output Sanitization."""
-        violations = []
-
-        # Check for validation patterns
-        if "def " in content and "input" in content.lower():
-            if "validate" not in content.lower() and "BaseModel" not in content:
-                violations.append(Violation(
-                    principle="Principle XI",
-                    description="Input handling without validation",
-                    severity="high",
-                    remediation="Add input validation using Pydantic or explicit checks"
-                ))
-            else:
-                passed_checks.append("Principle XI: Input validation present")
-
-        return violations
-
-    def _check_principle_xii(
-        self,
-        content: str,
-        artifact_type: str,
-        passed_checks: List[str]
-    ) -> List[Violation]:
-        """Check Principle XII: Design System Compliance."""
-        violations = []
-
-        # For UI components, check for design system usage
-        if artifact_type == "ui" or "component" in content.lower():
-            if "theme" not in content.lower() and "design" not in content.lower():
-                violations.append(Violation(
-                    principle="Principle XII",
-                    description="UI component without design system reference",
-                    severity="medium",
-                    remediation="Use design system tokens/variables for styling"
-                ))
-            else:
-                passed_checks.append("Principle XII: Design system referenced")
-
-        return violations
-
-    def _check_principle_xiii(
-        self,
-        content: str,
-        artifact_type: str,
-        passed_checks: List[str]
-    ) -> List[Violation]:
-        """Check Principle XIII: Feature Access Control."""
-        violations = []
-
-        # For features with access control, check dual-layer enforcement
-        if "access" in content.lower() or "permission" in content.lower():
-            has_backend = "rls" in content.lower() or "policy" in content.lower()
-            has_frontend = "ui" in content.lower() or "component" in content.lower()
-
-            if not (has_backend and has_frontend):
-                violations.append(Violation(
-                    principle="Principle XIII",
-                    description="Access control not enforced at both backend and frontend",
-                    severity="high",
-                    remediation="Implement dual-layer enforcement (RLS + UI indicators)"
-                ))
-            else:
-                passed_checks.append("Principle XIII: Dual-layer access control")
-
-        return violations
-
-    def _check_principle_xiv(self, content: str, passed_checks: List[str]) -> List[Violation]:
-        """Check Principle XIV: AI Model Selection Protocol."""
-        violations = []
-
-        # Check for model selection documentation
-        if "sonnet" in content.lower() or "opus" in content.lower():
-            if "escalation" not in content.lower() and "model_selection" not in content.lower():
-                violations.append(Violation(
-                    principle="Principle XIV",
-                    description="AI model usage without selection justification",
-                    severity="low",
-                    remediation="Document why model was selected (default vs escalation)"
-                ))
-            else:
-                passed_checks.append("Principle XIV: Model selection documented")
+        Added lines containing the violation's evidence terms; otherwise the
+        start of hunks whose changed lines touch the rule's terms (e.g., a
+        removed logger import); otherwise the first hunk.
 
-        return violations
+        Returns:
+            New-file line numbers (empty if the diff has no hunks)
+        """
+        lines = [
+            number for number, text in sorted(file_diff.added_lines.items())
+            if any(term in text.lower() for term in evidence_terms)
+        ]
+        if lines:
+            return lines
+        lines = [
+            hunk.new_start for hunk in file_diff.hunks
+            if any(term in hunk.changed_text.lower() for term in rule_terms)
+        ]
+        if lines:
+            return lines
+        return [file_diff.hunks[0].new_start] if file_diff.hunks else []
 
     def _build_report(
         self,
@@ -577,7 +861,7 @@ class ConstitutionalValidator:
 
     def save_report(self, report: Dict[str, Any], output_path: Optional[str] = None) -> str:
         """
-        Save compliance report to file.
+        Save compliance report to file and record it in the compliance history.
 
         Args:
             report: Compliance report dictionary
@@ -592,13 +876,76 @@ class ConstitutionalValidator:
             >>> report_path = validator.save_report(report)
         """
         if output_path is None:
-            artifact_name = Path(report['artifact_path']).stem
+            artifact_name = Path(report.get('artifact_path') or "diff").stem
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = str(self.report_dir / f"{artifact_name}_{timestamp}_report.json")
 
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         output_file.write_text(json.dumps(report, indent=2))
+        if self.history is not None:
+            self.history.record(report, str(output_file))
 
         logger.info(f"Compliance report saved: {output_path}")
         return str(output_file)
+
+
+# ===================================================================
+# Batch Validation Workers
+# ===================================================================
+
+# Validator of the current worker process (set by _init_batch_worker)
+_batch_validator: Optional[ConstitutionalValidator] = None
+
+
+def _init_batch_worker(
+    constitution_path: str,
+    report_dir: str,
+    cache_dir: Optional[str],
+    rule_specs: List[Dict[str, Any]]
+) -> None:
+    """Create the worker process's validator once."""
+    global _batch_validator
+    # Per-file INFO logs from every worker would dominate batch runtime
+    logger.setLevel(logging.WARNING)
+    rules_module.logger.setLevel(logging.WARNING)
+    _batch_validator = ConstitutionalValidator(
+        constitution_path=constitution_path,
+        report_dir=report_dir,
+        use_validation_cache=False,
+        rule_registry=RuleRegistry(rule_specs),
+        use_history=False
+    )
+    if cache_dir is not None:
+        _batch_validator.validation_cache = ValidationCache(
+            cache_dir=cache_dir,
+            ruleset_hash=_batch_validator.ruleset_hash
+        )
+
+
+def _validate_batch_chunk(
+    files: List[Path],
+    artifact_type: str,
+    validator: Optional[ConstitutionalValidator] = None
+) -> List[Dict[str, Any]]:
+    """Validate a chunk of files (in a worker process unless validator given)."""
+    validator = validator or _batch_validator
+    reports = []
+    for path in files:
+        try:
+            reports.append(validator.validate_all_principles(str(path), artifact_type))
+        except (OSError, UnicodeDecodeError) as e:
+            reports.append(validator._build_report(
+                [Violation(
+                    principle="General",
+                    description=f"Artifact could not be read: {e}",
+                    severity="low",
+                    remediation="Exclude binary files or fix file permissions",
+                    location=str(path)
+                )],
+                [],
+                str(path),
+                artifact_type
+            ))
+    return reports
+
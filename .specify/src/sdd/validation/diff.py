@@ -0,0 +1,223 @@
+"""
+Diff Parsing - Change Sets for Diff-Scoped Validation
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Parses unified diffs (from `git diff` against a base ref, or supplied on
+    stdin) into per-file changed lines, so ConstitutionalValidator can run
+    only the rules a change can affect and map violations to diff lines.
+
+Constitutional Compliance:
+    - Principle I: Library-First - Diff parsing is standalone library
+    - Principle VI: Git Operation Approval - Only read-only `git diff` is run
+    - Principle VII: Observability - Parsed change sets are logged
+
+Usage:
+    from sdd.validation.diff import git_diff, parse_unified_diff
+
+    for file_diff in parse_unified_diff(git_diff("origin/main", repo_root=".")):
+        print(file_diff.path, file_diff.status, sorted(file_diff.added_lines))
+"""
+
+import logging
+import re
+import subprocess
+from typing import Dict, List, Optional
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+STATUS_ADDED = "added"
+STATUS_DELETED = "deleted"
+STATUS_RENAMED = "renamed"
+STATUS_MODIFIED = "modified"
+
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+_DEV_NULL = "/dev/null"
+
+
+class DiffHunk:
+    """
+    One hunk of a file diff.
+
+    Attributes:
+        new_start: First line of the hunk in the new file
+        added: New-file line number -> added line text
+        removed: Removed line texts
+    """
+
+    def __init__(self, new_start: int):
+        self.new_start = new_start
+        self.added: Dict[int, str] = {}
+        self.removed: List[str] = []
+
+    @property
+    def changed_text(self) -> str:
+        """Added and removed lines, newline-joined."""
+        return "\n".join(list(self.added.values()) + self.removed)
+
+
+class FileDiff:
+    """
+    Changes to one file.
+
+    Attributes:
+        old_path: Path before the change (None if added)
+        new_path: Path after the change (None if deleted)
+        hunks: Hunks in file order
+    """
+
+    def __init__(self, old_path: Optional[str], new_path: Optional[str]):
+        self.old_path = old_path
+        self.new_path = new_path
+        self.hunks: List[DiffHunk] = []
+
+    @property
+    def path(self) -> str:
+        """Current path (old path for deleted files)."""
+        return self.new_path or self.old_path or ""
+
+    @property
+    def status(self) -> str:
+        """STATUS_ADDED, STATUS_DELETED, STATUS_RENAMED or STATUS_MODIFIED."""
+        if self.old_path is None:
+            return STATUS_ADDED
+        if self.new_path is None:
+            return STATUS_DELETED
+        if self.old_path != self.new_path:
+            return STATUS_RENAMED
+        return STATUS_MODIFIED
+
+    @property
+    def added_lines(self) -> Dict[int, str]:
+        """New-file line number -> added line text, across hunks."""
+        lines: Dict[int, str] = {}
+        for hunk in self.hunks:
+            lines.update(hunk.added)
+        return lines
+
+    @property
+    def changed_text(self) -> str:
+        """All added and removed lines, newline-joined."""
+        return "\n".join(hunk.changed_text for hunk in self.hunks)
+
+
+def _strip_prefix(path: str) -> Optional[str]:
+    """Diff header path without a/ b/ prefix or trailing timestamp (None for /dev/null)."""
+    path = path.split("\t", 1)[0].strip()
+    if path == _DEV_NULL:
+        return None
+    if path.startswith(("a/", "b/")):
+        return path[2:]
+    return path
+
+
+def parse_unified_diff(text: str) -> List[FileDiff]:
+    """
+    Parse a unified diff (git or plain `diff -u` format).
+
+    Args:
+        text: Diff text
+
+    Returns:
+        FileDiffs in diff order (binary or mode-only changes have no hunks)
+    """
+    files: List[FileDiff] = []
+    current: Optional[FileDiff] = None
+    hunk: Optional[DiffHunk] = None
+    new_line = 0
+    old_remaining = new_remaining = 0
+    pending_rename: Dict[str, str] = {}
+
+    for line in text.splitlines():
+        in_hunk = hunk is not None and (old_remaining > 0 or new_remaining > 0)
+        if in_hunk and line[:1] in ("+", "-", " ", ""):
+            if line.startswith("+"):
+                hunk.added[new_line] = line[1:]
+                new_line += 1
+                new_remaining -= 1
+            elif line.startswith("-"):
+                hunk.removed.append(line[1:])
+                old_remaining -= 1
+            else:
+                new_line += 1
+                old_remaining -= 1
+                new_remaining -= 1
+            continue
+
+        if line.startswith("diff --git "):
+            current, hunk = None, None
+            pending_rename = {}
+            parts = line[len("diff --git "):].split(" b/", 1)
+            if len(parts) == 2:
+                current = FileDiff(_strip_prefix(parts[0]), parts[1])
+                files.append(current)
+        elif line.startswith("rename from "):
+            pending_rename['old'] = line[len("rename from "):]
+        elif line.startswith("rename to "):
+            pending_rename['new'] = line[len("rename to "):]
+            if current is not None:
+                current.old_path = pending_rename.get('old', current.old_path)
+                current.new_path = pending_rename['new']
+        elif line.startswith("new file mode") and current is not None:
+            current.old_path = None
+        elif line.startswith("deleted file mode") and current is not None:
+            current.new_path = None
+        elif line.startswith("--- "):
+            old_path = _strip_prefix(line[4:])
+            if current is None or current.hunks:
+                current = FileDiff(old_path, None)
+                files.append(current)
+            else:
+                current.old_path = old_path
+            hunk = None
+        elif line.startswith("+++ ") and current is not None:
+            current.new_path = _strip_prefix(line[4:])
+        elif line.startswith("@@") and current is not None:
+            match = _HUNK_HEADER.match(line)
+            if match:
+                old_remaining = int(match.group(2)) if match.group(2) is not None else 1
+                new_start = int(match.group(3))
+                new_remaining = int(match.group(4)) if match.group(4) is not None else 1
+                hunk = DiffHunk(new_start)
+                new_line = new_start
+                current.hunks.append(hunk)
+
+    logger.info(f"Parsed diff: {len(files)} files, {sum(len(f.hunks) for f in files)} hunks")
+    return files
+
+
+def git_diff(
+    base_ref: str,
+    repo_root: str = ".",
+    paths: Optional[List[str]] = None,
+    timeout: float = 60.0
+) -> str:
+    """
+    Unified diff of the working tree against a base ref (read-only).
+
+    Args:
+        base_ref: Commit, branch or tag to diff against
+        repo_root: Repository directory
+        paths: Limit the diff to these paths (optional)
+        timeout: Seconds before giving up
+
+    Returns:
+        Diff text with zero context lines
+
+    Raises:
+        RuntimeError: If git fails (unknown ref, not a repository)
+    """
+    command = [
+        "git", "-C", repo_root, "diff", "--unified=0", "--no-color", "--no-ext-diff",
+        "--find-renames", base_ref, "--"
+    ] + list(paths or [])
+    result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(f"git diff against {base_ref} failed: {result.stderr.strip()}")
+    return result.stdout
@@ -0,0 +1,564 @@
+"""
+Compliance History - Append-Only Store of Constitutional Validation Runs
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    save_report writes one JSON file per run and nothing reads them back.
+    ComplianceHistory records every saved report in SQLite (runs and their
+    violations) and maintains rollups, so trend questions ("violations of
+    Principle VI per week", "files with recurring high-severity violations")
+    are answered from small aggregate tables instead of parsing thousands
+    of report files.
+
+Constitutional Compliance:
+    - Principle I: Library-First - ComplianceHistory is standalone library
+    - Principle IV: Idempotent Operations - import_reports() skips report
+      files already recorded, so it is repeatable
+    - Principle VII: Observability - Trend queries and CLI over all runs
+
+Tables:
+    runs              One row per saved report (artifact, batch or diff run)
+    violations        One row per violation (append-only)
+    weekly_counts     (week, principle, severity) -> violations
+    file_counts       (path, principle, severity) -> runs with the violation,
+                      first/last seen
+
+    Principles are stored without qualifiers ("Principle VI (CRITICAL)" is
+    recorded as "Principle VI"); weeks are the ISO week's Monday (YYYY-MM-DD).
+    Paths are normalized to one form per file: relative to repo_root when the
+    file is under it, otherwise resolved absolute (diff paths are resolved
+    against the diff report's repo_root, others against the working directory).
+
+Storage:
+    History stored at: .docs/agents/shared/compliance-reports/compliance-history.db
+
+Usage:
+    from sdd.validation.history import ComplianceHistory
+
+    history = ComplianceHistory(report_dir=".docs/agents/shared/compliance-reports")
+    history.violations_per_week(principle="Principle VI")
+    history.recurring_files(severity="high", min_runs=3)
+
+CLI:
+    sdd-compliance-history --report-dir DIR weekly --principle "Principle VI"
+    sdd-compliance-history --report-dir DIR recurring --severity high --min-runs 3
+    sdd-compliance-history --report-dir DIR --repo-root . import
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+HISTORY_FILENAME = "compliance-history.db"
+
+RUN_KIND_ARTIFACT = "artifact"
+RUN_KIND_BATCH = "batch"
+RUN_KIND_DIFF = "diff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    checked_at TEXT NOT NULL,
+    week TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    artifact_path TEXT,
+    artifact_type TEXT,
+    compliant INTEGER NOT NULL,
+    violations_found INTEGER NOT NULL,
+    report_path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_checked ON runs (checked_at);
+CREATE INDEX IF NOT EXISTS idx_runs_report ON runs (report_path);
+
+CREATE TABLE IF NOT EXISTS violations (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    checked_at TEXT NOT NULL,
+    week TEXT NOT NULL,
+    principle TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    path TEXT NOT NULL,
+    location TEXT,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_violations_principle ON violations (principle, week);
+CREATE INDEX IF NOT EXISTS idx_violations_path ON violations (path, severity);
+
+CREATE TABLE IF NOT EXISTS weekly_counts (
+    week TEXT NOT NULL,
+    principle TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    violations INTEGER NOT NULL,
+    PRIMARY KEY (week, principle, severity)
+);
+
+CREATE TABLE IF NOT EXISTS file_counts (
+    path TEXT NOT NULL,
+    principle TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    violations INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (path, principle, severity)
+);
+CREATE INDEX IF NOT EXISTS idx_file_counts_runs ON file_counts (severity, runs);
+"""
+
+
+def week_of(timestamp: str) -> str:
+    """
+    ISO week (its Monday, YYYY-MM-DD) of an ISO timestamp.
+
+    Args:
+        timestamp: ISO date or datetime
+
+    Returns:
+        Monday of the week
+    """
+    day = date.fromisoformat(timestamp[:10])
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def normalize_principle(principle: str) -> str:
+    """Principle without qualifiers ("Principle VI (CRITICAL)" -> "Principle VI")."""
+    return principle.split(" (", 1)[0].strip()
+
+
+def _run_kind(report: Dict[str, Any]) -> str:
+    """Report kind: per-file files list (diff), files_checked (batch) or single artifact."""
+    if 'files' in report and 'base_ref' in report:
+        return RUN_KIND_DIFF
+    if 'files_checked' in report:
+        return RUN_KIND_BATCH
+    return RUN_KIND_ARTIFACT
+
+
+def _violation_path(
+    violation: Dict[str, Any],
+    report: Dict[str, Any],
+    repo_root: Optional[Path] = None
+) -> str:
+    """
+    File a violation belongs to (diff path, batch location or the artifact),
+    normalized so one file always maps to the same key.
+
+    Args:
+        violation: Violation dict from the report
+        report: Report the violation belongs to
+        repo_root: Resolved repository root (None = keep paths absolute)
+
+    Returns:
+        Path relative to repo_root if under it, else resolved absolute path
+        ("" if the violation has no file)
+    """
+    if violation.get('path'):
+        # Diff paths are relative to the diff's repository root
+        base = report.get('repo_root') or repo_root
+        path = Path(base or ".") / violation['path']
+    elif violation.get('location') or report.get('artifact_path'):
+        path = Path(violation.get('location') or report['artifact_path'])
+    else:
+        return ""
+
+    path = path.resolve()
+    if repo_root is not None:
+        try:
+            return path.relative_to(repo_root).as_posix()
+        except ValueError:
+            pass
+    return path.as_posix()
+
+
+# ===================================================================
+# ComplianceHistory
+# ===================================================================
+
+class ComplianceHistory:
+    """
+    SQLite history of compliance reports with trend rollups.
+
+    Attributes:
+        report_dir: Compliance report directory
+        db_path: History database path
+        repo_root: Resolved root violation paths are stored relative to
+            (None = absolute paths)
+    """
+
+    def __init__(
+        self,
+        report_dir: str = "/workspaces/sdd-agentic-framework/.docs/agents/shared/compliance-reports",
+        db_path: Optional[str] = None,
+        repo_root: Optional[str] = None
+    ):
+        """
+        Open (or create) the compliance history.
+
+        Args:
+            report_dir: Compliance report directory (used by import_reports)
+            db_path: History database path (default: report_dir/compliance-history.db)
+            repo_root: Store violation paths under this directory relative to it
+                (optional; other paths are stored resolved absolute)
+        """
+        self.report_dir = Path(report_dir)
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path) if db_path else self.report_dir / HISTORY_FILENAME
+        self.repo_root = Path(repo_root).resolve() if repo_root else None
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ---------------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------------
+
+    def record(self, report: Dict[str, Any], report_path: Optional[str] = None) -> int:
+        """
+        Append a compliance report (artifact, batch or diff) to the history.
+
+        Args:
+            report: Report from validate_all_principles, validate_directory
+                or validate_diff
+            report_path: Saved report file
+
+        Returns:
+            run_id
+        """
+        checked_at = report.get('checked_at') or datetime.now().isoformat()
+        week = week_of(checked_at)
+        violations = report.get('violations', [])
+
+        rows: List[Tuple[str, str, str, Optional[str], str]] = []
+        for violation in violations:
+            rows.append((
+                normalize_principle(violation['principle']),
+                violation['severity'],
+                _violation_path(violation, report, self.repo_root),
+                violation.get('location'),
+                violation['description']
+            ))
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (checked_at, week, kind, artifact_path, "
+                "artifact_type, compliant, violations_found, report_path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    checked_at,
+                    week,
+                    _run_kind(report),
+                    report.get('artifact_path') or report.get('base_ref'),
+                    report.get('artifact_type'),
+                    int(bool(report.get('compliant', not violations))),
+                    len(violations),
+                    report_path,
+                )
+            )
+            run_id = cursor.lastrowid
+
+            self._conn.executemany(
+                "INSERT INTO violations (run_id, checked_at, week, principle, severity, "
+                "path, location, description) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, checked_at, week) + row for row in rows]
+            )
+
+            weekly: Dict[Tuple[str, str], int] = {}
+            per_file: Dict[Tuple[str, str, str], int] = {}
+            for principle, severity, path, _, _ in rows:
+                weekly[(principle, severity)] = weekly.get((principle, severity), 0) + 1
+                key = (path, principle, severity)
+                per_file[key] = per_file.get(key, 0) + 1
+
+            self._conn.executemany(
+                "INSERT INTO weekly_counts (week, principle, severity, violations) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(week, principle, severity) DO UPDATE SET "
+                "violations = weekly_counts.violations + excluded.violations",
+                [(week, principle, severity, n) for (principle, severity), n in weekly.items()]
+            )
+            self._conn.executemany(
+                "INSERT INTO file_counts (path, principle, severity, runs, violations, "
+                "first_seen, last_seen) VALUES (?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT(path, principle, severity) DO UPDATE SET "
+                "runs = file_counts.runs + 1, "
+                "violations = file_counts.violations + excluded.violations, "
+                "first_seen = MIN(file_counts.first_seen, excluded.first_seen), "
+                "last_seen = MAX(file_counts.last_seen, excluded.last_seen)",
+                [
+                    (path, principle, severity, n, checked_at, checked_at)
+                    for (path, principle, severity), n in per_file.items()
+                ]
+            )
+
+        return run_id
+
+    def import_reports(self, report_dir: Optional[str] = None) -> int:
+        """
+        Record saved *_report.json files not yet in the history.
+
+        Args:
+            report_dir: Directory to scan (default: self.report_dir)
+
+        Returns:
+            Number of reports newly recorded
+        """
+        directory = Path(report_dir) if report_dir else self.report_dir
+        with self._lock:
+            recorded = {
+                row["report_path"] for row in self._conn.execute(
+                    "SELECT report_path FROM runs WHERE report_path IS NOT NULL"
+                )
+            }
+
+        count = 0
+        for report_file in sorted(directory.glob("*_report.json")):
+            if str(report_file) in recorded:
+                continue
+            try:
+                report = json.loads(report_file.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable report {report_file}: {e}")
+                continue
+            if not isinstance(report, dict) or 'violations' not in report:
+                continue
+            self.record(report, str(report_file))
+            count += 1
+
+        logger.info(f"Compliance history import: {count} reports from {directory}")
+        return count
+
+    # ---------------------------------------------------------------
+    # Trend Queries
+    # ---------------------------------------------------------------
+
+    def violations_per_week(
+        self,
+        principle: Optional[str] = None,
+        severity: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Violation counts per ISO week (oldest first), from the weekly rollup.
+
+        Args:
+            principle: Only this principle (qualifiers ignored)
+            severity: Only this severity
+            since: ISO date lower bound (its week included)
+            until: ISO date upper bound (its week included)
+
+        Returns:
+            List of {'week': 'YYYY-MM-DD', 'violations': int}
+
+        Example:
+            >>> history.violations_per_week(principle="Principle VI")
+            [{'week': '2026-10-05', 'violations': 4}, {'week': '2026-10-12', 'violations': 1}]
+        """
+        clauses = []
+        params: List[Any] = []
+        for clause, value in (
+            ("principle = ?", normalize_principle(principle) if principle else None),
+            ("severity = ?", severity),
+            ("week >= ?", week_of(since) if since else None),
+            ("week <= ?", week_of(until) if until else None),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = "SELECT week, SUM(violations) AS violations FROM weekly_counts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " GROUP BY week ORDER BY week"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def recurring_files(
+        self,
+        severity: Optional[str] = "high",
+        min_runs: int = 2,
+        principle: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Files whose violations recur across runs (most runs first).
+
+        Args:
+            severity: Only this severity (None = any)
+            min_runs: Minimum runs in which the file had the violation
+            principle: Only this principle (qualifiers ignored)
+            limit: Maximum rows
+
+        Returns:
+            List of {'path', 'principle', 'severity', 'runs', 'violations',
+            'first_seen', 'last_seen'}
+
+        Example:
+            >>> history.recurring_files(severity="high", min_runs=3)
+        """
+        clauses = ["runs >= ?"]
+        params: List[Any] = [min_runs]
+        if severity is not None:
+            clauses.append("severity = ?")
+            params.append(severity)
+        if principle is not None:
+            clauses.append("principle = ?")
+            params.append(normalize_principle(principle))
+
+        sql = (
+            "SELECT * FROM file_counts WHERE " + " AND ".join(clauses)
+            + " ORDER BY runs DESC, last_seen DESC, path"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def principle_totals(self, since: Optional[str] = None) -> Dict[str, int]:
+        """
+        Violations per principle (largest first).
+
+        Args:
+            since: ISO date lower bound (its week included)
+
+        Returns:
+            {principle: violations}
+        """
+        sql = "SELECT principle, SUM(violations) AS n FROM weekly_counts"
+        params: List[Any] = []
+        if since is not None:
+            sql += " WHERE week >= ?"
+            params.append(week_of(since))
+        sql += " GROUP BY principle ORDER BY n DESC"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return {row["principle"]: row["n"] for row in rows}
+
+    def runs(self, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+        """
+        Most recent runs.
+
+        Args:
+            limit: Maximum rows (None = all)
+
+        Returns:
+            List of run dicts, newest first
+        """
+        sql = "SELECT * FROM runs ORDER BY checked_at DESC, run_id DESC"
+        params: List[Any] = []
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the history database."""
+        with self._lock:
+            self._conn.close()
+
+
+# ===================================================================
+# CLI
+# ===================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="sdd-compliance-history",
+        description="Query constitutional compliance history"
+    )
+    parser.add_argument(
+        "--report-dir",
+        default="/workspaces/sdd-agentic-framework/.docs/agents/shared/compliance-reports",
+        help="Compliance report directory"
+    )
+    parser.add_argument(
+        "--repo-root",
+        help="Store violation paths relative to this directory (default: absolute)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    weekly_parser = subparsers.add_parser("weekly", help="Violations per week")
+    weekly_parser.add_argument("--principle")
+    weekly_parser.add_argument("--severity")
+    weekly_parser.add_argument("--since")
+    weekly_parser.add_argument("--until")
+
+    recurring_parser = subparsers.add_parser("recurring", help="Files with recurring violations")
+    recurring_parser.add_argument("--severity", default="high")
+    recurring_parser.add_argument("--min-runs", type=int, default=2)
+    recurring_parser.add_argument("--principle")
+    recurring_parser.add_argument("--limit", type=int)
+
+    totals_parser = subparsers.add_parser("totals", help="Violations per principle")
+    totals_parser.add_argument("--since")
+
+    runs_parser = subparsers.add_parser("runs", help="Most recent runs")
+    runs_parser.add_argument("--limit", type=int, default=50)
+
+    subparsers.add_parser("import", help="Record saved report files not yet in the history")
+
+    args = parser.parse_args(argv)
+    history = ComplianceHistory(report_dir=args.report_dir, repo_root=args.repo_root)
+    try:
+        if args.command == "weekly":
+            result: Any = history.violations_per_week(
+                principle=args.principle,
+                severity=args.severity,
+                since=args.since,
+                until=args.until
+            )
+        elif args.command == "recurring":
+            result = history.recurring_files(
+                severity=args.severity or None,
+                min_runs=args.min_runs,
+                principle=args.principle,
+                limit=args.limit
+            )
+        elif args.command == "totals":
+            result = history.principle_totals(since=args.since)
+        elif args.command == "runs":
+            result = history.runs(limit=args.limit)
+        else:
+            result = {"imported": history.import_reports()}
+    finally:
+        history.close()
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
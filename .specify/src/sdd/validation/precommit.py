@@ -0,0 +1,104 @@
+"""
+Pre-Commit Validation - Diff-Scoped Constitutional Check (CLI)
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Command-line front end for ConstitutionalValidator.validate_diff, meant
+    for pre-commit hooks: validates only the rules a change set can affect
+    and prints violations at their diff line numbers. Exits 1 when
+    violations are found.
+
+Constitutional Compliance:
+    - Principle I: Library-First - CLI wraps the validator library
+    - Principle VI: Git Operation Approval - Only read-only `git diff` is run
+    - Principle VII: Observability - Rules evaluated/skipped reported
+
+Usage:
+    # Staged-and-unstaged changes against HEAD
+    sdd-validate-diff --base HEAD --repo .
+
+    # Any unified diff on stdin
+    git diff --cached --unified=0 | sdd-validate-diff --repo .
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from sdd.validation import constitutional, rules
+from sdd.validation.constitutional import ConstitutionalValidator
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: validate a change set.
+
+    Reads a unified diff from stdin unless --base is given.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (1 if violations found)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sdd.validation.precommit",
+        description="Validate changed lines against the constitution (diff-scoped)"
+    )
+    parser.add_argument("--base", help="Git ref to diff the working tree against (default: stdin)")
+    parser.add_argument("--repo", default=".", help="Repository root")
+    parser.add_argument("--type", dest="artifact_type", default="code", help="Artifact type")
+    parser.add_argument("--constitution", help="constitution.md (default: REPO/.specify/memory)")
+    parser.add_argument("--report-dir", help="Report directory (default: REPO/.docs/...)")
+    parser.add_argument("--json", action="store_true", help="Print the full JSON report")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("paths", nargs="*", help="Only validate these repo-relative paths")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(args.log_level.upper())
+    for module_logger in (logger, constitutional.logger, rules.logger):
+        module_logger.setLevel(args.log_level.upper())
+
+    repo = Path(args.repo).resolve()
+    validator = ConstitutionalValidator(
+        constitution_path=args.constitution or str(repo / ".specify/memory/constitution.md"),
+        report_dir=args.report_dir or str(repo / ".docs/agents/shared/compliance-reports"),
+        # validate_diff reads neither; a hook must not write into the checked repo
+        use_validation_cache=False,
+        use_history=False
+    )
+    report = validator.validate_diff(
+        diff_text=None if args.base else sys.stdin.read(),
+        base_ref=args.base,
+        repo_root=str(repo),
+        artifact_type=args.artifact_type,
+        paths=args.paths or None
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for violation in report['violations']:
+            print(
+                f"{violation['location']}: {violation['principle']} "
+                f"[{violation['severity']}] {violation['description']}"
+            )
+        print(
+            f"{report['files_checked']} files, {report['rules_evaluated']} rules evaluated, "
+            f"{report['rules_skipped']} skipped, {len(report['violations'])} violations"
+        )
+    return 0 if report['compliant'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,368 @@
+"""
+Python Analysis - AST Fact Sheets for Principle and Verifier Checks
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Substring checks such as `"-> " in content` or `content.count("def ")`
+    misfire on comments, docstrings and string literals. PythonAnalyzer
+    parses a Python file once with `ast` and extracts a fact sheet
+    (functions, annotations, imports, decorators, logging calls, test
+    functions, identifiers) that constitutional rules and the verifier read
+    instead. Fact sheets are cached by content hash, so every check of the
+    same file shares one parse.
+
+Constitutional Compliance:
+    - Principle I: Library-First - PythonAnalyzer is standalone library
+    - Principle IV: Idempotent Operations - Same content always yields same facts
+    - Principle VII: Observability - Parse hits/misses counted
+
+Usage:
+    from sdd.validation.python_analysis import get_default_analyzer
+
+    facts = get_default_analyzer().analyze(source)
+    if facts is None:
+        ...  # not parseable as Python; fall back to text checks
+    elif not facts.has_type_contracts:
+        print("Functions lack type hints")
+"""
+
+import ast
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_ENTRIES = 512
+
+# Logger method names counted as logging calls
+LOG_METHODS = frozenset({
+    "debug", "info", "warning", "warn", "error", "exception", "critical", "log"
+})
+
+# Modules whose import counts as logging infrastructure
+LOGGING_MODULES = frozenset({"logging", "structlog", "loguru"})
+
+
+# ===================================================================
+# Fact Sheet
+# ===================================================================
+
+class FunctionFact:
+    """
+    One function or method definition.
+
+    Attributes:
+        name: Function name
+        lineno: Definition line
+        args: Parameter names (excluding self/cls)
+        annotated_args: Parameters with annotations (excluding self/cls)
+        has_return_annotation: Return annotation present
+        decorators: Decorator names (dotted)
+        is_async: Defined with async def
+        is_test: Test function (name starts with test_)
+    """
+
+    def __init__(self, node: ast.AST):
+        arguments = node.args
+        params = arguments.posonlyargs + arguments.args + arguments.kwonlyargs
+        params += [a for a in (arguments.vararg, arguments.kwarg) if a is not None]
+        params = [a for a in params if a.arg not in ("self", "cls")]
+
+        self.name = node.name
+        self.lineno = node.lineno
+        self.args = [a.arg for a in params]
+        self.annotated_args = sum(1 for a in params if a.annotation is not None)
+        self.has_return_annotation = node.returns is not None
+        self.decorators = [_dotted_name(d) for d in node.decorator_list]
+        self.is_async = isinstance(node, ast.AsyncFunctionDef)
+        self.is_test = node.name.startswith("test_")
+
+    @property
+    def is_annotated(self) -> bool:
+        """Return or any parameter annotated."""
+        return self.has_return_annotation or self.annotated_args > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'name': self.name,
+            'lineno': self.lineno,
+            'args': self.args,
+            'annotated_args': self.annotated_args,
+            'has_return_annotation': self.has_return_annotation,
+            'decorators': self.decorators,
+            'is_async': self.is_async,
+            'is_test': self.is_test
+        }
+
+
+class PythonFacts:
+    """
+    Facts extracted from one parse of a Python module.
+
+    Attributes:
+        functions: Function and method definitions in source order
+        classes: Class name -> base class names (dotted)
+        imports: Imported module names (dotted, plus their top-level package)
+        decorators: Decorator names used anywhere
+        logging_calls: Calls of logger methods (logger.info(...), logging.warning(...))
+        assert_count: assert statements
+        identifiers: Lowercased names, attributes, parameters and definitions
+            (comments and string literals excluded)
+    """
+
+    def __init__(self, tree: ast.Module):
+        self.functions: List[FunctionFact] = []
+        self.classes: Dict[str, List[str]] = {}
+        imports = set()
+        decorators = set()
+        identifiers = set()
+        self.logging_calls = 0
+        self.assert_count = 0
+
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                function = FunctionFact(node)
+                self.functions.append(function)
+                decorators.update(function.decorators)
+                identifiers.add(node.name.lower())
+            elif isinstance(node, ast.ClassDef):
+                self.classes[node.name] = [_dotted_name(b) for b in node.bases]
+                decorators.update(_dotted_name(d) for d in node.decorator_list)
+                identifiers.add(node.name.lower())
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.update(_module_names(alias.name))
+                    identifiers.add((alias.asname or alias.name).lower())
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    imports.update(_module_names(node.module))
+                for alias in node.names:
+                    identifiers.add((alias.asname or alias.name).lower())
+            elif isinstance(node, ast.Name):
+                identifiers.add(node.id.lower())
+            elif isinstance(node, ast.Attribute):
+                identifiers.add(node.attr.lower())
+            elif isinstance(node, ast.arg):
+                identifiers.add(node.arg.lower())
+            elif isinstance(node, ast.keyword) and node.arg:
+                identifiers.add(node.arg.lower())
+            elif isinstance(node, ast.Assert):
+                self.assert_count += 1
+            elif isinstance(node, ast.Call) and _is_logging_call(node):
+                self.logging_calls += 1
+
+        self.functions.sort(key=lambda f: f.lineno)
+        self.imports: FrozenSet[str] = frozenset(imports)
+        self.decorators: FrozenSet[str] = frozenset(decorators)
+        self.identifiers: FrozenSet[str] = frozenset(identifiers)
+
+    # ---------------------------------------------------------------
+    # Derived facts (read by rules via the "python" condition)
+    # ---------------------------------------------------------------
+
+    @property
+    def test_functions(self) -> List[str]:
+        """Names of test functions."""
+        return [f.name for f in self.functions if f.is_test]
+
+    @property
+    def has_functions(self) -> bool:
+        """At least one function or method defined."""
+        return bool(self.functions)
+
+    @property
+    def has_classes(self) -> bool:
+        """At least one class defined."""
+        return bool(self.classes)
+
+    @property
+    def has_imports(self) -> bool:
+        """At least one import."""
+        return bool(self.imports)
+
+    @property
+    def has_test_functions(self) -> bool:
+        """At least one test function."""
+        return any(f.is_test for f in self.functions)
+
+    @property
+    def has_type_contracts(self) -> bool:
+        """Any annotated function, or a Pydantic model."""
+        return any(f.is_annotated for f in self.functions) or self._has_pydantic_model()
+
+    @property
+    def has_logging(self) -> bool:
+        """Logging module imported, a logger referenced, or logger calls made."""
+        return (
+            bool(self.imports & LOGGING_MODULES)
+            or "logger" in self.identifiers
+            or self.logging_calls > 0
+        )
+
+    @property
+    def handles_input(self) -> bool:
+        """An identifier (not a comment or string) mentions input."""
+        return any("input" in name for name in self.identifiers)
+
+    @property
+    def has_validation(self) -> bool:
+        """Validation code (validate/validator/validation names) or Pydantic models."""
+        return any("validat" in name for name in self.identifiers) or self._has_pydantic_model()
+
+    def _has_pydantic_model(self) -> bool:
+        return any(
+            base.rsplit(".", 1)[-1] == "BaseModel"
+            for bases in self.classes.values() for base in bases
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'functions': [f.to_dict() for f in self.functions],
+            'classes': self.classes,
+            'imports': sorted(self.imports),
+            'decorators': sorted(self.decorators),
+            'logging_calls': self.logging_calls,
+            'assert_count': self.assert_count,
+            'test_functions': self.test_functions
+        }
+
+
+# Fact sheet properties usable in rule conditions ({"python": "<name>"}),
+# each with the lowercase substrings a changed line must contain to be able
+# to change the fact (diff-scoped validation)
+PYTHON_FACT_TERMS: Dict[str, Tuple[str, ...]] = {
+    'has_functions': ("def ",),
+    'has_classes': ("class ",),
+    'has_imports': ("import ",),
+    'has_test_functions': ("def test_",),
+    'has_type_contracts': ("def ", ":", "basemodel"),
+    'has_logging': ("log",),
+    'handles_input': ("input",),
+    'has_validation': ("validat", "basemodel"),
+}
+PYTHON_FACTS = tuple(PYTHON_FACT_TERMS)
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """Dotted name of a Name/Attribute (call targets for decorator calls)."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _module_names(module: str) -> List[str]:
+    """Dotted module name and its top-level package."""
+    return [module, module.split(".", 1)[0]]
+
+
+def _is_logging_call(node: ast.Call) -> bool:
+    """logger.info(...), self.logger.error(...), logging.warning(...), log.debug(...)."""
+    func = node.func
+    if not isinstance(func, ast.Attribute) or func.attr not in LOG_METHODS:
+        return False
+    receiver = _dotted_name(func.value).rsplit(".", 1)[-1].lower()
+    return receiver in ("logging", "log") or receiver.endswith("logger")
+
+
+# ===================================================================
+# PythonAnalyzer
+# ===================================================================
+
+class PythonAnalyzer:
+    """
+    Parses Python source into PythonFacts, caching by content hash.
+
+    Attributes:
+        max_entries: Fact sheets kept (least recently used evicted)
+        hits: Analyses served from cache
+        misses: Analyses that parsed the source
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize Python Analyzer.
+
+        Args:
+            max_entries: Fact sheets kept in memory
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Optional[PythonFacts]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def analyze(self, content: str) -> Optional[PythonFacts]:
+        """
+        Get the fact sheet of Python source.
+
+        Args:
+            content: Python source
+
+        Returns:
+            PythonFacts, or None if the source does not parse
+        """
+        key = hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        try:
+            facts = PythonFacts(ast.parse(content))
+        except (SyntaxError, ValueError, RecursionError) as e:
+            logger.debug(f"Source not parseable as Python: {e}")
+            facts = None
+
+        with self._lock:
+            self._entries[key] = facts
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return facts
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get hit/miss counts.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries)
+            }
+
+
+_default_analyzer: Optional[PythonAnalyzer] = None
+_default_analyzer_lock = threading.Lock()
+
+
+def get_default_analyzer() -> PythonAnalyzer:
+    """Process-wide analyzer shared by the validator and verifier."""
+    global _default_analyzer
+    with _default_analyzer_lock:
+        if _default_analyzer is None:
+            _default_analyzer = PythonAnalyzer()
+        return _default_analyzer
@@ -0,0 +1,700 @@
+"""
+Constitutional Rule Registry - Declarative Principle Rules
+DS-STAR Multi-Agent Enhancement - Feature 001
+
+Purpose:
+    Describes the constitutional principle checks as data (scope, conditions,
+    severity, messages) instead of hard-coded methods. Rules are loaded from
+    constitution_rules.json next to constitution.md (the copy packaged with
+    sdd.validation otherwise), compiled once into predicate closures, and evaluated only
+    for the artifact types and targets they apply to. Per-rule timing stats
+    show which rules are expensive.
+
+Constitutional Compliance:
+    - Principle I: Library-First - RuleRegistry is standalone library
+    - Principle IV: Idempotent Operations - Rules are pure predicates over an artifact
+    - Principle VII: Observability - Per-rule evaluation counts and timings
+
+Rule Format (JSON object per rule, evaluated in file order):
+    {
+      "id": "principle-vi-git-approval",          unique rule id
+      "principle": "Principle VI (CRITICAL)",     reported principle
+      "scope": {"artifact_types": ["*"],          artifact types ("*" = all)
+                "targets": ["file", "directory"]},  default ["file"]
+      "applies_if": <condition>,                  optional; rule silent if false
+      "for_each": ["git commit", ...],            optional; one check per item
+      "violation_if": <condition>,
+      "severity": "high",
+      "description": "Git command '{item}' without user approval",
+      "remediation": "Add request_git_approval() before git command",
+      "location": "artifact",                     optional; report the artifact path
+      "passed": "Principle VI: No unapproved git operations"
+    }
+    "passed" is recorded when the rule applies and raises no violation.
+    Templates may use {name} (artifact file name) and {item} / {<field>}
+    of for_each items (objects expose their fields).
+
+Conditions:
+    {"contains": "def "}             raw content contains text (case-sensitive)
+    {"contains_lower": "agent"}      lowercased content contains text
+    {"matches": "regex", "literal": "append("}
+                                     regex search (literal: required substring prefilter)
+    {"artifact_type": "ui"}          artifact type equals (or is in list)
+    {"path_contains": "/src/"}       artifact path contains text
+    {"suffix": ".py"}                artifact suffix equals
+    {"name_in": ["pyproject.toml"]}  artifact file name in list
+    {"fact": "tests_exist"}          filesystem fact (see FACTS)
+    {"python": "has_logging", "otherwise": <condition>}
+                                     AST fact of a .py file (see PYTHON_FACTS);
+                                     "otherwise" is evaluated for non-Python or
+                                     unparseable artifacts (default false)
+    {"any": [...]}, {"all": [...]}, {"not": <condition>}
+    Inside for_each rules, a string value "{item}" / "{<field>}" is replaced by the item.
+
+Usage:
+    from sdd.validation.rules import RuleRegistry
+
+    registry = RuleRegistry.for_constitution("/path/to/.specify/memory/constitution.md")
+    for stats in registry.stats():
+        print(stats['rule_id'], stats['total_seconds'])
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from importlib import resources
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sdd.validation.python_analysis import (
+    PYTHON_FACT_TERMS,
+    PYTHON_FACTS,
+    PythonAnalyzer,
+    PythonFacts,
+    get_default_analyzer,
+)
+
+# Configure structured logging (Principle VII)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+RULES_FILENAME = "constitution_rules.json"
+
+TARGET_FILE = "file"
+TARGET_DIRECTORY = "directory"
+
+ALL_ARTIFACT_TYPES = "*"
+
+
+# ===================================================================
+# Artifact Facts and Signals
+# ===================================================================
+
+def test_candidates(artifact: Path) -> List[Path]:
+    """Test file locations accepted by Principle II."""
+    return [
+        artifact.parent.parent / "tests" / f"test_{artifact.name}",
+        artifact.parent / "tests" / f"test_{artifact.name}",
+        Path(str(artifact).replace("/src/", "/tests/").replace(".py", "_test.py"))
+    ]
+
+
+# Filesystem facts rules may test (also part of the validation cache key)
+FACTS: Dict[str, Callable[[Path], bool]] = {
+    'tests_exist': lambda artifact: any(p.exists() for p in test_candidates(artifact)),
+    'contracts_dir_exists': lambda artifact: (artifact.parent / "contracts").exists(),
+    'is_package': lambda artifact: artifact.is_dir() and (artifact / "__init__.py").exists(),
+    'has_readme': lambda artifact: (artifact / "README.md").exists(),
+}
+
+
+class ContentSignals:
+    """
+    Keyword and pattern presence in an artifact, resolved once per signal.
+
+    Content is lowercased at most once and each keyword or pattern is
+    searched at most once, however many rules test it. Signals resolve on
+    first use, so rules that do not apply (or short-circuit) cost nothing
+    and a rule's timing includes the scans it triggers.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self._lowered: Optional[str] = None
+        self._raw: Dict[str, bool] = {}
+        self._lower: Dict[str, bool] = {}
+        self._patterns: Dict[str, bool] = {}
+
+    def has(self, keyword: str) -> bool:
+        """Raw content contains keyword (case-sensitive)."""
+        found = self._raw.get(keyword)
+        if found is None:
+            found = self._raw[keyword] = keyword in self.content
+        return found
+
+    def has_lower(self, keyword: str) -> bool:
+        """Lowercased content contains keyword."""
+        found = self._lower.get(keyword)
+        if found is None:
+            if self._lowered is None:
+                self._lowered = self.content.lower()
+            found = self._lower[keyword] = keyword in self._lowered
+        return found
+
+    def matches(self, regex: "re.Pattern[str]", literal: Optional[str] = None) -> bool:
+        """Regex matches content (skipped when the required literal is absent)."""
+        found = self._patterns.get(regex.pattern)
+        if found is None:
+            found = (literal is None or self.has(literal)) and (
+                regex.search(self.content) is not None
+            )
+            self._patterns[regex.pattern] = found
+        return found
+
+
+class ArtifactContext:
+    """
+    Everything rules may inspect about one artifact.
+
+    Attributes:
+        artifact: Artifact path
+        artifact_type: Type of artifact
+        target: TARGET_FILE or TARGET_DIRECTORY
+        signals: Content signals (empty content for directories)
+    """
+
+    def __init__(
+        self,
+        artifact: Path,
+        artifact_type: str,
+        content: str,
+        analyzer: Optional[PythonAnalyzer] = None
+    ):
+        self.artifact = artifact
+        self.artifact_type = artifact_type
+        self.target = TARGET_FILE if artifact.is_file() else TARGET_DIRECTORY
+        self.signals = ContentSignals(content)
+        self._analyzer = analyzer
+        self._python: Optional[PythonFacts] = None
+        self._python_resolved = False
+        self._facts: Dict[str, bool] = {}
+
+    @property
+    def python(self) -> Optional[PythonFacts]:
+        """AST fact sheet of a .py file (None for other or unparseable artifacts)."""
+        if not self._python_resolved:
+            self._python_resolved = True
+            if self.target == TARGET_FILE and self.artifact.suffix == ".py":
+                analyzer = self._analyzer or get_default_analyzer()
+                self._python = analyzer.analyze(self.signals.content)
+        return self._python
+
+    def fact(self, name: str) -> bool:
+        """Evaluate a filesystem fact once."""
+        value = self._facts.get(name)
+        if value is None:
+            value = self._facts[name] = FACTS[name](self.artifact)
+        return value
+
+
+# ===================================================================
+# Condition Compiler
+# ===================================================================
+
+Predicate = Callable[[ArtifactContext], bool]
+
+
+def _substitute(value: Any, item: Optional[Dict[str, Any]]) -> Any:
+    """Replace "{field}" placeholders of for_each items in condition values."""
+    if item is None:
+        return value
+    if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+        field = value[1:-1]
+        if field in item:
+            return item[field]
+    if isinstance(value, list):
+        return [_substitute(v, item) for v in value]
+    return value
+
+
+def compile_condition(spec: Dict[str, Any], item: Optional[Dict[str, Any]] = None) -> Predicate:
+    """
+    Compile a condition into a predicate.
+
+    Args:
+        spec: Condition object (see module docstring)
+        item: for_each item whose fields replace "{field}" values
+
+    Returns:
+        Predicate over ArtifactContext
+
+    Raises:
+        ValueError: If the condition is malformed or uses an unknown operator
+    """
+    if not isinstance(spec, dict) or not spec:
+        raise ValueError(f"Condition must be a non-empty object, got: {spec!r}")
+
+    if "any" in spec or "all" in spec:
+        op = "any" if "any" in spec else "all"
+        parts = [compile_condition(s, item) for s in spec[op]]
+        if op == "any":
+            return lambda ctx: any(p(ctx) for p in parts)
+        return lambda ctx: all(p(ctx) for p in parts)
+
+    if "not" in spec:
+        inner = compile_condition(spec["not"], item)
+        return lambda ctx: not inner(ctx)
+
+    if "python" in spec:
+        name = spec["python"]
+        if name not in PYTHON_FACTS:
+            raise ValueError(f"Unknown python fact: {name} (known: {list(PYTHON_FACTS)})")
+        otherwise = compile_condition(spec["otherwise"], item) if "otherwise" in spec else None
+
+        def python_fact(ctx: ArtifactContext) -> bool:
+            facts = ctx.python
+            if facts is not None:
+                return getattr(facts, name)
+            return otherwise(ctx) if otherwise is not None else False
+        return python_fact
+
+    if "matches" in spec:
+        regex = re.compile(_substitute(spec["matches"], item))
+        literal = _substitute(spec.get("literal"), item)
+        return lambda ctx: ctx.signals.matches(regex, literal)
+
+    if len(spec) != 1:
+        raise ValueError(f"Condition must have exactly one operator, got: {sorted(spec)}")
+    op, value = next(iter(spec.items()))
+    value = _substitute(value, item)
+
+    if op == "contains":
+        return lambda ctx: ctx.signals.has(value)
+    if op == "contains_lower":
+        return lambda ctx: ctx.signals.has_lower(value)
+    if op == "artifact_type":
+        types = {value} if isinstance(value, str) else set(value)
+        return lambda ctx: ctx.artifact_type in types
+    if op == "path_contains":
+        return lambda ctx: value in str(ctx.artifact)
+    if op == "suffix":
+        return lambda ctx: ctx.artifact.suffix == value
+    if op == "name_in":
+        names = set(value)
+        return lambda ctx: ctx.artifact.name in names
+    if op == "fact":
+        if value not in FACTS:
+            raise ValueError(f"Unknown fact: {value} (known: {sorted(FACTS)})")
+        return lambda ctx: ctx.fact(value)
+
+    raise ValueError(f"Unknown condition operator: {op}")
+
+
+def _condition_facts(spec: Any) -> Set[str]:
+    """Facts referenced by a condition."""
+    if isinstance(spec, dict):
+        facts = {spec["fact"]} if "fact" in spec else set()
+        for value in spec.values():
+            facts |= _condition_facts(value)
+        return facts
+    if isinstance(spec, list):
+        return set().union(*(_condition_facts(v) for v in spec)) if spec else set()
+    return set()
+
+
+def _collect_terms(
+    spec: Any,
+    item: Optional[Dict[str, Any]],
+    negated: bool,
+    positive: Set[str],
+    negative: Set[str]
+) -> bool:
+    """
+    Collect the lowercase content terms a condition reads (for change impact).
+
+    Terms under an odd number of "not" go to negative, others to positive.
+
+    Returns:
+        True if the condition reads content no term can summarize (regex
+        without a required literal)
+    """
+    if not isinstance(spec, dict):
+        return False
+    terms = positive if not negated else negative
+    if "any" in spec or "all" in spec:
+        return any([
+            _collect_terms(s, item, negated, positive, negative)
+            for s in spec.get("any", spec.get("all"))
+        ])
+    if "not" in spec:
+        return _collect_terms(spec["not"], item, not negated, positive, negative)
+    if "matches" in spec:
+        literal = _substitute(spec.get("literal"), item)
+        if literal is None:
+            return True
+        terms.add(literal.lower())
+        return False
+    if "python" in spec:
+        terms.update(PYTHON_FACT_TERMS.get(spec["python"], ()))
+        return _collect_terms(spec.get("otherwise"), item, negated, positive, negative)
+    for op in ("contains", "contains_lower"):
+        if op in spec:
+            terms.add(_substitute(spec[op], item).lower())
+    return False
+
+
+# ===================================================================
+# Rules
+# ===================================================================
+
+class _Check:
+    """
+    One compiled violation check (a rule, or one of its for_each items).
+
+    Attributes:
+        evidence: Lowercase terms whose presence (not absence) triggers the
+            violation; changed lines containing them locate it in a diff
+    """
+
+    def __init__(self, violation_if: Predicate, fields: Dict[str, Any], evidence: FrozenSet[str]):
+        self.violation_if = violation_if
+        self.fields = fields
+        self.evidence = evidence
+
+
+class Rule:
+    """
+    Compiled declarative rule.
+
+    Attributes:
+        id: Unique rule id
+        principle: Reported principle
+        artifact_types: Artifact types the rule applies to ("*" = all)
+        targets: TARGET_FILE and/or TARGET_DIRECTORY
+        severity: high | medium | low
+        facts: Filesystem facts the rule reads
+        content_terms: Lowercase terms whose appearance in changed lines can
+            change the rule's outcome
+        reads_any_content: Any content change can change the outcome
+        spec: Source rule object
+    """
+
+    REQUIRED = ("id", "principle", "violation_if", "severity", "description", "remediation")
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Compile a rule.
+
+        Args:
+            spec: Rule object (see module docstring)
+
+        Raises:
+            ValueError: If required fields are missing or a condition is malformed
+        """
+        missing = [field for field in self.REQUIRED if field not in spec]
+        if missing:
+            raise ValueError(f"Rule {spec.get('id', '?')} missing fields: {missing}")
+
+        self.spec = spec
+        self.id = spec["id"]
+        self.principle = spec["principle"]
+        self.severity = spec["severity"]
+        scope = spec.get("scope", {})
+        self.artifact_types = set(scope.get("artifact_types", [ALL_ARTIFACT_TYPES]))
+        self.targets = set(scope.get("targets", [TARGET_FILE]))
+        self.facts = _condition_facts([spec.get("applies_if"), spec["violation_if"]])
+
+        self._applies_if = (
+            compile_condition(spec["applies_if"]) if "applies_if" in spec else None
+        )
+        self._report_location = spec.get("location") == "artifact"
+        self._passed = spec.get("passed")
+
+        items = spec.get("for_each")
+        items = [None] if items is None else [
+            raw_item if isinstance(raw_item, dict) else {'item': raw_item} for raw_item in items
+        ]
+        self._checks = []
+        content_terms: Set[str] = set()
+        self.reads_any_content = False
+        for item in items:
+            positive: Set[str] = set()
+            negative: Set[str] = set()
+            for condition in (spec.get("applies_if"), spec["violation_if"]):
+                if _collect_terms(condition, item, False, positive, negative):
+                    self.reads_any_content = True
+            content_terms |= positive | negative
+            self._checks.append(_Check(
+                compile_condition(spec["violation_if"], item), item or {}, frozenset(positive)
+            ))
+        self.content_terms = frozenset(content_terms)
+
+    def applies_to(self, artifact_type: str, target: str) -> bool:
+        """Check rule scope."""
+        return target in self.targets and (
+            ALL_ARTIFACT_TYPES in self.artifact_types or artifact_type in self.artifact_types
+        )
+
+    def affected_by_change(self, changed_text: str, file_added: bool, tree_changed: bool) -> bool:
+        """
+        Whether a change to an artifact can change this rule's outcome.
+
+        Args:
+            changed_text: Lowercased added and removed lines of the artifact
+            file_added: Artifact is new or renamed (path-based rules apply)
+            tree_changed: Diff adds, deletes or renames files (fact rules apply)
+
+        Returns:
+            True if the rule must be re-evaluated
+        """
+        if file_added or (self.facts and tree_changed):
+            return True
+        if self.reads_any_content:
+            return bool(changed_text)
+        return any(term in changed_text for term in self.content_terms)
+
+    def evaluate(
+        self,
+        ctx: ArtifactContext,
+        evidence: Optional[List[Tuple[FrozenSet[str], FrozenSet[str]]]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Evaluate the rule.
+
+        Args:
+            ctx: Artifact context
+            evidence: If given, receives (evidence terms, rule content terms)
+                per violation
+
+        Returns:
+            (violation dicts, passed check or None)
+        """
+        if self._applies_if is not None and not self._applies_if(ctx):
+            return [], None
+
+        violations = []
+        for check in self._checks:
+            if check.violation_if(ctx):
+                fields = {**check.fields, 'name': ctx.artifact.name}
+                violations.append({
+                    'principle': self.principle,
+                    'description': self.spec["description"].format_map(fields),
+                    'severity': self.severity,
+                    'remediation': self.spec["remediation"].format_map(fields),
+                    'location': str(ctx.artifact) if self._report_location else None
+                })
+                if evidence is not None:
+                    evidence.append((check.evidence, self.content_terms))
+
+        if violations or not self._passed:
+            return violations, None
+        return violations, self._passed
+
+
+class RuleStats:
+    """Evaluation statistics of one rule."""
+
+    def __init__(self, rule: Rule):
+        self.rule_id = rule.id
+        self.principle = rule.principle
+        self.evaluations = 0
+        self.violations = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'rule_id': self.rule_id,
+            'principle': self.principle,
+            'evaluations': self.evaluations,
+            'violations': self.violations,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.evaluations if self.evaluations else 0.0,
+            'max_seconds': self.max_seconds
+        }
+
+
+# ===================================================================
+# RuleRegistry
+# ===================================================================
+
+class RuleRegistry:
+    """
+    Ordered set of compiled rules with per-scope evaluation plans.
+
+    Attributes:
+        rules: Compiled rules in evaluation order
+        source: File the rules were loaded from (None = built-in defaults)
+        fingerprint: Hash of the canonical rule definitions
+    """
+
+    def __init__(self, rules: Iterable[Dict[str, Any]], source: Optional[str] = None):
+        """
+        Compile rules.
+
+        Args:
+            rules: Rule objects in evaluation order
+            source: Where the rules came from (for logs)
+
+        Raises:
+            ValueError: If a rule is malformed or rule ids repeat
+        """
+        specs = list(rules)
+        self.rules = [Rule(spec) for spec in specs]
+        ids = [rule.id for rule in self.rules]
+        duplicates = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rule ids: {duplicates}")
+
+        self.source = source
+        canonical = json.dumps(specs, sort_keys=True, separators=(',', ':'))
+        self.fingerprint = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+        self._plans: Dict[Tuple[str, str], List[Rule]] = {}
+        self._stats = {rule.id: RuleStats(rule) for rule in self.rules}
+        self._lock = threading.Lock()
+
+        logger.info(f"RuleRegistry loaded: {len(self.rules)} rules from {source or 'defaults'}")
+
+    @classmethod
+    def load(cls, path: str) -> "RuleRegistry":
+        """
+        Load rules from a JSON file ({"rules": [...]}).
+
+        Args:
+            path: Rules file
+
+        Returns:
+            RuleRegistry
+
+        Raises:
+            ValueError: If the file is not valid JSON or a rule is malformed
+        """
+        return cls.from_json(Path(path).read_text(), source=str(path))
+
+    @classmethod
+    def from_json(cls, text: str, source: Optional[str] = None) -> "RuleRegistry":
+        """
+        Load rules from JSON text ({"rules": [...]}).
+
+        Args:
+            text: Rules JSON
+            source: Where the rules came from (for logging)
+
+        Returns:
+            RuleRegistry
+
+        Raises:
+            ValueError: If the text is not valid JSON or a rule is malformed
+        """
+        return cls(json.loads(text)["rules"], source=source)
+
+    @classmethod
+    def default(cls) -> "RuleRegistry":
+        """Load the constitution_rules.json packaged with sdd.validation."""
+        rules_file = resources.files(__package__).joinpath(RULES_FILENAME)
+        return cls.from_json(rules_file.read_text(), source=f"{__package__}/{RULES_FILENAME}")
+
+    @classmethod
+    def for_constitution(cls, constitution_path: str) -> "RuleRegistry":
+        """
+        Load constitution_rules.json next to constitution.md, else the packaged rules.
+
+        Args:
+            constitution_path: Path to constitution.md
+
+        Returns:
+            RuleRegistry
+        """
+        rules_file = Path(constitution_path).parent / RULES_FILENAME
+        if rules_file.exists():
+            return cls.load(str(rules_file))
+        return cls.default()
+
+    def rules_for(self, artifact_type: str, target: str) -> List[Rule]:
+        """
+        Rules applying to an artifact type and target (compiled plan, cached).
+
+        Args:
+            artifact_type: Type of artifact
+            target: TARGET_FILE or TARGET_DIRECTORY
+
+        Returns:
+            Applicable rules in evaluation order
+        """
+        key = (artifact_type, target)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = [rule for rule in self.rules if rule.applies_to(artifact_type, target)]
+            self._plans[key] = plan
+        return plan
+
+    def facts_for(self, artifact_type: str, target: str) -> List[str]:
+        """Filesystem facts read by the applicable rules (sorted)."""
+        return sorted(set().union(*(r.facts for r in self.rules_for(artifact_type, target))))
+
+    def evaluate(
+        self,
+        ctx: ArtifactContext,
+        rule_ids: Optional[Set[str]] = None,
+        evidence: Optional[List[Tuple[FrozenSet[str], FrozenSet[str]]]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Evaluate applicable rules against an artifact.
+
+        Args:
+            ctx: Artifact context
+            rule_ids: Only evaluate these rules (None = all applicable)
+            evidence: If given, receives (evidence terms, rule content terms)
+                per violation
+
+        Returns:
+            (violation dicts, passed checks), both in rule order
+        """
+        violations: List[Dict[str, Any]] = []
+        passed_checks: List[str] = []
+        timings = []
+
+        for rule in self.rules_for(ctx.artifact_type, ctx.target):
+            if rule_ids is not None and rule.id not in rule_ids:
+                continue
+            start = time.perf_counter()
+            rule_violations, passed = rule.evaluate(ctx, evidence)
+            timings.append((rule.id, time.perf_counter() - start, len(rule_violations)))
+            violations.extend(rule_violations)
+            if passed is not None:
+                passed_checks.append(passed)
+
+        with self._lock:
+            for rule_id, seconds, violation_count in timings:
+                stats = self._stats[rule_id]
+                stats.evaluations += 1
+                stats.violations += violation_count
+                stats.total_seconds += seconds
+                stats.max_seconds = max(stats.max_seconds, seconds)
+
+        return violations, passed_checks
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-rule statistics, most expensive first.
+
+        Returns:
+            List of rule statistics dicts
+        """
+        with self._lock:
+            entries = [stats.to_dict() for stats in self._stats.values()]
+        return sorted(entries, key=lambda e: e['total_seconds'], reverse=True)
+
+    def reset_stats(self) -> None:
+        """Zero all rule statistics."""
+        with self._lock:
+            self._stats = {rule.id: RuleStats(rule) for rule in self.rules}